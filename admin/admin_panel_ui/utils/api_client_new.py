@@ -5,18 +5,27 @@ import time
 class APIClient:
     def __init__(self):
         self.BASE_URL = "http://127.0.0.1:8443"
+        # url -> (etag, json) of GET responses that carried an ETag (e.g. results)
+        self._etag_cache = {}
     
     def api_request(self, method, endpoint, data=None):
         """Helper for API requests with error handling"""
         try:
             url = f"{self.BASE_URL}{endpoint}"
             if method == "GET":
-                response = requests.get(url, timeout=8)
+                cached = self._etag_cache.get(url)
+                headers = {"If-None-Match": cached[0]} if cached else None
+                response = requests.get(url, timeout=8, headers=headers)
+                if response.status_code == 304 and cached:
+                    return True, cached[1]
             else:
                 response = requests.post(url, json=data, timeout=10)
 
             response.raise_for_status()
-            return True, response.json()
+            result = response.json()
+            if method == "GET" and response.headers.get("ETag"):
+                self._etag_cache[url] = (response.headers["ETag"], result)
+            return True, result
         except requests.exceptions.ConnectionError as e:
             # Connection refused / server not running
             friendly = (
@@ -7,6 +7,7 @@ from tkinter import ttk, messagebox, Frame, Label, Entry, Button, Labelframe
 from datetime import datetime, timedelta
 import requests
 import json
+import os
 
 class AdminPanelApp:
     def __init__(self, root):
@@ -248,23 +249,31 @@ class AdminPanelApp:
             messagebox.showerror("Error", str(response))
 
     def export_proof(self):
-        """Export election proof bundle"""
+        """Export election proof bundle for offline auditing (python -m auditor.cli FILE)"""
         election_id = self.get_selected_election_id()
         if not election_id:
             return
 
-        success, response = self.api_request("GET", f"/elections/{election_id}/proof")
-        if success:
-            # Save proof bundle to file
-            filename = f"proof_bundle_{election_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            try:
-                with open(filename, 'w') as f:
-                    json.dump(response, f, indent=2)
-                messagebox.showinfo("Success", f"Proof bundle saved to {filename}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to save file: {e}")
-        else:
-            messagebox.showerror("Error", str(response))
+        # Stream the (gzip-compressed) bundle straight to disk instead of loading it all
+        filename = f"proof_bundle_{election_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.ndjson"
+        partial = filename + ".part"
+        try:
+            with requests.get(f"{self.API_BASE}/elections/{election_id}/proof-bundle", stream=True) as response:
+                response.raise_for_status()
+                with open(partial, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        f.write(chunk)
+            os.replace(partial, filename)
+        except requests.RequestException as e:
+            messagebox.showerror("Error", str(e))
+            return
+        except OSError as e:
+            messagebox.showerror("Error", f"Failed to save file: {e}")
+            return
+        finally:
+            if os.path.exists(partial):
+                os.remove(partial)
+        messagebox.showinfo("Success", f"Proof bundle saved to {filename}")
 
     # ===========================
     # TAB 3: VOTER MANAGEMENT
@@ -0,0 +1 @@
+# auditor package: read-only followers and offline verification of BallotGuard ledgers
@@ -0,0 +1,354 @@
+"""
+Offline verification of a proof bundle (GET /elections/<id>/proof-bundle).
+
+A bundle is NDJSON: a header line, then sections, each announced by a
+{"section": name, "count": n} line followed by n records:
+
+    header       election_id, paillier_n, ledger_public_key, ledger_signature_alg,
+                 election_salt, checkpoint_interval
+    checkpoints  signed Merkle checkpoints (see merkle_checkpoint.py)
+    blocks       ledger blocks, exactly the lines of ledger.jsonl
+    ballots      ledger_index, block_position, ciphertext (no candidate_id)
+    tally        candidate_id, ballots, encrypted_sum, encoding, witness, votes
+
+audit() reads the bundle once, as a stream, and hands blocks and ballots to
+worker processes in chunks (raw lines, parsed in the workers):
+
+- chain: every block's header hash and its link to the previous block
+  (verify_engine.check_segment per chunk, stitched in order)
+- checkpoints: Merkle roots recomputed from the blocks, last hashes and
+  signatures checked with the ledger public key
+- ballots: vote_hash = sha256(ciphertext + salt) must be the block's vote_hash
+  (one-vote blocks) or a leaf of its Merkle root (multi-vote blocks)
+- aggregate: each published decryption must check out against its witness
+  with the public key alone (paillier_fast.verify_decryption), and the
+  candidates' encrypted sums must multiply to the homomorphic product of all
+  ballots, with their ballot counts adding up to the ballots published
+
+The aggregate check is a turnout check: ballots are not labelled with a
+candidate, so it shows that no ballot was added, dropped or altered on the
+way to the published sums, but not that each ballot went to the right sum.
+Votes moved between candidates pass it. The per-candidate split is reported
+as claimed_tally, the server's claim, and is not verified.
+
+Only 32 bytes per block are kept in memory (the vote_hash digest), so a
+million-ballot bundle is audited in bounded memory.
+"""
+
+import base64
+import collections
+import gzip
+import hashlib
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from server_backend.blockchain import merkle
+from server_backend.blockchain.merkle_checkpoint import signed_payload
+from server_backend.blockchain.verify_engine import check_segment, stitch
+from server_backend.crypto import paillier_fast, signers
+
+DEFAULT_CHUNK = 20000
+_LEDGER_INDEX = re.compile(rb'"ledger_index":\s*(-?\d+|null)')
+_EMPTY_DIGEST = bytes(32)
+
+
+class BundleError(ValueError):
+    """The file is not a well-formed proof bundle."""
+
+
+def open_bundle(path):
+    with open(path, "rb") as f:
+        gzipped = f.read(2) == b"\x1f\x8b"
+    return gzip.open(path, "rb") if gzipped else open(path, "rb")
+
+
+def _ledger_index(line):
+    match = _LEDGER_INDEX.search(line)
+    if match is None:
+        raise BundleError(f"record without ledger_index: {line[:80]!r}")
+    return None if match.group(1) == b"null" else int(match.group(1))
+
+
+def _digest(vote_hash):
+    """32-byte form of a hex vote_hash, or None if it is not one (e.g. tampered)."""
+    if isinstance(vote_hash, str) and len(vote_hash) == 64:
+        try:
+            return bytes.fromhex(vote_hash)
+        except ValueError:
+            return None
+    return None
+
+
+def check_block_chunk(lines, wanted):
+    """
+    Worker: parse and rehash one chunk of block lines.
+
+    Returns (segment result for stitch(), vote_hash digests, vote_hashes that
+    are not 64-hex {index: value}, and {index: hash} for `wanted` indexes).
+    """
+    rows, digests, odd, hashes = [], bytearray(), {}, {}
+    wanted = set(wanted)
+    for line in lines:
+        block = json.loads(line)
+        index = block["ledger_index"]
+        rows.append((index, block["ts"], block["vote_hash"], block["prev_hash"], block["hash"]))
+        digest = _digest(block["vote_hash"])
+        if digest is None:
+            odd[index] = block["vote_hash"]
+            digest = _EMPTY_DIGEST
+        digests += digest
+        if index in wanted:
+            hashes[index] = block["hash"]
+    return check_segment(rows), bytes(digests), odd, hashes
+
+
+def check_ballot_chunk(lines, salt, n, first_index, block_digests, block_odd):
+    """
+    Worker: recompute the vote_hash of one chunk of ballots (whole blocks
+    only), match them to their blocks and multiply the ciphertexts. Returns
+    (bad ledger indexes, product or None, blocks covered, ballots).
+    """
+    nsquare = n * n
+    product = None
+    by_block = collections.OrderedDict()
+    count = 0
+    for line in lines:
+        ballot = json.loads(line)
+        count += 1
+        ciphertext = ballot["ciphertext"]
+        vote_hash = hashlib.sha256(f"{ciphertext}{salt}".encode()).hexdigest()
+        by_block.setdefault(ballot["ledger_index"], []).append((ballot["block_position"], vote_hash))
+        value = paillier_fast.parse_ciphertext(ciphertext)
+        if value is not None:
+            product = value % nsquare if product is None else (product * value) % nsquare
+
+    def block_vote_hash(index):
+        if index in block_odd:
+            return block_odd[index]
+        offset = (index - first_index) * 32
+        digest = block_digests[offset:offset + 32]
+        return digest.hex() if len(digest) == 32 else None
+
+    bad = []
+    for index, leaves in by_block.items():
+        expected = block_vote_hash(index) if index is not None else None
+        if expected is None:
+            bad.append(index)
+        elif leaves[0][0] is None:
+            if len(leaves) != 1 or leaves[0][1] != expected:
+                bad.append(index)
+        elif merkle.merkle_root([v for _, v in sorted(leaves)]) != expected:
+            bad.append(index)
+    return bad, int(product) if product is not None else None, len(by_block), count
+
+
+def _verifier(header):
+    """verify(payload, signature) for the bundle's ledger signature algorithm, or None if it has none."""
+    alg = header.get("ledger_signature_alg")
+    if alg in signers.SUITES and header.get("ledger_public_key"):
+        verifier = signers.public_verifier(alg, header["ledger_public_key"])
+
+        def verify(payload, signature):
+            try:
+                return verifier(payload, base64.b64decode(signature or ""))
+            except (ValueError, TypeError):
+                return False
+        return verify
+    if alg == "SHA256-DIGEST":
+        return lambda payload, signature: signature == base64.b64encode(hashlib.sha256(payload).digest()).decode()
+    return None
+
+
+class _OrderedPool:
+    """Run tasks in worker processes (or inline with one worker), results in submission order, bounded in flight."""
+
+    def __init__(self, workers):
+        self.workers = workers
+        self.executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        self.pending = collections.deque()
+
+    def submit(self, fn, *args):
+        if self.executor is None:
+            self.pending.append(_Done(fn(*args)))
+        else:
+            self.pending.append(self.executor.submit(fn, *args))
+        if len(self.pending) > 2 * self.workers:
+            return [self.pending.popleft().result()]
+        return []
+
+    def drain(self):
+        results = [f.result() for f in self.pending]
+        self.pending.clear()
+        return results
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+
+
+class _Done:
+    def __init__(self, value):
+        self.value = value
+
+    def result(self):
+        return self.value
+
+
+def _sections(stream):
+    """Yield (name, count, line iterator) for each section after the header."""
+    for line in stream:
+        if not line.strip():
+            continue
+        marker = json.loads(line)
+        if "section" not in marker:
+            raise BundleError(f"expected a section line, got {line[:80]!r}")
+        remaining = marker["count"]
+
+        def records():
+            nonlocal remaining
+            while remaining > 0:
+                record = stream.readline()
+                if not record:
+                    raise BundleError(f"bundle ends inside section {marker['section']}")
+                remaining -= 1
+                yield record
+        yield marker["section"], marker["count"], records()
+        for _ in records():
+            pass  # skip whatever the caller did not read
+
+
+def _chunks(records, size, whole_blocks=False):
+    """Lists of `size` lines; with whole_blocks the cut never splits one ledger_index."""
+    chunk = []
+    for line in records:
+        if whole_blocks and len(chunk) >= size and _ledger_index(line) != _ledger_index(chunk[-1]):
+            yield chunk
+            chunk = []
+        elif not whole_blocks and len(chunk) >= size:
+            yield chunk
+            chunk = []
+        chunk.append(line)
+    if chunk:
+        yield chunk
+
+
+def audit(path, workers=None, chunk_size=DEFAULT_CHUNK):
+    """Verify the proof bundle at `path`; returns a report dict (report["valid"] is the verdict)."""
+    workers = workers or os.cpu_count() or 1
+    started = time.perf_counter()
+    timings = {}
+    with open_bundle(path) as stream:
+        header = json.loads(stream.readline() or b"{}")
+        if header.get("bundle") != "ballotguard-proof":
+            raise BundleError("not a BallotGuard proof bundle")
+        n = int(header["paillier_n"])
+        salt = header.get("election_salt") or ""
+        verify_signature = _verifier(header)
+        report = {"election_id": header.get("election_id"), "workers": workers, "signatures_checked": verify_signature is not None}
+        checkpoints = []
+        digests, odd = bytearray(), {}
+        end_hashes = {}
+        segments = []
+        ballot_bad, ballot_product, ballot_blocks, ballot_count = [], None, 0, 0
+        tally = []
+        pool = _OrderedPool(workers)
+        try:
+            for name, count, records in _sections(stream):
+                section_start = time.perf_counter()
+                if name == "checkpoints":
+                    checkpoints = [json.loads(r) for r in records]
+                elif name == "blocks":
+                    wanted = sorted({cp["end_index"] for cp in checkpoints})
+
+                    def absorb(result):
+                        segment, chunk_digests, chunk_odd, hashes = result
+                        segments.append(segment)
+                        digests.extend(chunk_digests)
+                        odd.update(chunk_odd)
+                        end_hashes.update(hashes)
+
+                    for chunk in _chunks(records, chunk_size):
+                        lo, hi = _ledger_index(chunk[0]), _ledger_index(chunk[-1])
+                        for result in pool.submit(check_block_chunk, chunk, [i for i in wanted if lo <= i <= hi]):
+                            absorb(result)
+                    for result in pool.drain():
+                        absorb(result)
+                elif name == "ballots":
+                    def absorb_ballots(result):
+                        nonlocal ballot_product, ballot_blocks, ballot_count
+                        bad, product, blocks_covered, chunk_count = result
+                        ballot_bad.extend(bad)
+                        ballot_blocks += blocks_covered
+                        ballot_count += chunk_count
+                        if product is not None:
+                            ballot_product = product if ballot_product is None else (ballot_product * product) % (n * n)
+
+                    for chunk in _chunks(records, chunk_size, whole_blocks=True):
+                        # Ballots not linked to a block (ledger_index null) sort first
+                        hi = _ledger_index(chunk[-1])
+                        lo = next((i for i in map(_ledger_index, chunk) if i is not None), None)
+                        lo, hi = (lo, hi) if hi is not None else (0, -1)
+                        block_odd = {i: v for i, v in odd.items() if lo <= i <= hi}
+                        args = (chunk, salt, n, lo, bytes(digests[lo * 32:(hi + 1) * 32]), block_odd)
+                        for result in pool.submit(check_ballot_chunk, *args):
+                            absorb_ballots(result)
+                    for result in pool.drain():
+                        absorb_ballots(result)
+                elif name == "tally":
+                    tally = [json.loads(r) for r in records]
+                timings[name] = (count, time.perf_counter() - section_start)
+        finally:
+            pool.close()
+
+    invalid_blocks, total_blocks, _ = stitch(segments)
+    report["chain"] = {"blocks": total_blocks, "invalid": invalid_blocks}
+
+    def leaf(index):
+        return odd.get(index) or digests[index * 32:(index + 1) * 32].hex()
+
+    bad_checkpoints = []
+    for cp in checkpoints:
+        ok = (0 <= cp["start_index"] <= cp["end_index"] < total_blocks
+              and merkle.merkle_root([leaf(i) for i in range(cp["start_index"], cp["end_index"] + 1)]) == cp["merkle_root"]
+              and end_hashes.get(cp["end_index"]) == cp["last_hash"]
+              and (verify_signature is None or verify_signature(signed_payload(cp), cp["signature"])))
+        if not ok:
+            bad_checkpoints.append(cp["start_index"])
+    report["checkpoints"] = {"count": len(checkpoints), "invalid": bad_checkpoints}
+
+    report["ballots"] = {"count": ballot_count, "invalid_blocks": sorted(i for i in ballot_bad if i is not None),
+                         "unlinked": sum(1 for i in ballot_bad if i is None),
+                         "blocks_without_ballots": max(total_blocks - ballot_blocks, 0)}
+
+    bad_tally = []
+    sums_product, sums_ballots = None, 0
+    for record in tally:
+        encrypted_sum = int(record["encrypted_sum"]) if record["encrypted_sum"] is not None else None
+        sums_ballots += record["ballots"]
+        # A candidate with ballots must have a sum, and one without ballots must not
+        ok = (encrypted_sum is None) == (record["ballots"] == 0)
+        if ok and encrypted_sum is not None:
+            sums_product = encrypted_sum if sums_product is None else (sums_product * encrypted_sum) % (n * n)
+            encoding = int(record["encoding"])
+            ok = paillier_fast.verify_decryption(n, encrypted_sum, encoding, int(record["witness"]))
+            if ok and record["votes"] is not None:
+                try:
+                    ok = paillier_fast.RawPaillier(n).decode(encoding) == record["votes"]
+                except (ValueError, OverflowError):
+                    ok = False
+        if not ok:
+            bad_tally.append(record["candidate_id"])
+    ballots_match = sums_ballots == ballot_count and sums_product == ballot_product
+    report["aggregate"] = {"invalid": bad_tally, "ballots_match": ballots_match}
+    report["claimed_tally"] = {t["candidate_id"]: t["votes"] for t in tally}
+
+    elapsed = time.perf_counter() - started
+    report["seconds"] = elapsed
+    report["throughput"] = {name: count / seconds if seconds > 0 else None for name, (count, seconds) in timings.items()
+                            if name in ("blocks", "ballots")}
+    report["valid"] = not (invalid_blocks or bad_checkpoints or ballot_bad
+                           or report["ballots"]["blocks_without_ballots"] or bad_tally or not ballots_match)
+    return report
@@ -0,0 +1,83 @@
+"""
+Audit a proof bundle offline, without access to the server.
+
+    curl -o bundle.ndjson.gz -H 'Accept-Encoding: gzip' http://127.0.0.1:8443/elections/EL-2025-01/proof-bundle
+    python -m auditor.cli bundle.ndjson.gz [--workers 8] [--json]
+
+Exits 0 if every check passes, 1 if any fails and 2 if the file cannot be read.
+"""
+
+import argparse
+import json
+import sys
+
+from auditor.bundle import DEFAULT_CHUNK, BundleError, audit
+
+SHOW_INDICES = 10
+
+
+def _indices(values):
+    shown = ", ".join(str(v) for v in values[:SHOW_INDICES])
+    return shown + (f" ... (+{len(values) - SHOW_INDICES} more)" if len(values) > SHOW_INDICES else "")
+
+
+def print_report(report):
+    def line(ok, label, detail):
+        print(f"  [{'OK' if ok else 'FAIL'}] {label:<12} {detail}")
+
+    rates = report["throughput"]
+    chain = report["chain"]
+    print(f"Election {report['election_id']} ({report['workers']} worker(s), {report['seconds']:.2f}s)")
+    detail = f"{chain['blocks']:,} blocks"
+    if rates.get("blocks"):
+        detail += f", {rates['blocks']:,.0f} blocks/s"
+    line(not chain["invalid"], "chain", detail + (f"; invalid: {_indices(chain['invalid'])}" if chain["invalid"] else ""))
+    checkpoints = report["checkpoints"]
+    line(not checkpoints["invalid"], "checkpoints", f"{checkpoints['count']:,} signed"
+         + (f"; invalid: {_indices(checkpoints['invalid'])}" if checkpoints["invalid"] else ""))
+    ballots = report["ballots"]
+    ok = not (ballots["invalid_blocks"] or ballots["unlinked"] or ballots["blocks_without_ballots"])
+    detail = f"{ballots['count']:,} ballots"
+    if rates.get("ballots"):
+        detail += f", {rates['ballots']:,.0f} ballots/s"
+    if ballots["invalid_blocks"]:
+        detail += f"; blocks not matching their ballots: {_indices(ballots['invalid_blocks'])}"
+    if ballots["unlinked"]:
+        detail += f"; {ballots['unlinked']} not on the ledger"
+    if ballots["blocks_without_ballots"]:
+        detail += f"; {ballots['blocks_without_ballots']} blocks without ballots"
+    line(ok, "ballots", detail)
+    aggregate = report["aggregate"]
+    detail = "encrypted sums match the ballots" if aggregate["ballots_match"] else "encrypted sums do not match the ballots"
+    if aggregate["invalid"]:
+        detail += f"; decryptions not matching their witness: {_indices(aggregate['invalid'])}"
+    line(not aggregate["invalid"] and aggregate["ballots_match"], "aggregate", detail)
+    claimed = ", ".join(f"{cid}: {votes}" for cid, votes in report["claimed_tally"].items())
+    print(f"  Per-candidate tally as claimed by the server (not verified): {claimed}")
+    if not report["signatures_checked"]:
+        print("  (bundle has no ledger public key; signatures were not checked)")
+    print("VALID" if report["valid"] else "INVALID")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Verify a BallotGuard proof bundle offline")
+    parser.add_argument("bundle", help="file from GET /elections/<id>/proof-bundle (plain or gzip)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunk", type=int, default=DEFAULT_CHUNK, help="records per worker task")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        report = audit(args.bundle, workers=args.workers, chunk_size=args.chunk)
+    except (OSError, BundleError, ValueError, KeyError) as e:
+        print(f"Error: cannot read bundle: {e}", file=sys.stderr)
+        return 2
+    if args.json:
+        print(json.dumps(report, indent=2, default=str))
+    else:
+        print_report(report)
+    return 0 if report["valid"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
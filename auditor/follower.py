@@ -0,0 +1,199 @@
+"""
+Read-only ledger follower for auditors.
+
+Keeps a local SQLite replica of one election's ledger in sync with the
+server's /elections/<id>/feed and verifies each block as it arrives: its
+header hash and the link to the previous block, continuing from the last
+hash already verified, so no block is ever rehashed twice. Run as
+many followers as there are auditors; the ingest server only streams bytes
+from its ledger file to them.
+
+    python -m auditor.follower --server http://127.0.0.1:8443 --election EL-2025-01 --replica replica.db [--sse]
+
+Invalid blocks are stored with valid=0 and reported; following continues so
+the replica stays a faithful copy of what the server published. If the
+server's tip goes below the replica's (an election reset) the replica is
+cleared and rebuilt.
+"""
+
+import argparse
+import json
+import sqlite3
+import time
+
+from server_backend.blockchain.verify_engine import GENESIS_HASH, check_segment
+
+
+class Follower:
+    def __init__(self, replica_path, election_id):
+        self.election_id = election_id
+        self.conn = sqlite3.connect(replica_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute('''CREATE TABLE IF NOT EXISTS replica_blocks (
+            ledger_index INTEGER PRIMARY KEY,
+            vote_hash TEXT,
+            prev_hash TEXT,
+            hash TEXT,
+            ts REAL,
+            valid INTEGER
+        )''')
+        self.conn.execute("CREATE TABLE IF NOT EXISTS replica_state (key TEXT PRIMARY KEY, value TEXT)")
+        state = dict(self.conn.execute("SELECT key, value FROM replica_state"))
+        if state.get("election_id", election_id) != election_id:
+            raise ValueError(f"replica belongs to election {state['election_id']}, not {election_id}")
+        self.last_index = int(state.get("last_index", -1))
+        self.last_hash = state.get("last_hash", GENESIS_HASH)
+        self.verified = 0
+
+    def _save_state(self):
+        self.conn.executemany("INSERT OR REPLACE INTO replica_state (key, value) VALUES (?, ?)",
+                              [("election_id", self.election_id), ("last_index", str(self.last_index)),
+                               ("last_hash", self.last_hash)])
+
+    def apply(self, blocks):
+        """Verify and store the next blocks (ledger order, starting at last_index + 1); returns invalid indexes.
+
+        Blocks already held (e.g. replayed by an SSE reconnect) are skipped; a gap raises ValueError.
+        """
+        blocks = [b for b in blocks if b["ledger_index"] > self.last_index]
+        if not blocks:
+            return []
+        if blocks[0]["ledger_index"] != self.last_index + 1:
+            raise ValueError(f"expected block {self.last_index + 1}, got {blocks[0]['ledger_index']}")
+        rows = [(b["ledger_index"], b["ts"], b["vote_hash"], b["prev_hash"], b["hash"]) for b in blocks]
+        first_index, first_prev, last_hash, invalid, count = check_segment(rows)
+        invalid = set(invalid)
+        if first_prev != self.last_hash:
+            invalid.add(first_index)
+        with self.conn:
+            self.conn.executemany("""INSERT INTO replica_blocks (ledger_index, vote_hash, prev_hash, hash, ts, valid)
+                                     VALUES (?, ?, ?, ?, ?, ?)""",
+                                  [(r[0], r[2], r[3], r[4], r[1], int(r[0] not in invalid)) for r in rows])
+            self.last_hash = last_hash
+            self.last_index = rows[-1][0]
+            self._save_state()
+        self.verified += count
+        return sorted(invalid)
+
+    def reset(self):
+        with self.conn:
+            self.conn.execute("DELETE FROM replica_blocks")
+            self.last_index = -1
+            self.last_hash = GENESIS_HASH
+            self._save_state()
+
+    def invalid_indices(self):
+        return [r[0] for r in self.conn.execute("SELECT ledger_index FROM replica_blocks WHERE valid=0 ORDER BY ledger_index")]
+
+    def handle_page(self, page):
+        """Apply one long-poll response; returns invalid indexes (a lower tip_index resets the replica)."""
+        if page["tip_index"] < self.last_index:
+            self.reset()
+            return []
+        return self.apply(page["blocks"])
+
+    def close(self):
+        self.conn.close()
+
+
+class SSEParser:
+    """Incremental text/event-stream parser: feed() text as it arrives, get complete events back."""
+
+    def __init__(self):
+        self._buffer = ""
+
+    def feed(self, text):
+        self._buffer += text.replace("\r\n", "\n")
+        *complete, self._buffer = self._buffer.split("\n\n")
+        events = []
+        for raw in complete:
+            event = {"event": "message", "id": None, "data": []}
+            for line in raw.split("\n"):
+                if not line or line.startswith(":"):
+                    continue
+                field, _, value = line.partition(":")
+                value = value[1:] if value.startswith(" ") else value
+                if field == "data":
+                    event["data"].append(value)
+                elif field in ("event", "id"):
+                    event[field] = value
+            if event["data"]:
+                events.append((event["event"], event["id"], "\n".join(event["data"])))
+        return events
+
+
+def handle_events(follower, events):
+    """Apply one chunk of SSE events; returns (invalid indexes, whether the stream announced a reset)."""
+    blocks = [json.loads(data) for event, _, data in events if event == "block"]
+    invalid = follower.apply(blocks)
+    if any(event == "reset" for event, _, _ in events):
+        follower.reset()
+        return invalid, True
+    return invalid, False
+
+
+def follow_long_poll(follower, session, base_url, wait=25, limit=1000, report=print):
+    url = f"{base_url}/elections/{follower.election_id}/feed"
+    while True:
+        response = session.get(url, params={"after_index": follower.last_index, "wait": wait, "limit": limit},
+                               timeout=wait + 10)
+        response.raise_for_status()
+        page = response.json()
+        report(follower, follower.handle_page(page))
+
+
+def follow_sse(follower, session, base_url, report=print):
+    url = f"{base_url}/elections/{follower.election_id}/feed"
+    while True:
+        # Each stream ends after a while on the server; reconnect from where the replica is
+        headers = {"Accept": "text/event-stream", "Last-Event-ID": str(follower.last_index)}
+        with session.get(url, headers=headers, stream=True, timeout=60) as response:
+            response.raise_for_status()
+            response.encoding = "utf-8"
+            parser = SSEParser()
+            for chunk in response.iter_content(chunk_size=None, decode_unicode=True):
+                invalid, was_reset = handle_events(follower, parser.feed(chunk))
+                report(follower, invalid)
+                if was_reset:
+                    break
+
+
+def main():
+    # Only the command line needs HTTP; Follower and the parsers work on any transport
+    import requests
+
+    parser = argparse.ArgumentParser(description="Follow and verify an election's ledger from a BallotGuard server")
+    parser.add_argument("--server", default="http://127.0.0.1:8443")
+    parser.add_argument("--election", required=True)
+    parser.add_argument("--replica", required=True, help="local SQLite replica (created if missing)")
+    parser.add_argument("--sse", action="store_true", help="use server-sent events instead of long polling")
+    parser.add_argument("--wait", type=int, default=25, help="long-poll wait in seconds")
+    args = parser.parse_args()
+
+    follower = Follower(args.replica, args.election)
+    started, start_count = time.monotonic(), follower.verified
+    reported = [None]
+
+    def report(follower, invalid):
+        if follower.last_index == reported[0] and not invalid:
+            return
+        reported[0] = follower.last_index
+        rate = (follower.verified - start_count) / max(time.monotonic() - started, 1e-9)
+        print(f"block #{follower.last_index}: {follower.verified:,} verified ({rate:,.0f} blocks/s)"
+              + (f", INVALID {invalid}" if invalid else ""))
+
+    session = requests.Session()
+    try:
+        if args.sse:
+            follow_sse(follower, session, args.server.rstrip("/"), report)
+        else:
+            follow_long_poll(follower, session, args.server.rstrip("/"), args.wait, report=report)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"stopped at block #{follower.last_index}; invalid blocks: {follower.invalid_indices()}")
+        follower.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Offline audit of a proof bundle: export time, bundle size and audit
+throughput with one worker vs a process pool.
+
+A synthetic election of --ballots real Paillier ballots (a pool of
+encryptions reused, so setup stays fast) is written straight into a scratch
+database: one ballot per block, signed checkpoints every CHECKPOINT_INTERVAL
+blocks, exactly what the server would have stored.
+
+    python benchmarks/bench_auditor.py [--ballots 200000] [--workers 4]
+"""
+
+import argparse
+import hashlib
+import os
+import time
+
+import bench_utils
+from bench_incremental_verify import timed
+from auditor.bundle import audit
+from phe import paillier
+from server_backend.blockchain import merkle_checkpoint
+from server_backend.blockchain.blockchain import Block
+
+POOL_SIZE = 64
+
+
+def build_election(server, election_id, ballots):
+    public_key = paillier.PaillierPublicKey(server.PAILLIER_N)
+    pool = [str(public_key.encrypt(1).ciphertext()) for _ in range(POOL_SIZE)]
+    salt = server.get_election_salt(election_id)
+    conn = server.get_db()
+    c = conn.cursor()
+    prev_hash, start = "GENESIS", time.time()
+    votes, blocks = [], []
+    for i in range(ballots):
+        ciphertext = pool[i % POOL_SIZE]
+        vote_hash = hashlib.sha256(f"{ciphertext}{salt}".encode()).hexdigest()
+        block = Block(i, start + i, vote_hash, prev_hash)
+        blocks.append((election_id, i, vote_hash, prev_hash, block.hash, block.timestamp))
+        votes.append((f"V-{i}", election_id, f"C{i % 3 + 1}", ciphertext, i, block.timestamp, block.hash))
+        prev_hash = block.hash
+    c.executemany("INSERT INTO ledger_blocks (election_id, ledger_index, vote_hash, prev_hash, hash, ts) VALUES (?, ?, ?, ?, ?, ?)", blocks)
+    c.executemany("INSERT INTO encrypted_votes (vote_id, election_id, candidate_id, ciphertext, ledger_index, ts, block_hash) VALUES (?, ?, ?, ?, ?, ?, ?)", votes)
+    interval = server.CHECKPOINT_INTERVAL
+    for end in range(interval - 1, ballots, interval):
+        merkle_checkpoint.create(c, election_id, end - interval + 1, end, blocks[end][4], start + end, server.sign_ledger_bytes)
+    conn.commit()
+    conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ballots", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    server = bench_utils.load_server()
+    election_id = bench_utils.ELECTION_ID
+    _, build_s = timed(lambda: build_election(server, election_id, args.ballots))
+    print(f"{args.ballots:,} ballots written in {build_s:.1f}s")
+
+    path = bench_utils.scratch_path("bundle.ndjson.gz")
+    client = server.app.test_client()
+
+    def export():
+        with open(path, "wb") as f:
+            response = client.get(f"/elections/{election_id}/proof-bundle", headers={"Accept-Encoding": "gzip"},
+                                  buffered=False)
+            for chunk in response.response:
+                f.write(chunk)
+
+    _, export_s = timed(export)
+    print(f"  {'export (gzip)':<24} {export_s:8.2f} s  {os.path.getsize(path) / 2**20:,.1f} MiB")
+    for workers in sorted({1, args.workers}):
+        report, audit_s = timed(lambda: audit(path, workers=workers))
+        assert report["valid"], report
+        print(f"  {f'audit, {workers} worker(s)':<24} {audit_s:8.2f} s  {args.ballots / audit_s:,.0f} ballots/s  "
+              f"(blocks {report['throughput']['blocks']:,.0f}/s, ballots {report['throughput']['ballots']:,.0f}/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Block header hashing: json.dumps(sort_keys=True) (the old Block.compute_hash)
+vs the template encoder in server_backend/blockchain/header_codec.py, and the
+compact v2 binary header.
+
+    python benchmarks/bench_block_hash.py [--blocks 500000]
+"""
+
+import argparse
+import hashlib
+import json
+import time
+
+import bench_utils  # noqa: F401  (puts the repo root on sys.path)
+from server_backend.blockchain import header_codec
+from server_backend.blockchain.blockchain import Block
+
+
+def json_hash(index, timestamp, vote_hash, previous_hash):
+    return hashlib.sha256(json.dumps({
+        "index": index,
+        "timestamp": timestamp,
+        "vote_hash": vote_hash,
+        "previous_hash": previous_hash
+    }, sort_keys=True).encode()).hexdigest()
+
+
+def v2_hash(index, timestamp, vote_hash, previous_hash):
+    return header_codec.block_hash(index, timestamp, vote_hash, previous_hash, header_codec.HEADER_V2_BINARY)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--blocks", type=int, default=500_000)
+    args = parser.parse_args()
+
+    start = time.time()
+    headers = [(i, start + i * 0.0137, "%064x" % (i * 7919), "%064x" % (i * 104729)) for i in range(args.blocks)]
+    assert all(json_hash(*h) == header_codec.block_hash(*h) for h in headers[:10000])
+
+    baseline = None
+    for label, fn in [("json.dumps (old)", json_hash),
+                      ("header_codec v1", header_codec.block_hash),
+                      ("Block(...).hash (v1)", lambda *h: Block(*h).hash),
+                      ("header_codec v2 binary", v2_hash)]:
+        t0 = time.perf_counter()
+        for h in headers:
+            fn(*h)
+        elapsed = time.perf_counter() - t0
+        baseline = baseline or elapsed
+        print(f"  {label:<24} {args.blocks / elapsed:12,.0f} hashes/s  x{baseline / elapsed:.2f}")
+
+
+if __name__ == "__main__":
+    main()
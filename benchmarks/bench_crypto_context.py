@@ -0,0 +1,79 @@
+"""
+Startup and per-request cost of the server's key handling: generating RSA
+keys at import and rebuilding key objects per request (the old behaviour) vs
+the shared crypto context that parses everything once.
+
+    python benchmarks/bench_crypto_context.py [--requests 200]
+"""
+
+import argparse
+import base64
+import json
+import subprocess
+import sys
+import time
+
+import bench_utils
+from Crypto.Hash import SHA256
+from Crypto.PublicKey import RSA
+from Crypto.Signature import pss
+from phe import paillier
+
+from server_backend.crypto import context
+
+
+def timed(fn, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return result, (time.perf_counter() - start) / repeat
+
+
+def import_time(stmt):
+    cmd = [sys.executable, "-c", f"import sys, time; sys.path.insert(0, {bench_utils.ROOT_DIR!r}); "
+           f"t = time.perf_counter(); {stmt}; print(time.perf_counter() - t)"]
+    return float(subprocess.run(cmd, capture_output=True, text=True, check=True).stdout.split()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+    ctx = context.get_context()
+    with open(f"{context.DEFAULT_KEYS_DIR}/receipt_private.pem") as f:
+        receipt_pem = f.read()
+    payload = b'{"block_hash":"00","election_id":"EL-2025-01","ledger_index":1,"vote_id":"v"}'
+    with open(f"{context.DEFAULT_KEYS_DIR}/paillier_private.json") as f:
+        factors = json.load(f)
+    p, q = factors["p"], factors["q"]
+    n = ctx.paillier.n
+    ciphertext = paillier.PaillierPublicKey(n).encrypt(3).ciphertext()
+
+    print("startup")
+    _, old_keys = timed(lambda: (RSA.generate(2048), RSA.generate(2048)))
+    print(f"  {'2x RSA.generate(2048) (old import)':<40} {old_keys * 1e3:9.1f} ms")
+    print(f"  {'import ovt + ledger_crypto (now)':<40} "
+          f"{import_time('import server_backend.crypto.ovt, server_backend.crypto.ledger_crypto') * 1e3:9.1f} ms")
+
+    print(f"per request (avg of {args.requests})")
+
+    def old_sign():
+        return base64.b64encode(pss.new(RSA.import_key(receipt_pem)).sign(SHA256.new(payload)))
+
+    def new_sign():
+        return base64.b64encode(ctx.receipt.sign(payload))
+
+    def old_decrypt():
+        public_key = paillier.PaillierPublicKey(n)
+        private_key = paillier.PaillierPrivateKey(public_key, p, q)
+        return private_key.decrypt(paillier.EncryptedNumber(public_key, ciphertext))
+
+    for label, fn in [("import PEM + sign receipt", old_sign), ("context sign receipt", new_sign),
+                      ("build phe keys + decrypt", old_decrypt),
+                      ("context decrypt", lambda: ctx.paillier.decrypt(ciphertext))]:
+        _, elapsed = timed(fn, args.requests)
+        print(f"  {label:<40} {elapsed * 1e3:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
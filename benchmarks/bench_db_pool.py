@@ -0,0 +1,75 @@
+"""
+Requests/sec on /votes and /elections with per-query sqlite3.connect()
+(the previous behaviour) versus the pooled, WAL-tuned connections.
+
+    python benchmarks/bench_db_pool.py [--votes 400] [--reads 2000] [--threads 8]
+"""
+
+import argparse
+import sqlite3
+
+from bench_utils import (load_server, scratch_path, seed_voters, issue_ovts,
+                         vote_payload, run_concurrent, print_row, init_schema)
+
+
+def legacy_get_db_factory(db_path):
+    def legacy_get_db():
+        conn = sqlite3.connect(db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+    return legacy_get_db
+
+
+def use_database(server, db_path, pooled):
+    """Point the already-imported server module at a fresh database file."""
+    if pooled:
+        server.DB_POOL = server.ConnectionPool(db_path)
+        server.get_db = lambda: server.DB_POOL.connect()
+    else:
+        conn = sqlite3.connect(db_path)
+        conn.execute("PRAGMA journal_mode=DELETE")
+        conn.close()
+        server.get_db = legacy_get_db_factory(db_path)
+    init_schema(server)
+
+
+def run(server, label, votes, reads, threads):
+    voter_ids = seed_voters(server, votes)
+    ovts = issue_ovts(server, voter_ids)
+    payloads = [vote_payload(ovt) for ovt in ovts]
+
+    def post_vote(client, payload):
+        resp = client.post("/votes", json=payload)
+        assert resp.status_code == 200, resp.get_json()
+
+    def get_elections(client, _):
+        resp = client.get("/elections")
+        assert resp.status_code == 200
+
+    elapsed, errors = run_concurrent(server, payloads, threads, post_vote)
+    print_row(f"{label} POST /votes", votes, elapsed)
+    if errors:
+        print(f"    {len(errors)} errors, first: {errors[0]}")
+    elapsed, errors = run_concurrent(server, list(range(reads)), threads, get_elections)
+    print_row(f"{label} GET /elections", reads, elapsed)
+    if errors:
+        print(f"    {len(errors)} errors, first: {errors[0]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--votes", type=int, default=400)
+    parser.add_argument("--reads", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    server = load_server()
+    print(f"threads={args.threads}")
+    use_database(server, scratch_path("before.db"), pooled=False)
+    run(server, "before (connect per query)", args.votes, args.reads, args.threads)
+    use_database(server, scratch_path("after.db"), pooled=True)
+    run(server, "after (pooled + WAL)", args.votes, args.reads, args.threads)
+
+
+if __name__ == "__main__":
+    main()
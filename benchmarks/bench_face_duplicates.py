@@ -0,0 +1,85 @@
+"""
+1:N duplicate-enrollment check: a Python loop over every template (what the
+_FallbackFaceRecog helpers do per comparison) vs FaceTemplateIndex.nearest(),
+then /voters/enroll with the check on, and the all-pairs admin scan.
+
+    python benchmarks/bench_face_duplicates.py [--sizes 100000,1000000] [--probes 50] [--loop-probes 3] [--enrolls 50] [--scan-size 100000]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import bench_utils
+from server_backend.db.face_index import FaceTemplateIndex
+
+
+def build_index(rng, size):
+    index = FaceTemplateIndex()
+    templates = (rng.standard_normal((size, 128)) * 0.1).astype(np.float32)
+    for i, template in enumerate(templates):
+        index.upsert(f"VOTER-{i:08d}", template, "active")
+    return index, templates
+
+
+def loop_nearest(templates, probe):
+    best, best_dist = None, float("inf")
+    for i, template in enumerate(templates):
+        dist = float(np.linalg.norm(template - probe))
+        if dist < best_dist:
+            best, best_dist = i, dist
+    return best, best_dist
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="100000,1000000")
+    parser.add_argument("--probes", type=int, default=50)
+    parser.add_argument("--loop-probes", type=int, default=3)
+    parser.add_argument("--enrolls", type=int, default=50)
+    parser.add_argument("--scan-size", type=int, default=100000)
+    args = parser.parse_args()
+
+    server = bench_utils.load_server()
+    client = server.app.test_client()
+    rng = np.random.default_rng(0)
+    for size in [int(s) for s in args.sizes.split(",")]:
+        start = time.perf_counter()
+        index, templates = build_index(rng, size)
+        print(f"{size} templates ({templates.nbytes / 2**20:.0f} MiB of float32), built in {time.perf_counter() - start:.1f}s")
+        probes = templates[rng.integers(0, size, args.probes)] + 0.01
+
+        start = time.perf_counter()
+        for probe in probes[:args.loop_probes]:
+            loop_nearest(templates, probe)
+        bench_utils.print_row("Python loop per probe", args.loop_probes, time.perf_counter() - start)
+        start = time.perf_counter()
+        for probe in probes:
+            assert index.nearest(probe)[1] < 0.2
+        bench_utils.print_row("FaceTemplateIndex.nearest", args.probes, time.perf_counter() - start)
+
+        server.FACE_INDEX = index
+        start = time.perf_counter()
+        for _ in range(args.enrolls):
+            resp = client.post("/voters/enroll", json={"name": "Bench", "face_encoding": (rng.standard_normal(128) * 0.1).tolist()})
+            assert resp.status_code == 201
+        bench_utils.print_row("/voters/enroll with 1:N check", args.enrolls, time.perf_counter() - start)
+        dup = client.post("/voters/enroll", json={"name": "Bench", "face_encoding": (templates[0] + 0.01).tolist()})
+        assert dup.status_code == 201 and dup.get_json()["duplicate_flagged"]
+        del index, templates
+        server.FACE_INDEX = FaceTemplateIndex()
+
+    if args.scan_size:
+        index, templates = build_index(rng, args.scan_size)
+        for i in range(10):
+            index.upsert(f"DUP-{i}", templates[i * 7] + 0.01, "pending")
+        start = time.perf_counter()
+        pairs = index.duplicate_pairs(server.FACE_DUPLICATE_TOLERANCE)
+        elapsed = time.perf_counter() - start
+        print(f"all-pairs scan of {len(index)} templates: {elapsed:.1f}s, {len(pairs)} pairs within "
+              f"{server.FACE_DUPLICATE_TOLERANCE} (10 planted)")
+
+
+if __name__ == "__main__":
+    main()
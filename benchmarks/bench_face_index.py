@@ -0,0 +1,72 @@
+"""
+/auth/face/verify template lookup: the voters row read and its face_encoding
+JSON parsed on every attempt (as verify_face used to) vs one row of the
+in-memory FACE_INDEX matrix, and the endpoint's throughput with the index.
+
+    python benchmarks/bench_face_index.py [--voters 20000] [--lookups 5000] [--threads 8]
+"""
+
+import argparse
+import json
+import time
+
+import numpy as np
+
+import bench_utils
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--voters", type=int, default=20000)
+    parser.add_argument("--lookups", type=int, default=5000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    server = bench_utils.load_server()
+    rng = np.random.default_rng(0)
+    voters = bench_utils.seed_voters(server, args.voters)
+    templates = (rng.standard_normal((args.voters, 128)) * 0.1).astype(np.float32)
+    conn = server.get_db()
+    conn.executemany("UPDATE voters SET face_encoding=? WHERE voter_id=?",
+                     [(json.dumps(t.tolist()), v) for v, t in zip(voters, templates)])
+    conn.commit()
+    conn.close()
+    start = time.perf_counter()
+    server.load_face_index()
+    print(f"{args.voters} voters, index loaded in {time.perf_counter() - start:.2f}s")
+
+    picks = rng.integers(0, args.voters, args.lookups)
+    probes = templates[picks] + 0.01
+
+    def per_request():
+        for i, probe in zip(picks, probes):
+            conn = server.get_db()
+            row = conn.execute("SELECT * FROM voters WHERE voter_id=?", (voters[i],)).fetchone()
+            conn.close()
+            stored = np.asarray(json.loads(row["face_encoding"]), dtype=float)
+            float(np.linalg.norm(stored - np.asarray(probe, dtype=float)))
+
+    def indexed():
+        for i, probe in zip(picks, probes):
+            server.voter_face_status(voters[i])
+            server.FACE_INDEX.distance(voters[i], probe)
+
+    for label, fn in (("row + json.loads per lookup", per_request), ("FACE_INDEX row", indexed)):
+        start = time.perf_counter()
+        fn()
+        bench_utils.print_row(label, args.lookups, time.perf_counter() - start)
+
+    jobs = [(voters[i], probe.tolist()) for i, probe in zip(picks, probes)]
+
+    def verify(client, job):
+        resp = client.post("/auth/face/verify", json={"voter_id": job[0], "election_id": bench_utils.ELECTION_ID,
+                                                      "face_encoding": job[1]})
+        assert resp.status_code == 200 and resp.get_json()["pass"]
+
+    elapsed, errors = bench_utils.run_concurrent(server, jobs, args.threads, verify)
+    assert not errors, errors[:1]
+    bench_utils.print_row(f"/auth/face/verify, {args.threads} threads", len(jobs), elapsed)
+
+
+if __name__ == "__main__":
+    main()
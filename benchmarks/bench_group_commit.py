@@ -0,0 +1,105 @@
+"""
+Votes/sec for one-transaction-per-ballot versus the group-commit writer at
+50 and 500 concurrent booths.
+
+Both modes use the same durability (PRAGMA synchronous, FULL by default) and
+call the server's commit_ballot() directly, so the numbers isolate the
+transaction/fsync cost from HTTP parsing and receipt signing. Point --db-dir
+at a real disk to see fsync latency; tmpfs hides most of it.
+
+    python benchmarks/bench_group_commit.py [--booths 50,500] [--votes-per-booth 10]
+"""
+
+import argparse
+import os
+import threading
+import time
+import uuid
+
+from bench_utils import load_server, scratch_path, init_schema, ELECTION_ID
+
+
+def prepare_ballots(server, count):
+    conn = server.get_db()
+    c = conn.cursor()
+    now = time.time()
+    ballots = []
+    for _ in range(count):
+        voter_id = f"VOTER-{uuid.uuid4().hex[:12].upper()}"
+        ovt_uuid = str(uuid.uuid4())
+        c.execute("INSERT INTO voter_election_status (election_id, voter_id, status, voted_flag, last_auth_ts) VALUES (?, ?, ?, ?, ?)",
+                  (ELECTION_ID, voter_id, "active", 0, None))
+        c.execute("INSERT INTO ovt_tokens (ovt_uuid, election_id, voter_id, status, expires_at, issued_ts) VALUES (?, ?, ?, ?, ?, ?)",
+                  (ovt_uuid, ELECTION_ID, voter_id, "issued", now + 3600, now))
+        ciphertext = str(uuid.uuid4().int)
+        ballots.append({
+            "vote_id": str(uuid.uuid4()),
+            "election_id": ELECTION_ID,
+            "candidate_id": "C1",
+            "ciphertext": ciphertext,
+            "client_hash": None,
+            "ovt_uuid": ovt_uuid,
+            "vote_hash": uuid.uuid4().hex * 2,
+        })
+    conn.commit()
+    conn.close()
+    return ballots
+
+
+def run_booths(server, ballots, booths):
+    errors = []
+
+    def booth(chunk):
+        for ballot in chunk:
+            try:
+                server.commit_ballot(ballot)
+            except Exception as e:
+                errors.append(e)
+
+    threads = [threading.Thread(target=booth, args=(ballots[i::booths],)) for i in range(booths)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - start, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--booths", default="50,500")
+    parser.add_argument("--votes-per-booth", type=int, default=10)
+    parser.add_argument("--synchronous", default="FULL")
+    parser.add_argument("--max-batch", type=int, default=64)
+    parser.add_argument("--max-wait-ms", type=float, default=5)
+    parser.add_argument("--db-dir", default=None)
+    args = parser.parse_args()
+
+    server = load_server()
+    db_path = os.path.join(args.db_dir, "bench_group_commit.db") if args.db_dir else scratch_path("group_commit.db")
+    server.DB_POOL = server.ConnectionPool(db_path, max_idle=600, synchronous=args.synchronous)
+    init_schema(server)
+    server.LEDGER_TIPS.invalidate()
+
+    print(f"synchronous={args.synchronous} db={db_path}")
+    print(f"{'booths':>7} {'mode':<14} {'votes':>7} {'seconds':>9} {'votes/s':>10}  batches")
+    for booths in [int(b) for b in args.booths.split(",")]:
+        count = booths * args.votes_per_booth
+        for mode in ("per-request", "group-commit"):
+            ballots = prepare_ballots(server, count)
+            if mode == "group-commit":
+                writer = server.start_vote_writer(max_batch=args.max_batch, max_wait_ms=args.max_wait_ms,
+                                                  synchronous=args.synchronous)
+            elapsed, errors = run_booths(server, ballots, booths)
+            batches = ""
+            if mode == "group-commit":
+                stats = writer.stats()
+                batches = f"{stats['batches']} (avg {stats['avg_batch']:.1f})"
+                server.stop_vote_writer()
+            print(f"{booths:>7} {mode:<14} {count:>7} {elapsed:>9.3f} {count / elapsed:>10.1f}  {batches}")
+            if errors:
+                print(f"        {len(errors)} errors, first: {errors[0]!r}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Checking one receipt: downloading /proof and rehashing the whole chain vs an
+O(log n) Merkle inclusion proof against a signed checkpoint.
+
+A valid chain of --blocks blocks is written straight into a scratch database;
+the receipt's window is checkpointed on the first inclusion-proof request.
+
+    python benchmarks/bench_inclusion_proof.py [--blocks 100000]
+"""
+
+import argparse
+import base64
+import time
+
+import bench_utils
+from bench_incremental_verify import build_chain, timed
+from server_backend.blockchain import merkle_checkpoint
+from server_backend.blockchain.blockchain import Block
+from client_app.crypto.vote_crypto import verify_inclusion_proof
+
+
+def verify_full_download(client, election_id, receipt):
+    """What a voter could do before: fetch every block, rehash the chain, find theirs."""
+    resp = client.get(f"/elections/{election_id}/proof")
+    prev_hash, found = "GENESIS", False
+    for b in resp.get_json()["blocks"]:
+        if b["prev_hash"] != prev_hash or Block(b["ledger_index"], b["ts"], b["vote_hash"], b["prev_hash"]).hash != b["hash"]:
+            return False, len(resp.data)
+        found = found or (b["ledger_index"], b["hash"]) == (receipt["ledger_index"], receipt["block_hash"])
+        prev_hash = b["hash"]
+    return found, len(resp.data)
+
+
+def verify_with_proof(client, election_id, receipt, pubkey_b64):
+    resp = client.get(f"/elections/{election_id}/inclusion-proof?ledger_index={receipt['ledger_index']}")
+    return verify_inclusion_proof(receipt, resp.get_json(), pubkey_b64), len(resp.data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--blocks", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    server = bench_utils.load_server()
+    election_id = bench_utils.ELECTION_ID
+    build_chain(server, election_id, args.blocks)
+    client = server.app.test_client()
+    pubkey_b64 = base64.b64encode(server.RSA_PUB_PEM.encode()).decode()
+
+    index = args.blocks // 2
+    conn = server.get_db()
+    block_hash = conn.execute("SELECT hash FROM ledger_blocks WHERE election_id=? AND ledger_index=?",
+                              (election_id, index)).fetchone()[0]
+    conn.close()
+    receipt = {"election_id": election_id, "ledger_index": index, "block_hash": block_hash}
+    print(f"{args.blocks:,} blocks, checkpoint every {server.CHECKPOINT_INTERVAL}, receipt for block {index:,}")
+
+    (ok, size), full_s = timed(lambda: verify_full_download(client, election_id, receipt))
+    print(f"  {'full /proof download + rehash':<32} {full_s * 1e3:10.1f} ms  {size / 1024:12,.1f} KiB  ok={ok}")
+
+    (ok, size), first_s = timed(lambda: verify_with_proof(client, election_id, receipt, pubkey_b64))
+    print(f"  {'inclusion proof (first, signs)':<32} {first_s * 1e3:10.1f} ms  {size / 1024:12,.1f} KiB  ok={ok}")
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        ok, size = verify_with_proof(client, election_id, receipt, pubkey_b64)
+    proof_s = (time.perf_counter() - start) / args.repeat
+    print(f"  {'inclusion proof':<32} {proof_s * 1e3:10.1f} ms  {size / 1024:12,.1f} KiB  ok={ok}")
+    assert ok
+
+    # Ingest-side cost: one Merkle root and one signature per window
+    conn = server.get_db()
+    c = conn.cursor()
+    start_index = merkle_checkpoint.window_start(index, server.CHECKPOINT_INTERVAL)
+    end_index = start_index + server.CHECKPOINT_INTERVAL - 1
+    _, sign_s = timed(lambda: merkle_checkpoint.create(c, election_id, start_index, end_index, block_hash,
+                                                       time.time(), server.sign_ledger_bytes))
+    conn.rollback()
+    conn.close()
+    print(f"  checkpoint build+sign {sign_s * 1e3:.1f} ms per window = "
+          f"{sign_s / server.CHECKPOINT_INTERVAL * 1e6:.0f} µs amortized per ballot")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Progress polling on a long ledger: the old full walk (verify_blockchain on
+every poll) vs incremental verification from the persisted checkpoint.
+
+A valid chain of --blocks blocks is written straight into a scratch database.
+
+    python benchmarks/bench_incremental_verify.py [--blocks 1000000]
+"""
+
+import argparse
+import contextlib
+import io
+import time
+
+import bench_utils
+from server_backend.blockchain.blockchain import Block
+
+
+def build_chain(server, election_id, blocks):
+    conn = server.get_db()
+    prev_hash, start = "GENESIS", time.time()
+
+    def rows():
+        nonlocal prev_hash
+        for i in range(blocks):
+            block = Block(i, start + i, f"{i:064x}", prev_hash)
+            yield election_id, i, block.vote_hash, prev_hash, block.hash, block.timestamp
+            prev_hash = block.hash
+
+    conn.executemany("INSERT INTO ledger_blocks (election_id, ledger_index, vote_hash, prev_hash, hash, ts) VALUES (?, ?, ?, ?, ?, ?)", rows())
+    conn.commit()
+    conn.close()
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--blocks", type=int, default=1_000_000)
+    parser.add_argument("--polls", type=int, default=20)
+    args = parser.parse_args()
+
+    server = bench_utils.load_server()
+    election_id = bench_utils.ELECTION_ID
+    _, build_s = timed(lambda: build_chain(server, election_id, args.blocks))
+    print(f"{args.blocks:,} blocks written in {build_s:.1f}s")
+    client = server.app.test_client()
+    url = f"/elections/{election_id}/progress"
+
+    with server.app.test_request_context(), contextlib.redirect_stdout(io.StringIO()):
+        old, old_s = timed(lambda: server.verify_blockchain(election_id).json["status"])
+    print(f"  {'old poll (full verify_blockchain)':<36} {old_s * 1e3:10.1f} ms  status={old}")
+
+    first, first_s = timed(lambda: client.get(url).get_json()["verification"])
+    print(f"  {'first poll (builds checkpoint)':<36} {first_s * 1e3:10.1f} ms  checked={first['newly_verified']:,}")
+
+    start = time.perf_counter()
+    for _ in range(args.polls):
+        poll = client.get(url).get_json()["verification"]
+    poll_s = (time.perf_counter() - start) / args.polls
+    print(f"  {'incremental poll':<36} {poll_s * 1e3:10.1f} ms  checked={poll['newly_verified']}  "
+          f"intact={poll['blockchain_intact']}")
+    assert poll["blockchain_intact"] and poll["total_blocks_verified"] == args.blocks
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Ledger feed: what one auditor costs the ingest server when it re-verifies
+through /blockchain/verify vs following /elections/<id>/feed, and how fast a
+follower catches up and then stays in sync with a local replica.
+
+    python benchmarks/bench_ledger_feed.py [--blocks 100000] [--new 1000]
+"""
+
+import argparse
+import contextlib
+import io
+import time
+
+import bench_utils
+from bench_incremental_verify import build_chain, timed
+from auditor.follower import Follower
+from server_backend.blockchain.blockchain import Block
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--blocks", type=int, default=100_000)
+    parser.add_argument("--new", type=int, default=1000, help="blocks appended after the follower caught up")
+    args = parser.parse_args()
+
+    server = bench_utils.load_server()
+    election_id = bench_utils.ELECTION_ID
+    build_chain(server, election_id, args.blocks)
+    client = server.app.test_client()
+    feed = f"/elections/{election_id}/feed"
+    client.get(f"{feed}?limit=1")  # first sync of the ledger file is not part of the comparison
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        _, verify_s = timed(lambda: client.get(f"/blockchain/verify/{election_id}").get_json()["status"])
+
+    follower = Follower(bench_utils.scratch_path("replica.db"), election_id)
+    server_s = 0.0
+
+    def catch_up():
+        nonlocal server_s
+        while True:
+            start = time.perf_counter()
+            page = client.get(f"{feed}?after_index={follower.last_index}").get_json()
+            server_s += time.perf_counter() - start
+            if not page["blocks"]:
+                return
+            assert follower.handle_page(page) == []
+
+    _, catch_up_s = timed(catch_up)
+    print(f"{args.blocks:,} blocks")
+    print(f"  {'/blockchain/verify (server)':<34} {verify_s * 1e3:9.1f} ms per auditor poll")
+    print(f"  {'follower catch-up (total)':<34} {catch_up_s * 1e3:9.1f} ms  ({args.blocks / catch_up_s:,.0f} blocks/s)")
+    print(f"  {'  of which feed requests (server)':<34} {server_s * 1e3:9.1f} ms")
+
+    conn = server.get_db()
+    prev_hash = conn.execute("SELECT hash FROM ledger_blocks WHERE election_id=? ORDER BY ledger_index DESC LIMIT 1",
+                             (election_id,)).fetchone()[0]
+    conn.close()
+    rows = []
+    for i in range(args.blocks, args.blocks + args.new):
+        block = Block(i, time.time(), f"{i:064x}", prev_hash)
+        rows.append((election_id, i, block.vote_hash, prev_hash, block.hash, block.timestamp))
+        prev_hash = block.hash
+    conn = server.get_db()
+    conn.executemany("INSERT INTO ledger_blocks (election_id, ledger_index, vote_hash, prev_hash, hash, ts) VALUES (?, ?, ?, ?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+
+    server_s = 0.0
+    _, incremental_s = timed(catch_up)
+    print(f"  {f'follower sync of {args.new:,} new blocks':<34} {incremental_s * 1e3:9.1f} ms  (server {server_s * 1e3:.1f} ms)")
+    follower.close()
+
+
+if __name__ == "__main__":
+    main()
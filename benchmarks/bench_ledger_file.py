@@ -0,0 +1,56 @@
+"""
+Per-election ledger files: /proof served from ledger.jsonl (mmap) vs rebuilt
+from ledger_blocks with jsonify, and random block reads by ledger_index from
+the offset index vs a SQLite primary-key lookup.
+
+    python benchmarks/bench_ledger_file.py [--blocks 200000] [--reads 20000]
+"""
+
+import argparse
+import random
+import time
+
+import bench_utils
+from bench_incremental_verify import build_chain, timed
+from server_backend.blockchain.ledger_file import LedgerFile
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--blocks", type=int, default=200_000)
+    parser.add_argument("--reads", type=int, default=20_000)
+    args = parser.parse_args()
+
+    server = bench_utils.load_server()
+    election_id = bench_utils.ELECTION_ID
+    build_chain(server, election_id, args.blocks)
+    conn = server.get_db()
+    _, sync_s = timed(lambda: server.LEDGER_FILES.sync(conn.cursor(), election_id))
+    print(f"{args.blocks:,} blocks; initial file sync {sync_s:.2f}s")
+
+    def proof_from_sql():
+        rows = conn.execute("SELECT ledger_index, vote_hash, prev_hash, hash, ts FROM ledger_blocks WHERE election_id=? ORDER BY ledger_index",
+                            (election_id,)).fetchall()
+        blocks = [{"ledger_index": r[0], "vote_hash": r[1], "prev_hash": r[2], "hash": r[3], "ts": r[4]}
+                  for r in rows]
+        return server.jsonify({"election_id": election_id, "blocks": blocks}).get_data()
+
+    client = server.app.test_client()
+    with server.app.app_context():
+        sql_body, sql_s = timed(proof_from_sql)
+    file_body, file_s = timed(lambda: client.get(f"/elections/{election_id}/proof").get_data())
+    print(f"  {'/proof rebuilt from SQLite':<30} {sql_s * 1e3:9.1f} ms  {len(sql_body) / 2**20:.1f} MiB")
+    print(f"  {'/proof from ledger.jsonl':<30} {file_s * 1e3:9.1f} ms  {len(file_body) / 2**20:.1f} MiB")
+
+    indexes = [random.randrange(args.blocks) for _ in range(args.reads)]
+    reader = LedgerFile(server.LEDGER_FILES.path_for(election_id))
+    _, sql_read_s = timed(lambda: [conn.execute("SELECT ledger_index, vote_hash, prev_hash, hash, ts FROM ledger_blocks WHERE election_id=? AND ledger_index=?",
+                                                (election_id, i)).fetchone() for i in indexes])
+    _, file_read_s = timed(lambda: [reader.read_range(i, i) for i in indexes])
+    print(f"  {'random read (SQLite PK)':<30} {sql_read_s / args.reads * 1e6:9.2f} us/block")
+    print(f"  {'random read (mmap + index)':<30} {file_read_s / args.reads * 1e6:9.2f} us/block")
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
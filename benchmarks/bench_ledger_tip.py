@@ -0,0 +1,84 @@
+"""
+Ingest latency as the ledger grows: the previous MAX(ledger_index) + prev-hash
+lookups versus the in-process tip cache.
+
+    python benchmarks/bench_ledger_tip.py [--sizes 1000,100000,1000000] [--samples 300]
+"""
+
+import argparse
+import time
+import uuid
+
+from bench_utils import load_server, seed_voters, ELECTION_ID
+
+
+def grow_ledger(server, target):
+    """Append synthetic blocks directly until the election has `target` blocks."""
+    conn = server.get_db()
+    c = conn.cursor()
+    last_index, last_hash = server.LEDGER_TIPS.tip(c, ELECTION_ID)
+    rows = []
+    for i in range(last_index + 1, target):
+        h = uuid.uuid4().hex * 2
+        rows.append((ELECTION_ID, i, h, last_hash, h, time.time()))
+        last_hash = h
+    c.executemany("INSERT INTO ledger_blocks (election_id, ledger_index, vote_hash, prev_hash, hash, ts) VALUES (?, ?, ?, ?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+    server.LEDGER_TIPS.invalidate(ELECTION_ID)
+
+
+def legacy_tip(c, election_id):
+    c.execute("SELECT MAX(ledger_index) FROM ledger_blocks WHERE election_id=?", (election_id,))
+    row = c.fetchone()
+    index = row[0] + 1 if row and row[0] is not None else 0
+    if index == 0:
+        return 0, "GENESIS"
+    c.execute("SELECT hash FROM ledger_blocks WHERE election_id=? AND ledger_index=?", (election_id, index - 1))
+    prev_row = c.fetchone()
+    return index, prev_row["hash"] if prev_row else "GENESIS"
+
+
+def time_ingest(server, samples, use_cache):
+    voter_ids = seed_voters(server, samples)
+    conn = server.get_db()
+    c = conn.cursor()
+    now = time.time()
+    c.executemany("INSERT INTO ovt_tokens (ovt_uuid, election_id, voter_id, status, expires_at, issued_ts) VALUES (?, ?, ?, ?, ?, ?)",
+                  [(v, ELECTION_ID, v, "issued", now + 600, now) for v in voter_ids])
+    conn.commit()
+
+    cached_next_block = server.LEDGER_TIPS.next_block
+    if not use_cache:
+        server.LEDGER_TIPS.next_block = legacy_tip
+    try:
+        start = time.perf_counter()
+        for v in voter_ids:
+            c.execute("BEGIN IMMEDIATE")
+            server.ingest_vote(c, str(uuid.uuid4()), ELECTION_ID, "C1", str(uuid.uuid4().int), None, v, uuid.uuid4().hex * 2)
+            conn.commit()
+        elapsed = time.perf_counter() - start
+    finally:
+        server.LEDGER_TIPS.next_block = cached_next_block
+        conn.close()
+    return elapsed / samples * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1000,100000,1000000")
+    parser.add_argument("--samples", type=int, default=300)
+    args = parser.parse_args()
+
+    server = load_server()
+    print(f"{'chain length':>14} {'legacy lookup':>16} {'tip cache':>12}")
+    for size in [int(s) for s in args.sizes.split(",")]:
+        grow_ledger(server, size)
+        legacy = time_ingest(server, args.samples, use_cache=False)
+        server.LEDGER_TIPS.invalidate(ELECTION_ID)
+        cached = time_ingest(server, args.samples, use_cache=True)
+        print(f"{size:>14,} {legacy:>13.1f} us {cached:>9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
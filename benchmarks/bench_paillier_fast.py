@@ -0,0 +1,61 @@
+"""
+Per-ballot cost of tallying with phe EncryptedNumber objects vs the raw-integer
+fast path, plus one decryption each. Both are measured with plain Python ints
+and, when it is installed, with gmpy2 (phe also uses gmpy2 if it can import it).
+
+    python benchmarks/bench_paillier_fast.py [--ballots 20000]
+"""
+
+import argparse
+import time
+
+import bench_utils  # noqa: F401  (puts the repo root on sys.path)
+from phe import paillier, util as phe_util
+
+from server_backend.crypto import paillier_fast
+from bench_tally_engine import load_keys
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ballots", type=int, default=20000)
+    parser.add_argument("--distinct", type=int, default=16, help="real encryptions to tile")
+    args = parser.parse_args()
+
+    public_key, private_key = load_keys()
+    seeds = [public_key.encrypt(1).ciphertext() for _ in range(args.distinct)]
+    stored = [str(seeds[i % len(seeds)]) for i in range(args.ballots)]
+    print(f"key: {public_key.n.bit_length()}-bit n, ballots: {args.ballots:,}, gmpy2: {paillier_fast.HAVE_GMPY2}")
+
+    def phe_tally():
+        total = paillier.EncryptedNumber(public_key, int(stored[0]))
+        for ciphertext in stored[1:]:
+            total += paillier.EncryptedNumber(public_key, int(ciphertext))
+        return total
+
+    have_gmp = phe_util.HAVE_GMP
+    for use_gmpy2 in [False] + ([True] if paillier_fast.HAVE_GMPY2 else []):
+        phe_util.HAVE_GMP = have_gmp and use_gmpy2
+        suffix = " + gmpy2" if use_gmpy2 else " (int)"
+        phe_total, phe_elapsed = timed(phe_tally)
+        phe_count, phe_decrypt = timed(lambda: private_key.decrypt(phe_total))
+        print(f"  {'phe' + suffix:<14} {phe_elapsed / args.ballots * 1e6:8.1f} us/ballot  "
+              f"decrypt {phe_decrypt * 1e3:7.2f} ms  total={phe_count:,}")
+
+        key = paillier_fast.RawPaillier(public_key.n, private_key.p, private_key.q, use_gmpy2=use_gmpy2)
+        raw_total, elapsed = timed(lambda: key.sum(stored))
+        count, decrypt = timed(lambda: key.decrypt(raw_total))
+        print(f"  {'raw' + suffix:<14} {elapsed / args.ballots * 1e6:8.1f} us/ballot  "
+              f"decrypt {decrypt * 1e3:7.2f} ms  total={count:,}  x{phe_elapsed / elapsed:4.1f}")
+        assert count == phe_count == args.ballots
+    phe_util.HAVE_GMP = have_gmp
+
+
+if __name__ == "__main__":
+    main()
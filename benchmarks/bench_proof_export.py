@@ -0,0 +1,68 @@
+"""
+Proof export: peak Python memory, time to first byte and total time for the
+old single-document /proof (every row in a list, one jsonify) vs the streamed
+JSON, NDJSON and gzip responses, plus the size of each on the wire.
+
+    python benchmarks/bench_proof_export.py [--blocks 200000]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import bench_utils
+from bench_incremental_verify import build_chain
+
+
+def measure(fn):
+    """(time to first chunk, total time, bytes, peak traced memory) of iterating fn()'s chunks."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    first, size = None, 0
+    for chunk in fn():
+        if first is None:
+            first = time.perf_counter() - start
+        size += len(chunk)
+    total = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return first or total, total, size, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--blocks", type=int, default=200_000)
+    args = parser.parse_args()
+
+    server = bench_utils.load_server()
+    election_id = bench_utils.ELECTION_ID
+    build_chain(server, election_id, args.blocks)
+    client = server.app.test_client()
+    url = f"/elections/{election_id}/proof"
+    client.get(f"{url}?limit=1")  # first sync of the ledger file is not part of the comparison
+
+    def old_proof():
+        conn = server.get_db()
+        rows = conn.execute("SELECT ledger_index, vote_hash, prev_hash, hash, ts FROM ledger_blocks WHERE election_id=? ORDER BY ledger_index",
+                            (election_id,)).fetchall()
+        conn.close()
+        blocks = [{"ledger_index": r[0], "vote_hash": r[1], "prev_hash": r[2], "hash": r[3], "ts": r[4]} for r in rows]
+        with server.app.app_context():
+            yield server.jsonify({"election_id": election_id, "blocks": blocks}).get_data()
+
+    def streamed(query="", headers=None):
+        return lambda: client.get(url + query, headers=headers or {}, buffered=False).response
+
+    print(f"{args.blocks:,} blocks")
+    print(f"  {'response':<28} {'first byte ms':>13} {'total ms':>9} {'MiB':>7} {'peak MiB':>9}")
+    for name, fn in [("old (list + jsonify)", old_proof),
+                     ("streamed JSON", streamed()),
+                     ("streamed NDJSON", streamed("?format=ndjson")),
+                     ("streamed NDJSON + gzip", streamed("?format=ndjson", {"Accept-Encoding": "gzip"})),
+                     ("page of 10,000", streamed("?after_index=100000&limit=10000"))]:
+        first, total, size, peak = measure(fn)
+        print(f"  {name:<28} {first * 1e3:>13.1f} {total * 1e3:>9.1f} {size / 2**20:>7.1f} {peak / 2**20:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+/votes throughput with one RSA-PSS receipt signature per vote vs batched
+receipts (one signature over the Merkle root of each window's receipts).
+
+    python benchmarks/bench_receipt_batch.py [--votes 400] [--threads 16] [--window-ms 5]
+"""
+
+import argparse
+import base64
+
+import bench_utils
+from client_app.crypto.signing import verify_batched_receipt
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--votes", type=int, default=400)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--window-ms", type=float, default=5)
+    args = parser.parse_args()
+
+    server = bench_utils.load_server()
+    pub_b64 = base64.b64encode(server.RSA_PUB_PEM.encode()).decode()
+    print(f"{args.votes} votes from {args.threads} threads")
+    for label, batched in (("receipt per vote", False), (f"batched, {args.window_ms:g} ms window", True)):
+        if batched:
+            server.start_receipt_batcher(window_ms=args.window_ms)
+        ovts = bench_utils.issue_ovts(server, bench_utils.seed_voters(server, args.votes))
+        receipts = []
+
+        def cast(client, ovt):
+            resp = client.post("/votes", json=bench_utils.vote_payload(ovt))
+            assert resp.status_code == 200
+            receipts.append(resp.get_json()["receipt"])
+
+        elapsed, errors = bench_utils.run_concurrent(server, ovts, args.threads, cast)
+        assert not errors, errors[:1]
+        bench_utils.print_row(label, len(ovts), elapsed)
+        if batched:
+            stats = server.RECEIPT_BATCHER.stats()
+            print(f"    {stats['batches']} signatures, {stats['avg_batch']:.1f} receipts per signature")
+            r = receipts[0]
+            payload = {k: r[k] for k in ("vote_id", "election_id", "ledger_index", "block_hash")}
+            assert verify_batched_receipt(payload, r["batch"], r["sig"], pub_b64, r["sig_alg"])
+            server.stop_receipt_batcher()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Cost of a dashboard poll of /elections/<id>/results: a full tally and
+decryption (cache cleared before every poll) vs a cached body vs a 304 for a
+matching If-None-Match.
+
+    python benchmarks/bench_results_cache.py [--ballots 200] [--polls 200]
+"""
+
+import argparse
+import contextlib
+import io
+import time
+
+import bench_utils
+from phe import paillier
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ballots", type=int, default=200)
+    parser.add_argument("--polls", type=int, default=200)
+    args = parser.parse_args()
+
+    server = bench_utils.load_server()
+    client = server.app.test_client()
+    public_key = paillier.PaillierPublicKey(server.PAILLIER_N)
+    url = f"/elections/{bench_utils.ELECTION_ID}/results"
+
+    voters = bench_utils.seed_voters(server, args.ballots)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i, ovt in enumerate(bench_utils.issue_ovts(server, voters)):
+            payload = bench_utils.vote_payload(ovt, candidate_id=f"C{i % 3 + 1}")
+            payload["encrypted_vote"]["ciphertext"] = str(public_key.encrypt(1).ciphertext())
+            assert client.post("/votes", json=payload).status_code == 200
+
+    def poll(label, headers=None, clear=False):
+        with contextlib.redirect_stdout(io.StringIO()):
+            etag = client.get(url).headers["ETag"]
+            start = time.perf_counter()
+            for _ in range(args.polls):
+                if clear:
+                    server.RESULTS_CACHE.invalidate()
+                resp = client.get(url, headers={"If-None-Match": etag} if headers else None)
+            elapsed = time.perf_counter() - start
+        print(f"  {label:<26} {elapsed / args.polls * 1e6:10.1f} us/poll  (status {resp.status_code})")
+
+    print(f"{args.ballots} ballots, {args.polls} polls each")
+    poll("tally every poll", clear=True)
+    poll("cached body")
+    poll("If-None-Match -> 304", headers=True)
+
+
+if __name__ == "__main__":
+    main()
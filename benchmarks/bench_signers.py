@@ -0,0 +1,70 @@
+"""
+Signature suites: signs/s and verifies/s for RSA-PSS at 2048 and 3072 bits
+(the repo's receipt key) and Ed25519, then /ovt/issue and /votes throughput
+with the server signing in each suite.
+
+    python benchmarks/bench_signers.py [--signs 500] [--requests 300]
+"""
+
+import argparse
+import os
+import time
+
+import bench_utils
+from Crypto.PublicKey import RSA
+from server_backend.crypto import context, signers
+
+PAYLOAD = b'{"block_hash":"00","election_id":"EL-2025-01","ledger_index":1,"vote_id":"v"}'
+
+
+def rate(fn, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        fn()
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--signs", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=300)
+    args = parser.parse_args()
+
+    suites = [
+        ("RSA-PSS-SHA256 (2048)", signers.RSASigner(RSA.generate(2048))),
+        ("RSA-PSS-SHA256 (3072)", context.get_context().signers[signers.RSA_PSS_SHA256]),
+        ("Ed25519", signers.Ed25519Signer.generate()),
+    ]
+    print("primitives")
+    for label, signer in suites:
+        signature = signer.sign(PAYLOAD)
+        signs = rate(lambda: signer.sign(PAYLOAD), args.signs)
+        verifies = rate(lambda: signer.verify(PAYLOAD, signature), args.signs)
+        print(f"  {label:<24} {signs:10,.0f} signs/s  {verifies:10,.0f} verifies/s  {len(signature):4} B")
+
+    server = bench_utils.load_server()
+    seed = os.urandom(32)
+    print(f"server, {args.requests} requests each")
+    for alg in (signers.RSA_PSS_SHA256, signers.ED25519):
+        server.CRYPTO = context.CryptoContext(server.RECEIPT_RSA_PRIV_PEM, signature_alg=alg, ed25519_seed=seed)
+        voters = bench_utils.seed_voters(server, args.requests)
+        ovts = []
+
+        def issue(client, voter_id):
+            ovts.append(client.post("/ovt/issue", json={"voter_id": voter_id, "election_id": bench_utils.ELECTION_ID}).get_json()["ovt"])
+
+        elapsed, errors = bench_utils.run_concurrent(server, voters, 1, issue)
+        assert not errors, errors[:1]
+        bench_utils.print_row(f"/ovt/issue {alg}", len(voters), elapsed)
+
+        def cast(client, ovt):
+            resp = client.post("/votes", json=bench_utils.vote_payload(ovt))
+            assert resp.status_code == 200 and resp.get_json()["receipt"]["sig_alg"] == alg
+
+        elapsed, errors = bench_utils.run_concurrent(server, ovts, 1, cast)
+        assert not errors, errors[:1]
+        bench_utils.print_row(f"/votes {alg}", len(ovts), elapsed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+/ovt/issue from concurrent request threads with RSA-PSS signing inline (one
+interpreter, GIL held through each signature) vs in the signing pool.
+
+    python benchmarks/bench_signing_pool.py [--requests 400] [--threads 8] [--workers 4]
+"""
+
+import argparse
+import os
+
+import bench_utils
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    server = bench_utils.load_server()
+    print(f"{args.requests} OVTs from {args.threads} threads, {os.cpu_count()} CPU(s)")
+
+    def issue(client, voter_id):
+        resp = client.post("/ovt/issue", json={"voter_id": voter_id, "election_id": bench_utils.ELECTION_ID})
+        assert resp.status_code == 200
+
+    for label, workers in (("inline", 0), (f"pool, {args.workers} worker(s)", args.workers)):
+        if workers:
+            server.start_signing_pool(workers=workers)
+        voters = bench_utils.seed_voters(server, args.requests)
+        elapsed, errors = bench_utils.run_concurrent(server, voters, args.threads, issue)
+        assert not errors, errors[:1]
+        bench_utils.print_row(label, len(voters), elapsed)
+        if workers:
+            metrics = server.app.test_client().get("/admin/signing-metrics").get_json()
+            latency = metrics["latency_ms"]
+            print(f"    signing latency p50 {latency['p50']:.1f} ms, p95 {latency['p95']:.1f} ms "
+                  f"(of which signing {metrics['sign_ms']['p50']:.1f} ms)")
+            server.stop_signing_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Peak memory of recounting an election: the old fetchall() + per-candidate
+lists vs streaming the cursor page by page (tally_accumulator.recount).
+
+Ballots are real encryptions of 1 under the server's Paillier key, tiled to
+the requested counts. Memory is measured with tracemalloc in-process, so the
+tally runs with workers=1.
+
+    python benchmarks/bench_streaming_tally.py [--sizes 10000,50000,200000]
+"""
+
+import argparse
+import sqlite3
+import time
+import tracemalloc
+
+import bench_utils
+from server_backend.crypto import paillier_fast, tally_engine
+from server_backend.db import tally_accumulator
+from bench_tally_engine import load_keys
+
+CANDIDATES = ["C1", "C2", "C3", "C4"]
+
+
+def build_db(path, ballots, seeds):
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE encrypted_votes (vote_id TEXT, election_id TEXT, candidate_id TEXT, ciphertext TEXT)")
+    tally_accumulator.init_tally_table(conn.cursor())
+    conn.executemany("INSERT INTO encrypted_votes VALUES (?, ?, ?, ?)",
+                     ((f"V{i}", bench_utils.ELECTION_ID, CANDIDATES[i % len(CANDIDATES)], seeds[i % len(seeds)])
+                      for i in range(ballots)))
+    conn.commit()
+    return conn
+
+
+def fetchall_tally(conn, nsquare):
+    """The pre-streaming recount: every row in memory, grouped per candidate."""
+    groups = {}
+    for candidate_id, ciphertext in conn.execute(
+            "SELECT candidate_id, ciphertext FROM encrypted_votes WHERE election_id=?",
+            (bench_utils.ELECTION_ID,)).fetchall():
+        groups.setdefault(candidate_id, []).append(ciphertext)
+    return tally_engine.homomorphic_sums(groups, nsquare, workers=1)
+
+
+def streaming_tally(conn, nsquare):
+    sums, _ = tally_accumulator.recount(conn.cursor(), bench_utils.ELECTION_ID, nsquare, workers=1)
+    return {cid: total for cid, (total, _) in sums.items()}
+
+
+def measure(fn, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="10000,50000,200000")
+    parser.add_argument("--distinct", type=int, default=16, help="real encryptions to tile")
+    args = parser.parse_args()
+
+    public_key, private_key = load_keys()
+    key = paillier_fast.RawPaillier(public_key.n, private_key.p, private_key.q)
+    seeds = [str(public_key.encrypt(1).ciphertext()) for _ in range(args.distinct)]
+    print(f"key: {public_key.n.bit_length()}-bit n, gmpy2: {paillier_fast.HAVE_GMPY2}")
+
+    for size in (int(s) for s in args.sizes.split(",")):
+        conn = build_db(bench_utils.scratch_path(f"tally-{size}.db"), size, seeds)
+        old, old_s, old_peak = measure(fetchall_tally, conn, public_key.nsquare)
+        new, new_s, new_peak = measure(streaming_tally, conn, public_key.nsquare)
+        assert old == new and sum(key.decrypt(v) for v in new.values()) == size
+        print(f"  {size:>9,} ballots  fetchall: {old_peak / 2**20:8.1f} MiB {old_s:7.2f}s   "
+              f"streaming: {new_peak / 2**20:6.1f} MiB {new_s:7.2f}s")
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Tally 1M synthetic ballots with the parallel tree-reduction engine.
+
+Ballots are real encryptions of 1 under the server's Paillier key, tiled to
+the requested count (encrypting a million fresh ballots would take hours),
+so the decrypted total must equal --ballots.
+
+    python benchmarks/bench_tally_engine.py [--ballots 1000000] [--workers 1,4,8]
+"""
+
+import argparse
+import json
+import os
+import time
+
+import bench_utils  # noqa: F401  (puts the repo root on sys.path)
+from phe import paillier
+
+from server_backend.crypto import tally_engine
+
+KEYS_DIR = os.path.join(bench_utils.ROOT_DIR, "server", "keys")
+
+
+def load_keys():
+    with open(os.path.join(KEYS_DIR, "paillier_public.json")) as f:
+        n = json.load(f)["n"]
+    with open(os.path.join(KEYS_DIR, "paillier_private.json")) as f:
+        priv = json.load(f)
+    public_key = paillier.PaillierPublicKey(n)
+    return public_key, paillier.PaillierPrivateKey(public_key, priv["p"], priv["q"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ballots", type=int, default=1_000_000)
+    parser.add_argument("--workers", default=f"1,{os.cpu_count() or 1}")
+    parser.add_argument("--chunk-size", type=int, default=tally_engine.DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--distinct", type=int, default=16, help="real encryptions to tile")
+    args = parser.parse_args()
+
+    public_key, private_key = load_keys()
+    print(f"key: {public_key.n.bit_length()}-bit n, ballots: {args.ballots:,}, cores: {os.cpu_count()}")
+    seeds = [public_key.encrypt(1).ciphertext() for _ in range(args.distinct)]
+    ballots = [seeds[i % len(seeds)] for i in range(args.ballots)]
+
+    baseline = None
+    for workers in sorted({int(w) for w in args.workers.split(",")}):
+        start = time.perf_counter()
+        total = tally_engine.homomorphic_sum(ballots, public_key.nsquare, workers=workers,
+                                             chunk_size=args.chunk_size, parallel_threshold=0)
+        elapsed = time.perf_counter() - start
+        count = private_key.decrypt(paillier.EncryptedNumber(public_key, total))
+        baseline = baseline or elapsed
+        print(f"  workers={workers:<3} {elapsed:9.2f}s  {args.ballots / elapsed:12,.0f} ballots/s  "
+              f"speedup x{baseline / elapsed:4.1f}  decrypted={count:,}")
+        assert count == args.ballots
+
+
+if __name__ == "__main__":
+    main()
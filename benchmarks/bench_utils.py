@@ -0,0 +1,131 @@
+"""
+Shared helpers for the server benchmarks.
+
+Every benchmark runs the real Flask app through its test client against a
+scratch SQLite database, so nothing touches database/server_voters.db.
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import threading
+import time
+import uuid
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+_SCRATCH_DIR = tempfile.mkdtemp(prefix="ballotguard-bench-")
+os.environ.setdefault("BALLOTGUARD_DB_PATH", os.path.join(_SCRATCH_DIR, "bench.db"))
+os.environ.setdefault("BALLOTGUARD_LEDGER_DIR", os.path.join(_SCRATCH_DIR, "ledger"))
+
+ELECTION_ID = "EL-2025-01"
+
+
+def load_server():
+    """Import server/server.py against the scratch database."""
+    server_dir = os.path.join(ROOT_DIR, "server")
+    if server_dir not in sys.path:
+        sys.path.insert(0, server_dir)
+    import server
+    return server
+
+
+def scratch_path(name):
+    return os.path.join(_SCRATCH_DIR, name)
+
+
+def init_schema(server):
+    """Create every server table in the database server.get_db() now points at
+    and drop the in-process ledger tips/results cached from the previous one."""
+    server.init_voters_table()
+    server.ensure_voters_name_column()
+    server.ensure_encrypted_votes_candidate_column()
+    server.init_tally_accumulators()
+    server.init_verify_checkpoints()
+    server.init_merkle_checkpoints()
+    server.init_vote_blocks()
+    server.init_elections_table()
+    server.LEDGER_TIPS.invalidate()
+    server.RESULTS_CACHE.invalidate()
+    server.init_face_duplicates()
+    server.load_face_index()
+    # Ledger files belong to one database; start a fresh directory for the new one
+    server.LEDGER_FILES.close()
+    server.LEDGER_FILES = server.LedgerFileStore(tempfile.mkdtemp(prefix="ledger-", dir=_SCRATCH_DIR))
+
+
+def seed_voters(server, count, election_id=ELECTION_ID):
+    """Insert `count` active voters that are eligible for `election_id`."""
+    conn = server.get_db()
+    c = conn.cursor()
+    voter_ids = []
+    now = time.time()
+    for _ in range(count):
+        voter_id = f"VOTER-{uuid.uuid4().hex[:12].upper()}"
+        c.execute("INSERT INTO voters (voter_id, name, face_encoding, status, created_at) VALUES (?, ?, ?, ?, ?)",
+                  (voter_id, "Bench", "[]", "active", now))
+        c.execute("INSERT OR REPLACE INTO voter_election_status (election_id, voter_id, status, voted_flag, last_auth_ts) VALUES (?, ?, ?, ?, ?)",
+                  (election_id, voter_id, "active", 0, None))
+        voter_ids.append(voter_id)
+    conn.commit()
+    conn.close()
+    return voter_ids
+
+
+def issue_ovts(server, voter_ids, election_id=ELECTION_ID):
+    """Issue one OVT per voter through /ovt/issue and return the ovt dicts."""
+    client = server.app.test_client()
+    ovts = []
+    for voter_id in voter_ids:
+        resp = client.post("/ovt/issue", json={"voter_id": voter_id, "election_id": election_id})
+        ovts.append(resp.get_json()["ovt"])
+    return ovts
+
+
+def vote_payload(ovt, election_id=ELECTION_ID, candidate_id="C1"):
+    return {
+        "vote_id": str(uuid.uuid4()),
+        "election_id": election_id,
+        "candidate_id": candidate_id,
+        "encrypted_vote": {"ciphertext": str(uuid.uuid4().int), "exponent": 0},
+        "ovt": ovt,
+    }
+
+
+def run_concurrent(server, jobs, threads, request_fn):
+    """
+    Spread `jobs` over `threads` worker threads, each with its own test client,
+    and call request_fn(client, job) for every job. Returns (elapsed_s, errors).
+    """
+    chunks = [jobs[i::threads] for i in range(threads)]
+    errors = []
+    lock = threading.Lock()
+
+    def worker(chunk):
+        client = server.app.test_client()
+        for job in chunk:
+            try:
+                request_fn(client, job)
+            except Exception as e:
+                with lock:
+                    errors.append(e)
+
+    workers = [threading.Thread(target=worker, args=(chunk,)) for chunk in chunks]
+    # The server prints a DEBUG line per request; keep it out of the timings.
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+        elapsed = time.perf_counter() - start
+    return elapsed, errors
+
+
+def print_row(label, count, elapsed):
+    rate = count / elapsed if elapsed else float("inf")
+    print(f"  {label:<34} {count:>7} req  {elapsed:8.3f}s  {rate:10.1f} req/s")
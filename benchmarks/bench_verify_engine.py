@@ -0,0 +1,41 @@
+"""
+Full verification of a long ledger: the serial walk vs the segment engine
+(server_backend/blockchain/verify_engine.py) at different worker counts.
+
+A valid chain of --blocks blocks is written straight into a scratch database.
+Speed-up is bounded by the machine's core count.
+
+    python benchmarks/bench_verify_engine.py [--blocks 1000000] [--workers 1,2,4,8]
+"""
+
+import argparse
+import os
+
+import bench_utils
+from bench_incremental_verify import build_chain, timed
+from server_backend.blockchain import verify_engine
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--blocks", type=int, default=1_000_000)
+    parser.add_argument("--workers", default="1,2,4,8")
+    parser.add_argument("--segment-size", type=int, default=verify_engine.DEFAULT_SEGMENT_SIZE)
+    args = parser.parse_args()
+
+    server = bench_utils.load_server()
+    election_id = bench_utils.ELECTION_ID
+    build_chain(server, election_id, args.blocks)
+    print(f"{args.blocks:,} blocks, {os.cpu_count()} CPUs, segments of {args.segment_size:,}")
+
+    baseline = None
+    for workers in [int(w) for w in args.workers.split(",")]:
+        result, elapsed = timed(lambda: verify_engine.verify_ledger(
+            server.DB_PATH, election_id, workers=workers, segment_size=args.segment_size, parallel_threshold=0))
+        assert result["status"] == "valid" and result["total_blocks"] == args.blocks
+        baseline = baseline or elapsed
+        print(f"  {workers:>2} worker(s)  {elapsed:8.2f}s  {args.blocks / elapsed:12,.0f} blocks/s  x{baseline / elapsed:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Multi-vote ledger blocks: ingest rate, chain length, full verification time
+and /proof size for one block per ballot (K=1) vs up to K ballots per block.
+
+Ballots go through the group-commit writer from --booths concurrent booths,
+each K on a fresh scratch database.
+
+    python benchmarks/bench_vote_blocks.py [--ballots 20000] [--k 1,16,64]
+"""
+
+import argparse
+import time
+
+from bench_utils import load_server, scratch_path, init_schema, ELECTION_ID
+from bench_group_commit import prepare_ballots, run_booths
+from server_backend.blockchain import verify_engine
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ballots", type=int, default=20000)
+    parser.add_argument("--booths", type=int, default=200)
+    parser.add_argument("--k", default="1,16,64")
+    parser.add_argument("--max-wait-ms", type=float, default=5)
+    args = parser.parse_args()
+
+    server = load_server()
+    print(f"{args.ballots:,} ballots from {args.booths} booths")
+    print(f"{'K':>4} {'votes/s':>9} {'blocks':>8} {'verify s':>9} {'/proof KiB':>11}")
+    for k in [int(k) for k in args.k.split(",")]:
+        db_path = scratch_path(f"vote_blocks_{k}.db")
+        server.DB_POOL = server.ConnectionPool(db_path, max_idle=args.booths + 8)
+        init_schema(server)
+        ballots = prepare_ballots(server, args.ballots)
+
+        server.start_vote_writer(max_batch=max(64, k), max_wait_ms=args.max_wait_ms, votes_per_block=k)
+        elapsed, errors = run_booths(server, ballots, args.booths)
+        server.stop_vote_writer()
+        assert not errors, errors[:3]
+
+        start = time.perf_counter()
+        result = verify_engine.verify_ledger(db_path, ELECTION_ID, workers=1)
+        verify_s = time.perf_counter() - start
+        assert result["status"] == "valid"
+
+        proof = server.app.test_client().get(f"/elections/{ELECTION_ID}/proof")
+        print(f"{k:>4} {args.ballots / elapsed:>9,.0f} {result['total_blocks']:>8,} {verify_s:>9.3f} "
+              f"{len(proof.data) / 1024:>11,.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,12 @@
 import requests
 import json
 try:
-    from client_app.client_config import SERVER_BASE
+    from client_app.client_config import SERVER_BASE, SIGNATURE_PUB_PEMS
 except ImportError:
-    from client_config import SERVER_BASE
+    from client_config import SERVER_BASE, SIGNATURE_PUB_PEMS
+
+# Ask for signatures in the suites we hold pinned keys for, by preference
+SIGNATURE_HEADERS = {"X-Signature-Algs": ", ".join(SIGNATURE_PUB_PEMS)}
 
 class BallotGuardAPI:
     def __init__(self, server_base=None):
@@ -62,7 +65,7 @@ class BallotGuardAPI:
                 "voter_id": voter_id,
                 "election_id": election_id
             }
-            response = requests.post(f"{self.server_base}/ovt/issue", json=data, timeout=10)
+            response = requests.post(f"{self.server_base}/ovt/issue", json=data, headers=SIGNATURE_HEADERS, timeout=10)
             
             if response.status_code == 200:
                 return response.json(), None
@@ -76,7 +79,7 @@ class BallotGuardAPI:
     def cast_vote(self, vote_data):
         """Cast a vote - MVP Architecture endpoint"""
         try:
-            response = requests.post(f"{self.server_base}/votes", json=vote_data, timeout=10)
+            response = requests.post(f"{self.server_base}/votes", json=vote_data, headers=SIGNATURE_HEADERS, timeout=10)
             
             if response.status_code == 200:
                 return response.json(), None
@@ -145,6 +148,20 @@ class BallotGuardAPI:
         except requests.exceptions.RequestException as e:
             return None, f"Network error: {str(e)}"
     
+    def get_inclusion_proof(self, election_id, vote_id):
+        """Get the Merkle inclusion proof for a cast vote's receipt"""
+        try:
+            response = requests.get(f"{self.server_base}/elections/{election_id}/inclusion-proof",
+                                    params={"vote_id": vote_id}, timeout=10)
+            if response.status_code == 200:
+                return response.json(), None
+            else:
+                error_data = response.json() if response.headers.get('content-type') == 'application/json' else {}
+                error_msg = error_data.get("error", {}).get("message", f"Server error: {response.status_code}")
+                return None, error_msg
+        except requests.exceptions.RequestException as e:
+            return None, f"Network error: {str(e)}"
+    
     def get_election_results(self, election_id):
         """Get election results - MVP Architecture endpoint"""
         try:
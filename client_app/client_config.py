@@ -15,6 +15,13 @@ pRsEB3mzmjQLiZqSI8k8kDK6C+8Ti4Vok6ugSwQowtG2w6t8dw3b82/sCkGpDLJA
 UYIwzSo8OSQrCObSfmOec2xcSkn8AV5K2AYLBRE0EMJNAgMBAAE=
 -----END PUBLIC KEY-----"""
 
+# Pinned public keys by signature suite, in order of preference; the booth asks
+# the server for these suites (X-Signature-Algs) and verifies each OVT/receipt
+# with the key its sig_alg names. To accept Ed25519 signatures put the
+# server's Ed25519 key (GET /public-key -> public_keys) first:
+#   SIGNATURE_PUB_PEMS = {"Ed25519": """-----BEGIN PUBLIC KEY-----...""", "RSA-PSS-SHA256": RSA_PUB_PEM}
+SIGNATURE_PUB_PEMS = {"RSA-PSS-SHA256": RSA_PUB_PEM}
+
 # Paillier public key (n) for client-side encryption (replace with actual value from server)
 PAILLIER_N = 3527928537556125298153841908640301260167148856808527760873143056231581978554742455329642532085643896825375094591988859959861315756876909766046043032513072819443860717947692847273735925061735487079211343584870819061240284936469000788259813146794163005195218232406608838519065890454356421964630110769422928755771199026880886505919311648849589446775747752162393616182829651339585866408516907975894375247284944502328634910824725563341809281859634762442737551894304212257381297959187930813310024448679463258632092259779723806762885470168313003054387657618110396746716940483787317542204461201712755684840513642393268763071898289855940465813289175341204690391380870140999465529323637509160813866940250888226359694112067246193142460755402586343661628986292967462615866926867918242382338726018455518046130813460568156534306643668366001404023845248204304389857075317394398128653277800027941948307870999234287069291054607198753545398961  # TODO: Set this to the actual 'n' value 
 # Example usage in client:
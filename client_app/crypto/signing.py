@@ -1,9 +1,19 @@
 import json
 import base64
+import hashlib
+import logging
 from Crypto.PublicKey import RSA
 from Crypto.Signature import pss
 from Crypto.Hash import SHA256
 
+RSA_PSS_SHA256 = "RSA-PSS-SHA256"
+ED25519 = "Ed25519"
+
+# DER prefix of an Ed25519 SubjectPublicKeyInfo; the raw 32-byte key follows
+_ED25519_SPKI_PREFIX = bytes.fromhex("302a300506032b6570032100")
+
+logger = logging.getLogger(__name__)
+
 def canonical_json_bytes(obj: dict) -> bytes:
     """
     Convert a dict to canonical JSON bytes (sorted keys, compact separators)
@@ -45,5 +55,60 @@ def verify_rsa_signature(message_obj: dict, sig_b64: str, pubkey_pem_b64: str) -
             return False
             
     except Exception as e:
-        print(f"Signature verification error: {str(e)}")
+        logger.debug("Signature verification error: %s", e)
+        return False
+
+def verify_ed25519_signature(message_obj: dict, sig_b64: str, pubkey_pem_b64: str) -> bool:
+    """
+    Verify an Ed25519 signature on a JSON object (same arguments as verify_rsa_signature;
+    the PEM is the server's Ed25519 public key from GET /public-key).
+    """
+    try:
+        from nacl.signing import VerifyKey
+        from nacl.exceptions import BadSignatureError
+
+        pubkey_pem = base64.b64decode(pubkey_pem_b64)
+        der = base64.b64decode(b"".join(line for line in pubkey_pem.strip().splitlines()
+                                         if not line.startswith(b"-----")))
+        if len(der) != len(_ED25519_SPKI_PREFIX) + 32 or not der.startswith(_ED25519_SPKI_PREFIX):
+            return False
+        try:
+            VerifyKey(der[len(_ED25519_SPKI_PREFIX):]).verify(canonical_json_bytes(message_obj), base64.b64decode(sig_b64))
+            return True
+        except (BadSignatureError, ValueError, TypeError):
+            return False
+
+    except Exception as e:
+        logger.debug("Signature verification error: %s", e)
+        return False
+
+def verify_signature(message_obj: dict, sig_b64: str, pubkey_pem_b64: str, alg: str = None) -> bool:
+    """
+    Verify a server signature in the suite named by its algorithm tag (the
+    sig_alg field next to it). No tag means RSA-PSS, what older servers send.
+    Unknown suites fail verification.
+    """
+    if alg in (None, RSA_PSS_SHA256):
+        return verify_rsa_signature(message_obj, sig_b64, pubkey_pem_b64)
+    if alg == ED25519:
+        return verify_ed25519_signature(message_obj, sig_b64, pubkey_pem_b64)
+    return False
+
+def verify_batched_receipt(message_obj: dict, batch: dict, sig_b64: str, pubkey_pem_b64: str, alg: str = None) -> bool:
+    """
+    Verify a receipt from a server that signs receipts in batches (receipt["batch"]):
+    the payload's leaf sha256(canonical JSON) must lead to batch["merkle_root"] along
+    batch["path"], and sig_b64 must be the server's signature of the batch header
+    {"type": "receipt-batch", "merkle_root", "size", "ts"} in suite `alg`.
+    """
+    try:
+        from server_backend.blockchain import merkle
+
+        leaf = hashlib.sha256(canonical_json_bytes(message_obj)).hexdigest()
+        if not merkle.verify_inclusion(leaf, batch["path"], batch["merkle_root"]):
+            return False
+        header = {"type": "receipt-batch", "merkle_root": batch["merkle_root"], "size": batch["size"], "ts": batch["ts"]}
+        return verify_signature(header, sig_b64, pubkey_pem_b64, alg)
+    except (KeyError, TypeError) as e:
+        logger.debug("Signature verification error: %s", e)
         return False
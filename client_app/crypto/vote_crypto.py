@@ -57,3 +57,59 @@ def verify_vote_receipt(vote_data, receipt_data):
         receipt_data.get("vote_id") == vote_data.get("vote_id") and
         receipt_data.get("election_id") == vote_data.get("election_id")
     )
+
+def verify_inclusion_proof(receipt, proof_data, pubkey_pem_b64):
+    """
+    Check a receipt against /elections/<id>/inclusion-proof in O(log n):
+    the proof's block is the receipt's block, its vote_hash is a leaf under the
+    checkpoint's Merkle root, and the checkpoint carries a valid server signature
+    (in the suite named by the proof's sig_alg; pubkey_pem_b64 is that suite's key).
+    For a multi-vote block the ballot's own path up to the block's root is checked too.
+    """
+    from server_backend.blockchain import merkle
+    from server_backend.blockchain.blockchain import Block
+    try:
+        from client_app.crypto.signing import verify_signature
+    except ImportError:
+        from signing import verify_signature
+
+    try:
+        block = proof_data["block"]
+        checkpoint = proof_data["checkpoint"]
+        if (block["ledger_index"], block["hash"]) != (receipt["ledger_index"], receipt["block_hash"]):
+            return False
+        if Block(block["ledger_index"], block["ts"], block["vote_hash"], block["prev_hash"]).hash != block["hash"]:
+            return False
+        if not checkpoint["start_index"] <= block["ledger_index"] <= checkpoint["end_index"]:
+            return False
+        if not merkle.verify_inclusion(block["vote_hash"], proof_data["proof"], checkpoint["merkle_root"]):
+            return False
+        ballot = proof_data.get("ballot")
+        if ballot is not None:
+            if receipt.get("block_position", ballot["position"]) != ballot["position"]:
+                return False
+            if not merkle.verify_inclusion(ballot["vote_hash"], ballot["path"], block["vote_hash"]):
+                return False
+        return verify_signature(checkpoint, proof_data["signature"], pubkey_pem_b64, proof_data.get("sig_alg"))
+    except (KeyError, TypeError):
+        return False
+
+
+def verify_block_receipt(receipt):
+    """
+    Check the multi-vote block fields of a receipt on their own: the ballot's
+    vote_hash and merkle_path lead to the block's root, and the block header
+    hashes to the receipt's (signed) block_hash.
+    """
+    from server_backend.blockchain import merkle
+    from server_backend.blockchain.blockchain import Block
+
+    try:
+        block = receipt["block"]
+        if (block["ledger_index"], block["hash"]) != (receipt["ledger_index"], receipt["block_hash"]):
+            return False
+        if Block(block["ledger_index"], block["ts"], block["vote_hash"], block["prev_hash"]).hash != block["hash"]:
+            return False
+        return merkle.verify_inclusion(receipt["vote_hash"], receipt["merkle_path"], block["vote_hash"])
+    except (KeyError, TypeError):
+        return False
@@ -1406,9 +1406,9 @@ class VotingInterfaceFrame(ctk.CTkFrame):
                 # --- Send to server ---
                 result, error = api_client.cast_vote(vote_data)
                 if result:
-                    # --- Server receipt and RSA signature verification ---
-                    from client_app.crypto.signing import verify_rsa_signature
-                    from client_app.client_config import RSA_PUB_PEM
+                    # --- Server receipt and signature verification (suite named by sig_alg) ---
+                    from client_app.crypto.signing import verify_signature, verify_batched_receipt
+                    from client_app.client_config import SIGNATURE_PUB_PEMS
                     import base64
                     server_sig = result.get("server_sig")
                     receipt = result.get("receipt")
@@ -1432,8 +1432,15 @@ class VotingInterfaceFrame(ctk.CTkFrame):
                     }
                     
                     try:
-                        rsa_pub_pem_b64 = base64.b64encode(RSA_PUB_PEM.encode()).decode()
-                        if not verify_rsa_signature(payload, receipt["sig"], rsa_pub_pem_b64):
+                        sig_alg = receipt.get("sig_alg", "RSA-PSS-SHA256")
+                        pub_pem = SIGNATURE_PUB_PEMS.get(sig_alg)
+                        pub_pem_b64 = base64.b64encode(pub_pem.encode()).decode() if pub_pem else ""
+                        if "batch" in receipt:
+                            # One server signature over the Merkle root of a batch of receipts
+                            valid = pub_pem and verify_batched_receipt(payload, receipt["batch"], receipt["sig"], pub_pem_b64, sig_alg)
+                        else:
+                            valid = pub_pem and verify_signature(payload, receipt["sig"], pub_pem_b64, sig_alg)
+                        if not valid:
                             messagebox.showerror("Vote Failed", "Server signature verification failed!")
                             self.vote_btn.configure(state="normal", text="Submit Vote")
                             return
@@ -16,8 +16,32 @@ if SERVER_DIR not in sys.path:
 from flask import Flask, request, jsonify, render_template
 import uuid
 import time
-from server_backend.crypto import sha_utils, paillier_server
+import threading
+from server_backend.crypto import sha_utils, paillier_server, paillier_fast
 from server_backend.blockchain import blockchain as blockchain_mod
+from server_backend.blockchain.tip_cache import LedgerTipCache
+from server_backend.blockchain import verify_checkpoint
+from server_backend.blockchain import merkle_checkpoint
+from server_backend.blockchain import verify_engine
+from server_backend.blockchain import merkle, vote_blocks
+from server_backend.blockchain.ledger_file import LedgerFileStore, encode_block
+from server_backend.blockchain.ledger_feed import LedgerFeed
+from server_backend.db.pool import ConnectionPool
+from server_backend.db.group_commit import GroupCommitWriter
+from server_backend.db import tally_accumulator
+from server_backend.db.results_cache import ResultsCache
+from server_backend.db.face_index import FaceTemplateIndex
+from server_backend.db import face_duplicates
+from server_config import DB_POOL_MAX_IDLE, DB_BUSY_TIMEOUT_MS, DB_MMAP_SIZE, DB_STATEMENT_CACHE
+from server_config import TALLY_PAGE_SIZE, TALLY_PROGRESS_EVERY, CHECKPOINT_INTERVAL, LEDGER_VOTES_PER_BLOCK
+from server_config import ADMIN_TOKEN, VERIFY_WORKERS
+from server_config import PROOF_PAGE_MAX, PROOF_STREAM_BLOCKS, PROOF_GZIP_LEVEL
+from server_config import FEED_PAGE_MAX, FEED_MAX_WAIT_SECONDS, FEED_HEARTBEAT_SECONDS, FEED_SSE_MAX_SECONDS
+from server_config import SIGNATURE_ALG, ED25519_SEED_FILE, SIGNING_WORKERS, SIGNING_TIMEOUT_S
+from server_config import RECEIPT_BATCH_WINDOW_MS, RECEIPT_BATCH_MAX
+from server_config import FACE_DUPLICATE_ACTION, FACE_DUPLICATE_TOLERANCE
+from server_config import (VOTE_GROUP_COMMIT, GROUP_COMMIT_MAX_BATCH, GROUP_COMMIT_MAX_WAIT_MS,
+                           GROUP_COMMIT_SYNCHRONOUS, GROUP_COMMIT_TIMEOUT_S)
 from datetime import datetime
 import sqlite3
 
@@ -26,6 +50,10 @@ import sqlite3
 # Plus dlib for face_recognition (use prebuilt wheels on Windows)
 
 import json, base64
+import hmac
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import zlib
 import numpy as np
 try:
     import face_recognition  # optional heavy dependency
@@ -69,6 +97,10 @@ try:
     from Crypto.Signature import pss
     from Crypto.Hash import SHA256
     from server_config import RECEIPT_RSA_PRIV_PEM, RECEIPT_RSA_PUB_PEM, PAILLIER_N, PAILLIER_P, PAILLIER_Q
+    from server_backend.crypto import context as crypto_context
+    from server_backend.crypto import signers
+    from server_backend.crypto.signing_pool import SigningPool
+    from server_backend.crypto.receipt_batch import ReceiptBatcher
     CRYPTO_AVAILABLE = True
 except Exception:
     # Fallback: pycryptodome not available. Provide a non-cryptographic fallback
@@ -92,23 +124,140 @@ PARTY_SYMBOLS = {
 }
 
 if CRYPTO_AVAILABLE:
-    RSA_SK = RSA.import_key(RECEIPT_RSA_PRIV_PEM)
+    # Keys are parsed once per process and shared with ovt/ledger_crypto
+    # (see server_backend/crypto/context.py)
+    CRYPTO = crypto_context.set_context(crypto_context.CryptoContext(
+        RECEIPT_RSA_PRIV_PEM, PAILLIER_N, PAILLIER_P, PAILLIER_Q, signature_alg=SIGNATURE_ALG,
+        ed25519_seed=signers.load_ed25519_seed(ED25519_SEED_FILE, create=SIGNATURE_ALG == signers.ED25519)))
+    RSA_SK = CRYPTO.signers[signers.RSA_PSS_SHA256].private_key
     RSA_PUB_PEM = RECEIPT_RSA_PUB_PEM  # returned to clients for verification
+    # Tally key with its CRT decryption parameters computed once
+    PAILLIER_KEY = CRYPTO.paillier
+    def sign_with(signer, data_bytes):
+        # In the signing pool's worker processes when it runs, else in this thread
+        pool = SIGNING_POOL
+        if pool is not None and pool.covers(signer):
+            return pool.sign(signer, data_bytes, timeout=SIGNING_TIMEOUT_S)
+        return signer.sign(data_bytes)
     def sign_bytes_with_crypto(data_bytes):
-        h = SHA256.new(data_bytes)
-        sig = pss.new(RSA_SK).sign(h)
-        return base64.b64encode(sig).decode()
+        return base64.b64encode(sign_with(CRYPTO.receipt, data_bytes)).decode()
+    def sign_for_client(data_bytes):
+        # OVTs and receipts: the first suite the client asked for that we have, else the default
+        signer = CRYPTO.signer_for(requested_signature_algs())
+        return base64.b64encode(sign_with(signer, data_bytes)).decode(), signer.alg
+    LEDGER_SIGNATURE_ALG = CRYPTO.ledger.alg
+    def sign_ledger_bytes(data_bytes):
+        return base64.b64encode(sign_with(CRYPTO.ledger, data_bytes)).decode()
 else:
+    CRYPTO = None
     RSA_SK = None
     RSA_PUB_PEM = RECEIPT_RSA_PUB_PEM
+    PAILLIER_KEY = paillier_fast.RawPaillier(PAILLIER_N, PAILLIER_P, PAILLIER_Q)
     def sign_bytes_with_crypto(data_bytes):
         # Insecure fallback: return base64(sha256(data)) as a placeholder signature
         digest = hashlib.sha256(data_bytes).digest()
         return base64.b64encode(digest).decode()
+    def sign_for_client(data_bytes):
+        return sign_bytes_with_crypto(data_bytes), "SHA256-DIGEST"
+    # Without the crypto stack "signatures" are plain SHA-256 digests of the payload
+    LEDGER_SIGNATURE_ALG = "SHA256-DIGEST"
+    sign_ledger_bytes = sign_bytes_with_crypto
+
+SIGNING_POOL = None
+
+
+def start_signing_pool(workers=SIGNING_WORKERS or None):
+    """Move OVT, receipt and ledger signing into a pool of worker processes (default: one per core)."""
+    global SIGNING_POOL
+    if not CRYPTO_AVAILABLE:
+        raise RuntimeError("the signing pool needs pycryptodome")
+    if SIGNING_POOL is None:
+        SIGNING_POOL = SigningPool([*CRYPTO.signers.values(), CRYPTO.receipt, CRYPTO.ovt, CRYPTO.ledger],
+                                   workers=workers).start()
+    return SIGNING_POOL
+
+
+def stop_signing_pool():
+    """Finish queued signatures and go back to signing in the request thread."""
+    global SIGNING_POOL
+    if SIGNING_POOL is not None:
+        pool, SIGNING_POOL = SIGNING_POOL, None
+        pool.stop()
+
+
+VERIFY_POOL = None
+VERIFY_POOL_WORKERS = 1
+
+
+def start_verify_pool(workers=VERIFY_WORKERS or None):
+    """Create the worker pool /blockchain/verify and tally recounts share (processes start on first use)."""
+    global VERIFY_POOL, VERIFY_POOL_WORKERS
+    if VERIFY_POOL is None:
+        VERIFY_POOL_WORKERS = workers or os.cpu_count() or 1
+        VERIFY_POOL = ProcessPoolExecutor(max_workers=VERIFY_POOL_WORKERS)
+    return VERIFY_POOL
+
+
+def stop_verify_pool():
+    global VERIFY_POOL
+    if VERIFY_POOL is not None:
+        pool, VERIFY_POOL = VERIFY_POOL, None
+        pool.shutdown()
+
+
+def verify_chain(election_id, upto):
+    """verify_engine.verify_ledger on the shared pool, replacing the pool once if a worker died."""
+    try:
+        pool = start_verify_pool()
+        return verify_engine.verify_ledger(DB_PATH, election_id, upto=upto, workers=VERIFY_POOL_WORKERS, pool=pool)
+    except BrokenProcessPool:
+        stop_verify_pool()
+        pool = start_verify_pool()
+        return verify_engine.verify_ledger(DB_PATH, election_id, upto=upto, workers=VERIFY_POOL_WORKERS, pool=pool)
+
+
+start_verify_pool()
+
+
+RECEIPT_BATCHER = None
+
+
+def start_receipt_batcher(window_ms=RECEIPT_BATCH_WINDOW_MS or 5, max_batch=RECEIPT_BATCH_MAX):
+    """Sign receipts in batches: one signature over the Merkle root of the receipts issued within window_ms."""
+    global RECEIPT_BATCHER
+    if not CRYPTO_AVAILABLE:
+        raise RuntimeError("batched receipts need pycryptodome")
+    if RECEIPT_BATCHER is None:
+        RECEIPT_BATCHER = ReceiptBatcher(lambda signer, data: base64.b64encode(sign_with(signer, data)).decode(),
+                                         max_batch=max_batch, window_ms=window_ms).start()
+    return RECEIPT_BATCHER
+
+
+def stop_receipt_batcher():
+    """Sign every receipt on its own again."""
+    global RECEIPT_BATCHER
+    if RECEIPT_BATCHER is not None:
+        batcher, RECEIPT_BATCHER = RECEIPT_BATCHER, None
+        batcher.stop()
+
+
+if RECEIPT_BATCH_WINDOW_MS > 0:
+    start_receipt_batcher()
+
+
+def requested_signature_algs():
+    """Signature suites the client accepts, by preference (X-Signature-Algs: Ed25519, RSA-PSS-SHA256)."""
+    header = request.headers.get('X-Signature-Algs', '')
+    return [alg.strip() for alg in header.split(',') if alg.strip()]
 
 @app.route('/public-key', methods=['GET'])
 def get_public_key():
-    return jsonify({"rsa_pub_pem": RSA_PUB_PEM})
+    return jsonify({
+        "rsa_pub_pem": RSA_PUB_PEM,
+        # Default suite (also the one the ledger is signed with) and every suite on offer
+        "sig_alg": LEDGER_SIGNATURE_ALG,
+        "public_keys": {alg: signer.public_pem().decode() for alg, signer in CRYPTO.signers.items()} if CRYPTO else {}
+    })
 
 @app.route('/party-symbols', methods=['GET'])
 def get_party_symbols():
@@ -164,17 +313,23 @@ OVT_TOKENS = None  # Deprecated: now using SQLite for OVT tokens
 ENCRYPTED_VOTES = None  # Deprecated: now using SQLite for encrypted votes
 LEDGER_BLOCKS = None    # Deprecated: now using SQLite for ledger blocks
 
-# Counters for ledger indices per election (now in DB)
-def get_next_ledger_index(election_id):
-    conn = get_db()
-    c = conn.cursor()
-    c.execute("SELECT MAX(ledger_index) FROM ledger_blocks WHERE election_id=?", (election_id,))
-    row = c.fetchone()
-    conn.close()
-    if row and row[0] is not None:
-        return row[0] + 1
-    else:
-        return 0
+# Ledger tip (last index, hash) per election, warmed from the DB at startup and
+# advanced by the ingest transaction. See server_backend/blockchain/tip_cache.py.
+LEDGER_TIPS = LedgerTipCache()
+
+# Rendered /results responses keyed on the ledger tip they were tallied at.
+# See server_backend/db/results_cache.py for what must invalidate them.
+RESULTS_CACHE = ResultsCache()
+
+# Pending and active voters' face templates as one float32 matrix, loaded at
+# startup and kept in step by enroll/approve/block. See
+# server_backend/db/face_index.py.
+FACE_INDEX = FaceTemplateIndex()
+
+# Enrollment's duplicate check and insert run under this lock, so the same
+# face enrolled twice at once cannot slip past the check.
+ENROLL_LOCK = threading.Lock()
+FACE_DUPLICATE_SCAN = face_duplicates.DuplicateScan()
 
 
 def _normalize_eid(eid: str) -> str:
@@ -209,11 +364,32 @@ def find_election(election_id):
     return None
 
 # SQLite DB setup for voters
-DB_PATH = os.path.join(os.path.dirname(__file__), '..', 'database', 'server_voters.db')
+# BALLOTGUARD_DB_PATH lets tests and benchmarks point the server at a scratch database.
+DB_PATH = os.environ.get('BALLOTGUARD_DB_PATH') or os.path.join(os.path.dirname(__file__), '..', 'database', 'server_voters.db')
+
+# Long-lived, pre-tuned connections shared by every route (WAL, synchronous=NORMAL,
+# busy_timeout, mmap, statement cache). conn.close() returns the connection to the pool.
+DB_POOL = ConnectionPool(DB_PATH, max_idle=DB_POOL_MAX_IDLE, busy_timeout_ms=DB_BUSY_TIMEOUT_MS,
+                         mmap_size=DB_MMAP_SIZE, cached_statements=DB_STATEMENT_CACHE)
+
 def get_db():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+    return DB_POOL.connect()
+
+# Append-only per-election copies of the ledger (<LEDGER_DIR>/<election_id>/ledger.jsonl
+# plus an offset index), read through mmap by /proof and auditors.
+LEDGER_DIR = os.environ.get('BALLOTGUARD_LEDGER_DIR') or os.path.join(os.path.dirname(__file__), '..', 'ledger')
+LEDGER_FILES = LedgerFileStore(LEDGER_DIR)
+# Wakes /elections/<id>/feed followers when new blocks reach the ledger files
+LEDGER_FEED = LedgerFeed()
+
+def sync_ledger_files(c, election_ids):
+    """Append newly committed blocks to the ledger files; a failure is made up by the next sync."""
+    for election_id in set(election_ids):
+        try:
+            LEDGER_FILES.sync(c, election_id)
+            LEDGER_FEED.publish(election_id, LEDGER_FILES.open(election_id).count - 1)
+        except Exception as e:
+            print(f"Warning: Could not append to the ledger file of {election_id}: {e}")
 
 def init_voters_table():
     conn = get_db()
@@ -255,7 +431,8 @@ def init_voters_table():
         client_hash TEXT,
         ledger_index INTEGER,
         ts REAL,
-        block_hash TEXT
+        block_hash TEXT,
+        block_position INTEGER
     )''')
     # Ledger blocks table
     c.execute('''CREATE TABLE IF NOT EXISTS ledger_blocks (
@@ -314,6 +491,49 @@ def ensure_encrypted_votes_candidate_column():
 ensure_encrypted_votes_candidate_column()
 
 
+def init_tally_accumulators():
+    conn = get_db()
+    tally_accumulator.init_tally_table(conn.cursor())
+    conn.commit()
+    conn.close()
+
+init_tally_accumulators()
+
+
+def init_verify_checkpoints():
+    conn = get_db()
+    verify_checkpoint.init_checkpoint_table(conn.cursor())
+    conn.commit()
+    conn.close()
+
+init_verify_checkpoints()
+
+
+def init_merkle_checkpoints():
+    conn = get_db()
+    merkle_checkpoint.init_checkpoint_table(conn.cursor())
+    conn.commit()
+    conn.close()
+
+init_merkle_checkpoints()
+
+
+def init_vote_blocks():
+    conn = get_db()
+    c = conn.cursor()
+    vote_blocks.init_block_votes_table(c)
+    c.execute("PRAGMA table_info(encrypted_votes)")
+    if 'block_position' not in [row[1] for row in c.fetchall()]:
+        c.execute("ALTER TABLE encrypted_votes ADD COLUMN block_position INTEGER")
+    conn.commit()
+    conn.close()
+
+init_vote_blocks()
+
+# Paillier ciphertexts live mod n^2; homomorphic addition is multiplication mod n^2
+PAILLIER_NSQUARE = PAILLIER_N * PAILLIER_N
+
+
 def init_elections_table():
     """Create elections table and seed with initial election data if empty."""
     conn = get_db()
@@ -378,6 +598,17 @@ def load_all_elections_from_db():
     return out
 
 
+def get_election_salt(election_id):
+    """Salt mixed into vote_hash = sha256(ciphertext + salt); "default_salt" if the election has none."""
+    try:
+        db_election = load_election_from_db(election_id)
+        if db_election and db_election.get('election_salt'):
+            return db_election.get('election_salt')
+    except Exception as e:
+        print(f"Warning: Could not load election salt from DB: {e}")
+    return "default_salt"
+
+
 def load_election_from_db(election_id):
     conn = get_db()
     c = conn.cursor()
@@ -405,6 +636,58 @@ def load_election_from_db(election_id):
 
 init_elections_table()
 
+
+def warm_ledger_tips():
+    conn = get_db()
+    try:
+        LEDGER_TIPS.warm(conn)
+    finally:
+        conn.close()
+
+warm_ledger_tips()
+
+
+def load_face_index():
+    conn = get_db()
+    try:
+        FACE_INDEX.load(conn.cursor())
+    finally:
+        conn.close()
+
+load_face_index()
+
+
+def init_face_duplicates():
+    conn = get_db()
+    face_duplicates.init_duplicates_table(conn.cursor())
+    conn.commit()
+    conn.close()
+
+init_face_duplicates()
+
+
+def save_face_duplicates(pairs, source):
+    conn = get_db()
+    try:
+        face_duplicates.record_duplicates(conn.cursor(), pairs, source)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def voter_face_status(voter_id):
+    """Voter's status, from FACE_INDEX when indexed; otherwise read (and index) the voters row. None if unknown."""
+    status = FACE_INDEX.status(voter_id)
+    if status is not None:
+        return status
+    conn = get_db()
+    row = conn.execute("SELECT status, face_encoding FROM voters WHERE voter_id=?", (voter_id,)).fetchone()
+    conn.close()
+    if not row:
+        return None
+    FACE_INDEX.upsert(voter_id, row["face_encoding"], row["status"])
+    return row["status"]
+
 # MVP Architecture Endpoints
 
 @app.route('/elections', methods=['GET'])
@@ -547,12 +830,26 @@ def election_action(election_id, action):
             # Remove encrypted votes and ledger blocks for this election
             conn = get_db()
             c = conn.cursor()
-            c.execute("DELETE FROM encrypted_votes WHERE election_id=?", (election_id,))
-            c.execute("DELETE FROM ledger_blocks WHERE election_id=?", (election_id,))
-            # Reset voted flags
-            c.execute("UPDATE voter_election_status SET voted_flag=0 WHERE election_id=?", (election_id,))
-            conn.commit()
-            conn.close()
+            try:
+                c.execute("BEGIN IMMEDIATE")
+                c.execute("DELETE FROM encrypted_votes WHERE election_id=?", (election_id,))
+                c.execute("DELETE FROM ledger_blocks WHERE election_id=?", (election_id,))
+                tally_accumulator.clear(c, election_id)
+                merkle_checkpoint.clear(c, election_id)
+                vote_blocks.clear(c, election_id)
+                # Reset voted flags
+                c.execute("UPDATE voter_election_status SET voted_flag=0 WHERE election_id=?", (election_id,))
+                # Rebuild the tip while still holding the write lock
+                LEDGER_TIPS.reset(election_id)
+                conn.commit()
+            except Exception:
+                LEDGER_TIPS.invalidate(election_id)
+                conn.rollback()
+                raise
+            finally:
+                conn.close()
+            LEDGER_FILES.clear(election_id)
+            LEDGER_FEED.publish(election_id, -1)
             found['status'] = 'draft'
             try:
                 save_election_to_db(found)
@@ -561,6 +858,7 @@ def election_action(election_id, action):
         else:
             return jsonify({"error": {"code": "BAD_ACTION", "message": f"Unknown action: {action}"}}), 400
 
+        RESULTS_CACHE.invalidate(found.get('election_id'))
         return jsonify({"status": "ok", "election_id": election_id, "action": action}), 200
     except Exception as e:
         return jsonify({"error": {"code": "ACTION_FAILED", "message": str(e)}}), 500
@@ -588,23 +886,43 @@ def enroll_voter():
         except Exception as e:
             return jsonify({"error":{"code":"FACE_PARSE_FAIL","message":str(e)}}), 400
 
-        # Store in SQLite with name
-        conn = get_db()
-        c = conn.cursor()
-        c.execute("INSERT INTO voters (voter_id, name, face_encoding, status, created_at) VALUES (?, ?, ?, ?, ?)",
-                  (voter_id, voter_name, json.dumps(enc.tolist()), "pending", time.time()))
-        conn.commit()
-        conn.close()
+        with ENROLL_LOCK:
+            # 1:N check against every pending or active voter's template
+            duplicate = None
+            if FACE_DUPLICATE_ACTION != "off":
+                match = FACE_INDEX.nearest(enc)
+                if match is not None and match[1] <= FACE_DUPLICATE_TOLERANCE:
+                    duplicate = {"voter_id": match[0], "distance": match[1]}
+            # Never name the matched voter or the distance to the caller: that would answer
+            # "who is this face?" for anyone who can enroll. Admins see the pair in face_duplicates.
+            if duplicate and FACE_DUPLICATE_ACTION == "reject":
+                return jsonify({"error":{"code":"DUPLICATE_VOTER","message":"This face is already enrolled."}}), 409
+
+            # Store in SQLite with name
+            conn = get_db()
+            try:
+                c = conn.cursor()
+                c.execute("INSERT INTO voters (voter_id, name, face_encoding, status, created_at) VALUES (?, ?, ?, ?, ?)",
+                          (voter_id, voter_name, json.dumps(enc.tolist()), "pending", time.time()))
+                if duplicate:
+                    face_duplicates.record_duplicates(c, [(voter_id, duplicate["voter_id"], duplicate["distance"])], "enroll")
+                conn.commit()
+            finally:
+                conn.close()
+            FACE_INDEX.upsert(voter_id, enc, "pending")
 
         # NOTE: Do NOT auto-approve voters here. Voters are created with status 'pending'
         # and must be approved by an administrator via the admin API (/voters/<id>/approve).
         # This preserves real-world workflow and prevents accidental auto-activation.
 
-        return jsonify({
+        body = {
             "voter_id": voter_id,
             "name": voter_name,
             "status": "pending"
-        }), 201
+        }
+        if duplicate:
+            body["duplicate_flagged"] = True
+        return jsonify(body), 201
     except Exception as e:
         return jsonify({
             "error": {
@@ -646,6 +964,8 @@ def approve_voter(voter_id):
         if row['status'] != 'active':
             c.execute("UPDATE voters SET status=? WHERE voter_id=?", ("active", voter_id))
             conn.commit()
+        if not FACE_INDEX.set_status(voter_id, "active"):
+            FACE_INDEX.upsert(voter_id, row["face_encoding"], "active")
         
         # Verify election exists
         c.execute("SELECT * FROM elections WHERE election_id=?", (election_id,))
@@ -675,6 +995,8 @@ def approve_voter(voter_id):
         
         conn.commit()
         conn.close()
+        # Eligible voter count (and turnout) changed
+        RESULTS_CACHE.invalidate(election_id)
         
         return jsonify({
             "status": "active",
@@ -713,6 +1035,8 @@ def block_voter(voter_id):
 
         conn.commit()
         conn.close()
+        FACE_INDEX.remove(voter_id)
+        RESULTS_CACHE.invalidate()
         return jsonify({"status": "blocked", "voter_id": voter_id})
     except Exception as e:
         return jsonify({"error": {"code": "BLOCK_FAILED", "message": str(e)}}), 500
@@ -790,16 +1114,12 @@ def verify_face():
         if not voter_id or not probe_encoding:
             return jsonify({"error":{"code":"NO_DATA","message":"Missing voter_id or face_encoding"}}), 400
 
-        # Fetch voter from SQLite
-        conn = get_db()
-        c = conn.cursor()
-        c.execute("SELECT * FROM voters WHERE voter_id=?", (voter_id,))
-        row = c.fetchone()
-        conn.close()
-        if not row:
+        # Status (and template) from the in-memory face index
+        voter_status = voter_face_status(voter_id)
+        if voter_status is None:
             print(f"DEBUG: Face verify failed - unknown voter. voter_id={voter_id}")
             return jsonify({"error":{"code":"NOT_FOUND","message":"Voter not found"}}), 404
-        if row["status"] != "active":
+        if voter_status != "active":
             return jsonify({"error":{"code":"VOTER_INACTIVE","message":"Voter not approved"}}), 403
 
         # Check eligibility and voted_flag from DB
@@ -814,12 +1134,10 @@ def verify_face():
             return jsonify({"error":{"code":"ALREADY_VOTED","message":"Already voted in this election"}}), 409
 
         try:
-            stored = np.asarray(json.loads(row["face_encoding"]), dtype=float)
-            probe = np.asarray(probe_encoding, dtype=float)
-            matches = face_recognition.compare_faces([stored], probe, tolerance=0.5)
-            distance = float(face_recognition.face_distance([stored], probe)[0])
-            passed = bool(matches[0])
-            confidence = max(0.0, 1.0 - distance)  # heuristic
+            distance = FACE_INDEX.distance(voter_id, probe_encoding)
+            # No usable stored template: never a match
+            passed = distance is not None and distance <= 0.5
+            confidence = max(0.0, 1.0 - distance) if distance is not None else 0.0  # heuristic
         except Exception as e:
             return jsonify({"error":{"code":"FACE_COMPARE_FAIL","message":str(e)}}), 500
 
@@ -889,13 +1207,14 @@ def issue_ovt():
         conn.commit()
         conn.close()
 
-        # Real RSA-PSS signature of the canonical OVT JSON
+        # Signature of the canonical OVT JSON, in the suite named by sig_alg
         ovt_bytes = json.dumps(ovt, sort_keys=True, separators=(",", ":")).encode()
-        server_sig = sign_bytes_with_crypto(ovt_bytes)
+        server_sig, sig_alg = sign_for_client(ovt_bytes)
 
         return jsonify({
             "ovt": ovt,
-            "server_sig": server_sig  # client already knows RSA_PUB_PEM
+            "server_sig": server_sig,  # client already knows the public key (GET /public-key)
+            "sig_alg": sig_alg
         })
 
     except Exception as e:
@@ -907,9 +1226,231 @@ def issue_ovt():
         }), 500
 
 # Votes endpoint (Booth)
+class VoteRejected(Exception):
+    """Raised inside the ingest transaction to abort it with an API error."""
+
+    def __init__(self, code, message, http_status):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.http_status = http_status
+
+
+def ingest_vote(c, vote_id, election_id, candidate_id, ciphertext, client_hash, ovt_uuid, vote_hash, defer_block=False):
+    """Validate and append one ballot using cursor `c`.
+
+    Must run inside a write transaction (BEGIN IMMEDIATE) so the OVT spend,
+    voted_flag update and ledger index allocation are atomic with respect to
+    other booths. Returns the ack dict; raises VoteRejected on validation errors.
+    With defer_block the ballot is stored without a block and its ack is
+    completed by seal_vote_blocks() before the transaction commits.
+    """
+    # Idempotency: a replayed vote_id gets the original ack back, but only with
+    # the election and the OVT that ballot was cast with
+    c.execute("SELECT election_id, voter_id, ledger_index, block_hash, block_position FROM encrypted_votes WHERE vote_id=?", (vote_id,))
+    existing_vote = c.fetchone()
+    if existing_vote:
+        c.execute("SELECT election_id, voter_id, status FROM ovt_tokens WHERE ovt_uuid=?", (ovt_uuid,))
+        ovt_token = c.fetchone()
+        if (existing_vote["election_id"] != election_id or not ovt_token or ovt_token["status"] != "spent"
+                or ovt_token["election_id"] != election_id or ovt_token["voter_id"] != existing_vote["voter_id"]):
+            raise VoteRejected("VOTE_ID_CONFLICT", "vote_id already used by another ballot", 409)
+        if existing_vote["ledger_index"] is None:
+            # Same vote_id earlier in this batch: sealed together with the original
+            return {"vote_id": vote_id, "election_id": existing_vote["election_id"], "pending": True, "replayed": True}
+        ack = {"election_id": existing_vote["election_id"], "ledger_index": existing_vote["ledger_index"],
+               "block_hash": existing_vote["block_hash"], "replayed": True}
+        if existing_vote["block_position"] is not None:
+            ack.update(block_receipt_fields(c, existing_vote["election_id"], existing_vote["ledger_index"],
+                                            existing_vote["block_position"]))
+        return ack
+
+    c.execute("SELECT election_id, voter_id, status, expires_at FROM ovt_tokens WHERE ovt_uuid=?", (ovt_uuid,))
+    ovt_token = c.fetchone()
+    if not ovt_token:
+        raise VoteRejected("OVT_NOT_FOUND", "Invalid or missing OVT", 400)
+    if ovt_token["status"] != "issued":
+        raise VoteRejected("OVT_SPENT", "OVT already used", 409)
+    if ovt_token["expires_at"] < time.time():
+        raise VoteRejected("OVT_EXPIRED", "OVT expired", 403)
+    if ovt_token["election_id"] != election_id:
+        raise VoteRejected("OVT_ELECTION_MISMATCH", "OVT not issued for this election", 403)
+    voter_id = ovt_token["voter_id"]
+
+    # Compare-and-set spend: only one transaction can move the OVT out of 'issued'
+    c.execute("UPDATE ovt_tokens SET status=? WHERE ovt_uuid=? AND status=?", ("spent", ovt_uuid, "issued"))
+    if c.rowcount != 1:
+        raise VoteRejected("OVT_SPENT", "OVT already used", 409)
+
+    # Same for the voter: flip voted_flag 0 -> 1 or find out why we could not
+    c.execute("UPDATE voter_election_status SET voted_flag=1 WHERE election_id=? AND voter_id=? AND status=? AND voted_flag=0",
+              (election_id, voter_id, "active"))
+    if c.rowcount != 1:
+        c.execute("SELECT status, voted_flag FROM voter_election_status WHERE election_id=? AND voter_id=?", (election_id, voter_id))
+        ves_row = c.fetchone()
+        if not ves_row or ves_row["status"] != "active":
+            raise VoteRejected("NOT_ELIGIBLE", "Not eligible for this election", 403)
+        raise VoteRejected("ALREADY_VOTED", "Already voted in this election", 409)
+
+    if defer_block:
+        c.execute("INSERT INTO encrypted_votes (vote_id, election_id, voter_id, candidate_id, ciphertext, client_hash, ts) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                  (vote_id, election_id, voter_id, candidate_id, ciphertext, client_hash, time.time()))
+        tally_accumulator.add_ballot(c, election_id, candidate_id, ciphertext, PAILLIER_NSQUARE)
+        return {"vote_id": vote_id, "election_id": election_id, "vote_hash": vote_hash, "pending": True, "replayed": False}
+
+    # Allocate the next ledger index from the tip cache; the write lock makes this race-free
+    ledger_index, prev_hash = LEDGER_TIPS.next_block(c, election_id)
+
+    timestamp = time.time()
+    block_obj = blockchain_mod.Block(
+        index=ledger_index,
+        timestamp=timestamp,
+        vote_hash=vote_hash,
+        previous_hash=prev_hash
+    )
+    block_hash = block_obj.hash
+
+    # Store encrypted vote in DB (include voter_id and candidate_id)
+    c.execute("INSERT INTO encrypted_votes (vote_id, election_id, voter_id, candidate_id, ciphertext, client_hash, ledger_index, ts, block_hash) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+              (vote_id, election_id, voter_id, candidate_id, ciphertext, client_hash, ledger_index, timestamp, block_hash))
+
+    # Store ledger block in DB (with real block hash)
+    c.execute("INSERT INTO ledger_blocks (election_id, ledger_index, vote_hash, prev_hash, hash, ts) VALUES (?, ?, ?, ?, ?, ?)",
+              (election_id, ledger_index, vote_hash, prev_hash, block_hash, timestamp))
+
+    # Fold the ballot into the candidate's encrypted running sum
+    tally_accumulator.add_ballot(c, election_id, candidate_id, ciphertext, PAILLIER_NSQUARE)
+
+    # Sign the Merkle root of the window this block completes (every CHECKPOINT_INTERVAL blocks)
+    merkle_checkpoint.maybe_checkpoint(c, election_id, ledger_index, block_hash, timestamp,
+                                       CHECKPOINT_INTERVAL, sign_ledger_bytes)
+
+    # Callers must invalidate the tip if this transaction does not commit
+    LEDGER_TIPS.advance(election_id, ledger_index, block_hash)
+
+    return {"election_id": election_id, "ledger_index": ledger_index, "block_hash": block_hash, "replayed": False}
+
+
+def block_header_json(ledger_index, vote_hash, prev_hash, block_hash, ts):
+    return {"ledger_index": ledger_index, "vote_hash": vote_hash, "prev_hash": prev_hash, "hash": block_hash, "ts": ts}
+
+
+def block_receipt_fields(c, election_id, ledger_index, position):
+    """Receipt extras for a ballot in a multi-vote block: its leaf, position, path and the block header."""
+    c.execute("SELECT ledger_index, vote_hash, prev_hash, hash, ts FROM ledger_blocks WHERE election_id=? AND ledger_index=?",
+              (election_id, ledger_index))
+    block = c.fetchone()
+    ballot = vote_blocks.ballot_proof(c, election_id, ledger_index, position)
+    return {"vote_hash": ballot["vote_hash"], "block_position": position, "merkle_path": ballot["path"],
+            "block": block_header_json(*block)}
+
+
+def seal_vote_blocks(c, results):
+    """Writer finish_fn: pack the batch's new ballots into blocks of up to VOTES_PER_BLOCK."""
+    pending = [ack for ack in results if ack.get("pending")]
+    by_election = {}
+    for ack in pending:
+        if not ack["replayed"]:
+            by_election.setdefault(ack["election_id"], []).append(ack)
+
+    placed = {}
+    for election_id, ballots in by_election.items():
+        for start in range(0, len(ballots), VOTES_PER_BLOCK):
+            chunk = ballots[start:start + VOTES_PER_BLOCK]
+            leaves = [ack["vote_hash"] for ack in chunk]
+            levels = merkle.tree_levels(leaves)
+            root = levels[-1][0].hex()
+
+            ledger_index, prev_hash = LEDGER_TIPS.next_block(c, election_id)
+            timestamp = time.time()
+            block_hash = blockchain_mod.Block(ledger_index, timestamp, root, prev_hash).hash
+            c.execute("INSERT INTO ledger_blocks (election_id, ledger_index, vote_hash, prev_hash, hash, ts) VALUES (?, ?, ?, ?, ?, ?)",
+                      (election_id, ledger_index, root, prev_hash, block_hash, timestamp))
+            vote_blocks.store(c, election_id, ledger_index, leaves)
+            c.executemany("UPDATE encrypted_votes SET ledger_index=?, block_hash=?, block_position=? WHERE vote_id=?",
+                          [(ledger_index, block_hash, position, ack["vote_id"]) for position, ack in enumerate(chunk)])
+            merkle_checkpoint.maybe_checkpoint(c, election_id, ledger_index, block_hash, timestamp,
+                                               CHECKPOINT_INTERVAL, sign_ledger_bytes)
+            # The writer invalidates tips if the batch does not commit
+            LEDGER_TIPS.advance(election_id, ledger_index, block_hash)
+
+            header = block_header_json(ledger_index, root, prev_hash, block_hash, timestamp)
+            for position, ack in enumerate(chunk):
+                placed[ack["vote_id"]] = {"ledger_index": ledger_index, "block_hash": block_hash,
+                                          "vote_hash": ack["vote_hash"], "block_position": position,
+                                          "merkle_path": merkle.proof_from_levels(levels, position), "block": header}
+
+    for ack in pending:
+        ack.update(placed[ack["vote_id"]])
+        for key in ("pending", "vote_id"):
+            ack.pop(key, None)
+
+
+def _apply_ballot(c, ballot):
+    return ingest_vote(c, defer_block=VOTES_PER_BLOCK > 1, **ballot)
+
+
+def start_vote_writer(max_batch=GROUP_COMMIT_MAX_BATCH, max_wait_ms=GROUP_COMMIT_MAX_WAIT_MS,
+                      synchronous=GROUP_COMMIT_SYNCHRONOUS, votes_per_block=LEDGER_VOTES_PER_BLOCK):
+    """Switch /votes to group-commit ingestion through a single writer thread.
+
+    With votes_per_block > 1 each batch's ballots are sealed into multi-vote blocks.
+    """
+    global VOTE_WRITER, VOTES_PER_BLOCK
+    if VOTE_WRITER is None:
+        VOTES_PER_BLOCK = votes_per_block
+        VOTE_WRITER = GroupCommitWriter(DB_POOL, _apply_ballot, max_batch=max_batch, max_wait_ms=max_wait_ms,
+                                        synchronous=synchronous, on_abort=LEDGER_TIPS.invalidate,
+                                        finish_fn=seal_vote_blocks if votes_per_block > 1 else None,
+                                        after_commit=lambda c, ballots: sync_ledger_files(c, [b["election_id"] for b in ballots])).start()
+    return VOTE_WRITER
+
+
+def stop_vote_writer():
+    """Drain the writer and go back to one transaction (and block) per request."""
+    global VOTE_WRITER, VOTES_PER_BLOCK
+    if VOTE_WRITER is not None:
+        VOTE_WRITER.stop()
+        VOTE_WRITER = None
+        VOTES_PER_BLOCK = 1
+
+
+VOTE_WRITER = None
+VOTES_PER_BLOCK = 1
+if VOTE_GROUP_COMMIT or LEDGER_VOTES_PER_BLOCK > 1:
+    start_vote_writer()
+
+
+def commit_ballot(ballot):
+    """Run ingest_vote for one ballot and return its ack once it is committed."""
+    if VOTE_WRITER is not None:
+        return VOTE_WRITER.submit(ballot).result(timeout=GROUP_COMMIT_TIMEOUT_S)
+
+    election_id = ballot["election_id"]
+    conn = get_db()
+    try:
+        c = conn.cursor()
+        c.execute("BEGIN IMMEDIATE")
+        ack = ingest_vote(c, **ballot)
+        conn.commit()
+        if not ack.get("replayed"):
+            sync_ledger_files(c, [election_id])
+        return ack
+    except VoteRejected:
+        conn.rollback()
+        raise
+    except Exception:
+        # The tip may already have advanced; drop it before releasing the write lock
+        LEDGER_TIPS.invalidate(election_id)
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
 @app.route('/votes', methods=['POST'])
 def cast_vote():
-    """Cast a vote - now using SQLite for persistence"""
+    """Cast a vote: OVT spend, vote insert, ledger append and voted_flag commit atomically"""
     try:
         data = request.json
         vote_id = data.get("vote_id")
@@ -933,130 +1474,67 @@ def cast_vote():
         client_hash = data.get("client_hash")
         ovt = data.get("ovt", {})
         ovt_uuid = ovt.get("ovt_uuid") if ovt else None
-
-        # Validate OVT (from DB)
         if not ovt_uuid:
             return jsonify({"error": {"code": "OVT_NOT_FOUND","message": "Invalid or missing OVT"}}), 400
-        conn = get_db()
-        c = conn.cursor()
-        c.execute("SELECT * FROM ovt_tokens WHERE ovt_uuid=?", (ovt_uuid,))
-        ovt_token = c.fetchone()
-        if not ovt_token:
-            conn.close()
-            return jsonify({"error": {"code": "OVT_NOT_FOUND","message": "Invalid or missing OVT"}}), 400
-        if ovt_token["status"] != "issued":
-            conn.close()
-            return jsonify({"error": {"code": "OVT_SPENT","message": "OVT already used"}}), 409
-        if ovt_token["expires_at"] < time.time():
-            conn.close()
-            return jsonify({"error": {"code": "OVT_EXPIRED", "message": "OVT expired"}}), 403
-        if ovt_token["election_id"] != election_id:
-            conn.close()
-            return jsonify({"error": {"code": "OVT_ELECTION_MISMATCH","message": "OVT not issued for this election"}}), 403
-        voter_id = ovt_token["voter_id"]
 
-        # Check if already voted
-        # Check eligibility and voted_flag from DB
-        conn2 = get_db()
-        c2 = conn2.cursor()
-        c2.execute("SELECT status, voted_flag FROM voter_election_status WHERE election_id=? AND voter_id=?", (election_id, voter_id))
-        ves_row = c2.fetchone()
-        if not ves_row or ves_row["status"] != "active":
-            conn2.close()
-            conn.close()
-            return jsonify({"error": {"code": "NOT_ELIGIBLE","message": "Not eligible for this election"}}), 403
-        if ves_row["voted_flag"]:
-            conn2.close()
-            conn.close()
-            return jsonify({"error": {"code": "ALREADY_VOTED","message": "Already voted in this election"}}), 409
-
-        # Check for duplicate vote_id (idempotency)
-        c.execute("SELECT * FROM encrypted_votes WHERE vote_id=?", (vote_id,))
-        existing_vote = c.fetchone()
-        if existing_vote:
-            conn.close()
-            return jsonify({
-                "ledger_index": existing_vote["ledger_index"],
-                "block_hash": existing_vote["block_hash"],
-                "ack": "stored"
-            })
-
-        # Get election salt for vote_hash
-        election_salt = "default_salt"
-        # Get election metadata from DB
-        try:
-            db_election = load_election_from_db(election_id)
-            if db_election and db_election.get('election_salt'):
-                election_salt = db_election.get('election_salt')
-        except Exception as e:
-            print(f"Warning: Could not load election salt from DB: {e}")
-            pass
+        # Get election salt for vote_hash (read-only, outside the write transaction)
+        election_salt = get_election_salt(election_id)
 
         # Compute vote_hash using real SHA-256 util
         vote_hash = sha_utils.compute_sha256_hex(f"{ciphertext}{election_salt}")
 
-        # Get next ledger index from DB
-        ledger_index = get_next_ledger_index(election_id)
-        if ledger_index == 0:
-            prev_hash = "GENESIS"
-        else:
-            c.execute("SELECT hash FROM ledger_blocks WHERE election_id=? AND ledger_index=?", (election_id, ledger_index-1))
-            prev_row = c.fetchone()
-            prev_hash = prev_row["hash"] if prev_row else "GENESIS"
-
-        # Use real blockchain Block class for block creation
-        block_header = {
-            "index": ledger_index,
-            "timestamp": time.time(),
-            "vote_hash": vote_hash,
-            "previous_hash": prev_hash
-        }
-        # Compute block hash using Block class
-        block_obj = blockchain_mod.Block(
-            index=ledger_index,
-            timestamp=block_header["timestamp"],
-            vote_hash=vote_hash,
-            previous_hash=prev_hash
-        )
-        block_hash = block_obj.hash
-
-        # Store encrypted vote in DB (include voter_id and candidate_id)
-        c.execute("INSERT INTO encrypted_votes (vote_id, election_id, voter_id, candidate_id, ciphertext, client_hash, ledger_index, ts, block_hash) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                  (vote_id, election_id, voter_id, candidate_id, ciphertext, client_hash, ledger_index, block_header["timestamp"], block_hash))
-
-        # Store ledger block in DB (with real block hash)
-        c.execute("INSERT INTO ledger_blocks (election_id, ledger_index, vote_hash, prev_hash, hash, ts) VALUES (?, ?, ?, ?, ?, ?)",
-                  (election_id, ledger_index, vote_hash, prev_hash, block_hash, block_header["timestamp"]))
-
-        # Mark OVT as spent
-        c.execute("UPDATE ovt_tokens SET status=? WHERE ovt_uuid=?", ("spent", ovt_uuid))
+        # One transaction per request, or a shared batch when group commit is on
+        try:
+            ack = commit_ballot({
+                "vote_id": vote_id,
+                "election_id": election_id,
+                "candidate_id": candidate_id,
+                "ciphertext": ciphertext,
+                "client_hash": client_hash,
+                "ovt_uuid": ovt_uuid,
+                "vote_hash": vote_hash,
+            })
+        except VoteRejected as e:
+            return jsonify({"error": {"code": e.code, "message": e.message}}), e.http_status
+        if not ack.get("replayed"):
+            RESULTS_CACHE.invalidate(election_id)
 
-        conn.commit()
-        conn.close()
+        ledger_index = ack["ledger_index"]
+        block_hash = ack["block_hash"]
 
-        # Mark voter as having voted (in DB)
-        c2.execute("UPDATE voter_election_status SET voted_flag=1 WHERE election_id=? AND voter_id=?", (election_id, voter_id))
-        conn2.commit()
-        conn2.close()
-
-        # Return an RSA-PSS signed receipt (restore original logic)
+        # Return a signed receipt (replays get the same receipt payload)
         receipt_payload = {
             "vote_id": vote_id,
-            "election_id": election_id,
+            "election_id": ack["election_id"],
             "ledger_index": ledger_index,
             "block_hash": block_hash
         }
         # Compute signature (use crypto if available, otherwise demo fallback)
         payload_bytes = json.dumps(receipt_payload, sort_keys=True, separators=(",", ":")).encode()
-        receipt_sig = sign_bytes_with_crypto(payload_bytes)
+        batcher = RECEIPT_BATCHER
+        if batcher is not None:
+            # Batched: "sig" covers the batch header; "batch" links the payload to its Merkle root
+            signer = CRYPTO.signer_for(requested_signature_algs())
+            batch = batcher.submit(signer, payload_bytes).result(timeout=SIGNING_TIMEOUT_S)
+            receipt_sig, sig_alg = batch.pop("sig"), signer.alg
+            batch_fields = {"batch": batch}
+        else:
+            receipt_sig, sig_alg = sign_for_client(payload_bytes)
+            batch_fields = {}
+        # Multi-vote blocks: the ballot's leaf, position and path up to the signed block_hash
+        block_fields = {k: ack[k] for k in ("vote_hash", "block_position", "merkle_path", "block") if k in ack}
 
         print(f"DEBUG: Vote stored and signed receipt ready. vote_id={vote_id}, ledger_index={ledger_index}")
         return jsonify({
             "ledger_index": ledger_index,
             "block_hash": block_hash,
+            "ack": "stored",
             "receipt": {
                 **receipt_payload,
-                "sig": receipt_sig
+                **block_fields,
+                **batch_fields,
+                "sig": receipt_sig,
+                "sig_alg": sig_alg
             }
         })
     except Exception as e:
@@ -1072,6 +1550,43 @@ def admin_verify_page():
     """Admin interface for blockchain verification"""
     return render_template('admin_verify.html')
 
+@app.route('/admin/signing-metrics', methods=['GET'])
+def signing_metrics():
+    """Signing pool queue depth, throughput and latency (workers=0 when signing inline), and receipt batching"""
+    pool = SIGNING_POOL
+    metrics = pool.stats() if pool is not None else {"workers": 0, "running": False}
+    metrics["sig_alg"] = LEDGER_SIGNATURE_ALG
+    if RECEIPT_BATCHER is not None:
+        metrics["receipt_batches"] = RECEIPT_BATCHER.stats()
+    return jsonify(metrics)
+
+@app.route('/admin/face-duplicates/scan', methods=['POST'])
+def scan_face_duplicates():
+    """Start a background scan of every pending or active voter's template for duplicate enrollments"""
+    data = request.get_json(silent=True) or {}
+    try:
+        tolerance = float(data.get("tolerance", FACE_DUPLICATE_TOLERANCE))
+    except (TypeError, ValueError):
+        return jsonify({"error":{"code":"BAD_TOLERANCE","message":"tolerance must be a number"}}), 400
+    if not FACE_DUPLICATE_SCAN.start(FACE_INDEX, tolerance, lambda pairs: save_face_duplicates(pairs, "scan")):
+        return jsonify({"error":{"code":"SCAN_RUNNING","message":"A duplicate scan is already running"}}), 409
+    return jsonify(FACE_DUPLICATE_SCAN.status()), 202
+
+@app.route('/admin/face-duplicates', methods=['GET'])
+def get_face_duplicates():
+    """Voter pairs flagged as the same face (closest first) and the state of the last scan"""
+    try:
+        limit = min(int(request.args.get('limit', 1000)), 10000)
+    except ValueError:
+        return jsonify({"error":{"code":"BAD_LIMIT","message":"limit must be an integer"}}), 400
+    conn = get_db()
+    try:
+        pairs = face_duplicates.list_duplicates(conn.cursor(), limit)
+    finally:
+        conn.close()
+    return jsonify({"tolerance": FACE_DUPLICATE_TOLERANCE, "action": FACE_DUPLICATE_ACTION,
+                    "scan": FACE_DUPLICATE_SCAN.status(), "duplicates": pairs})
+
 @app.route('/admin/simulate-tampering/<election_id>', methods=['POST'])
 def simulate_tampering(election_id):
     """Simulate tampering with the blockchain for demonstration"""
@@ -1256,42 +1771,25 @@ def verify_blockchain(election_id):
         c.execute("SELECT COUNT(*) as count FROM encrypted_votes WHERE election_id = ?", (election_id,))
         total_votes = c.fetchone()["count"]
 
-        # Verify blockchain integrity
-        blocks = []
-        prev_hash = "GENESIS"
-        is_valid = True
-        invalid_block = None
+        # Verify blockchain integrity: segments are rehashed in parallel and
+        # their continuity stitched together (see verify_engine.py)
+        verification = verify_chain(election_id, block_rows[-1]["ledger_index"])
+        invalid_indices = set(verification["invalid_indices"])
+        # Multi-vote blocks must also still match the Merkle root of their ballots
+        invalid_indices.update(vote_blocks.invalid_roots(c, election_id))
+        is_valid = not invalid_indices
+        invalid_block = max(invalid_indices) if invalid_indices else None
 
+        blocks = []
         for row in block_rows:
-            # Create block object for validation
-            block_obj = blockchain_mod.Block(
-                index=row["ledger_index"],
-                timestamp=row["ts"],
-                vote_hash=row["vote_hash"],
-                previous_hash=row["prev_hash"]
-            )
-
-            # Check hash continuity
-            if row["prev_hash"] != prev_hash:
-                is_valid = False
-                invalid_block = row["ledger_index"]
-
-            # Check block hash validity
-            if row["hash"] != block_obj.hash:
-                is_valid = False
-                invalid_block = row["ledger_index"]
-
-            # Add block to response
             blocks.append({
                 "index": row["ledger_index"],
                 "hash": row["hash"],
                 "timestamp": row["ts"],
                 "votes_in_block": row["votes_in_block"],
-                "is_valid": row["prev_hash"] == prev_hash and row["hash"] == block_obj.hash
+                "is_valid": row["ledger_index"] not in invalid_indices
             })
 
-            prev_hash = row["hash"]
-
         # Prepare response
         response = {
             "status": "valid" if is_valid else "tampered",
@@ -1398,7 +1896,11 @@ def verify_blockchain(election_id):
 
 @app.route('/elections/<election_id>/progress', methods=['GET'])
 def election_progress(election_id):
-    """Get real-time election progress and verification stats"""
+    """Get real-time election progress and verification stats
+
+    The ledger is verified incrementally from the last verified checkpoint;
+    ?full=true re-verifies every block from GENESIS.
+    """
     try:
         conn = get_db()
         c = conn.cursor()
@@ -1418,13 +1920,14 @@ def election_progress(election_id):
         """, (election_id,))
         voter_stats = c.fetchone()
 
-        # Get blockchain stats
+        # Get blockchain stats from the tip block (ledger indexes are contiguous from 0)
         c.execute("""
-            SELECT COUNT(*) as block_count, MAX(ts) as last_block_time
+            SELECT ledger_index + 1 as block_count, ts as last_block_time
             FROM ledger_blocks 
             WHERE election_id = ?
+            ORDER BY ledger_index DESC LIMIT 1
         """, (election_id,))
-        blockchain_stats = c.fetchone()
+        blockchain_stats = c.fetchone() or {"block_count": 0, "last_block_time": None}
 
         # Calculate turnout
         total_voters = voter_stats["total_voters"] or 0
@@ -1443,6 +1946,8 @@ def election_progress(election_id):
         """, (election_id, six_hours_ago))
         activity = c.fetchall()
 
+        full = request.args.get('full', 'false').lower() == 'true'
+        verification = verify_checkpoint.verify(conn, election_id, full=full)
         conn.close()
 
         return jsonify({
@@ -1458,8 +1963,12 @@ def election_progress(election_id):
             },
             "voting_timeline": [dict(row) for row in activity],
             "verification": {
-                "blockchain_intact": verify_blockchain(election_id).json["status"] == "valid",
-                "total_blocks_verified": blockchain_stats["block_count"]
+                "blockchain_intact": verification["status"] == "valid",
+                "total_blocks_verified": verification["verified_blocks"],
+                "newly_verified": verification["checked"],
+                "invalid_block": verification["invalid_block"],
+                "prefix_digest": verification["prefix_digest"],
+                "mode": verification["mode"]
             }
         })
 
@@ -1496,37 +2005,431 @@ def health_check():
     })
 
 
+def _proof_chunks(ledger, lo, hi, ndjson, tail=None):
+    """Blocks lo..hi from the ledger file, PROOF_STREAM_BLOCKS at a time, as NDJSON or inside a JSON object."""
+    if not ndjson:
+        yield b'{"blocks":['
+    for start in range(lo, hi + 1, PROOF_STREAM_BLOCKS):
+        lines = ledger.read_range(start, min(start + PROOF_STREAM_BLOCKS - 1, hi))
+        if not lines:
+            break
+        if ndjson:
+            yield lines
+        else:
+            yield (b"," if start > lo else b"") + lines[:-1].replace(b"\n", b",")
+    if not ndjson:
+        # The remaining keys, already sorted after "blocks"
+        yield b"]," + json.dumps(tail, sort_keys=True, separators=(",", ":")).encode()[1:]
+
+
+def _gzip_chunks(chunks):
+    compressor = zlib.compressobj(PROOF_GZIP_LEVEL, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
 @app.route('/elections/<election_id>/proof', methods=['GET'])
 def get_election_proof(election_id):
-    """Return ledger blocks (proof) for an election"""
+    """Return ledger blocks (proof) for an election, streamed from its ledger file
+
+    Query parameters:
+    - after_index, limit: cursor pagination (blocks with ledger_index > after_index,
+      at most PROOF_PAGE_MAX); the page says next_after_index and has_more
+    - format=ndjson: one block per line instead of a JSON object
+
+    Responses are gzip-compressed when the client accepts it. The NDJSON form of the whole
+    ledger also answers Range requests with bytes of the append-only ledger.jsonl, so a
+    follower can sync incrementally with Range: bytes=<bytes it already has>-.
+    """
     # Verify election exists
     found = find_election(election_id)
     if not found:
         return jsonify({"error": {"code": "NOT_FOUND", "message": "Election not found"}}), 404
 
+    after_index = request.args.get('after_index')
+    limit = request.args.get('limit')
+    ndjson = request.args.get('format', '').lower() == 'ndjson' or request.accept_mimetypes.best == 'application/x-ndjson'
+    paged = after_index is not None or limit is not None
+    try:
+        after_index = int(after_index) if after_index is not None else -1
+        limit = int(limit) if limit is not None else PROOF_PAGE_MAX
+    except ValueError:
+        return jsonify({"error": {"code": "BAD_REQUEST", "message": "after_index and limit must be integers"}}), 400
+    if after_index < -1 or limit < 1:
+        return jsonify({"error": {"code": "BAD_REQUEST", "message": "after_index must be >= -1 and limit >= 1"}}), 400
+    limit = min(limit, PROOF_PAGE_MAX)
+
     conn = get_db()
-    c = conn.cursor()
-    c.execute("SELECT ledger_index, vote_hash, prev_hash, hash, ts FROM ledger_blocks WHERE election_id=? ORDER BY ledger_index", (election_id,))
-    rows = c.fetchall()
-    conn.close()
-    blocks = []
-    for r in rows:
-        blocks.append({
-            "ledger_index": r[0],
-            "vote_hash": r[1],
-            "prev_hash": r[2],
-            "hash": r[3],
-            "ts": r[4]
-        })
-    return jsonify({"election_id": election_id, "blocks": blocks})
+    try:
+        c = conn.cursor()
+        # Catch the ledger file up with anything committed since the last append
+        LEDGER_FILES.sync(c, election_id)
+    finally:
+        conn.close()
+    ledger = LEDGER_FILES.open(election_id)
+    count = ledger.count
+
+    headers = {"Accept-Ranges": "bytes" if ndjson and not paged else "none", "Vary": "Accept-Encoding"}
+    mimetype = "application/x-ndjson" if ndjson else "application/json"
+    if ndjson and not paged and request.range is not None:
+        # Byte ranges of ledger.jsonl: stable, because the file is append-only
+        length = ledger.byte_length()
+        byte_range = request.range.range_for_length(length)
+        if byte_range is None:
+            return app.response_class(b"", status=416, headers={**headers, "Content-Range": f"bytes */{length}"})
+        start, stop = byte_range
+        return app.response_class(ledger.read_bytes(start, stop), status=206, mimetype=mimetype,
+                                  headers={**headers, "Content-Range": f"bytes {start}-{stop - 1}/{length}"})
+
+    lo = after_index + 1
+    hi = min(lo + limit - 1, count - 1) if paged else count - 1
+    tail = {"election_id": election_id}
+    if paged:
+        tail.update(next_after_index=max(hi, after_index), has_more=hi < count - 1)
+    # Blocks go out as the file's own bytes, a chunk at a time, never as one big list
+    chunks = _proof_chunks(ledger, lo, hi, ndjson, tail)
+    if 'gzip' in request.accept_encodings:
+        chunks = _gzip_chunks(chunks)
+        headers["Content-Encoding"] = "gzip"
+    return app.response_class(chunks, mimetype=mimetype, headers=headers)
+
+
+def _feed_events(ledger, election_id, after_index):
+    """Server-sent events: one "block" event per block (id = ledger_index), "reset" if the ledger shrinks."""
+    deadline = time.monotonic() + FEED_SSE_MAX_SECONDS
+    while True:
+        tip = min(LEDGER_FEED.wait(election_id, after_index, FEED_HEARTBEAT_SECONDS), ledger.count - 1)
+        if tip < after_index:
+            yield f"event: reset\ndata: {json.dumps({'tip_index': tip})}\n\n".encode()
+            return
+        if tip > after_index:
+            lines = ledger.read_range(after_index + 1, min(tip, after_index + FEED_PAGE_MAX)).splitlines()
+            yield b"".join(b"id: %d\nevent: block\ndata: %s\n\n" % (after_index + 1 + i, line)
+                           for i, line in enumerate(lines))
+            after_index += len(lines)
+        else:
+            yield b": keep-alive\n\n"
+        if time.monotonic() >= deadline:
+            return
+
+
+@app.route('/elections/<election_id>/feed', methods=['GET'])
+def get_ledger_feed(election_id):
+    """Change feed of ledger blocks for read-only followers (see auditor/follower.py)
+
+    Query parameters:
+    - after_index: the last ledger_index the follower has (default -1)
+    - wait: seconds to long-poll for new blocks when there are none yet (default 0, max FEED_MAX_WAIT_SECONDS)
+    - limit: most blocks per response (max FEED_PAGE_MAX)
+
+    With Accept: text/event-stream (or stream=sse) the response is a server-sent event stream
+    that resumes after the Last-Event-ID header. A tip_index below after_index means the
+    ledger was reset and the follower must start over.
+    """
+    found = find_election(election_id)
+    if not found:
+        return jsonify({"error": {"code": "NOT_FOUND", "message": "Election not found"}}), 404
+    try:
+        after_index = int(request.headers.get('Last-Event-ID') or request.args.get('after_index', -1))
+        wait = float(request.args.get('wait', 0))
+        limit = int(request.args.get('limit', FEED_PAGE_MAX))
+    except ValueError:
+        return jsonify({"error": {"code": "BAD_REQUEST", "message": "after_index, wait and limit must be numbers"}}), 400
+    if after_index < -1 or limit < 1 or wait < 0:
+        return jsonify({"error": {"code": "BAD_REQUEST", "message": "after_index must be >= -1, limit >= 1 and wait >= 0"}}), 400
+
+    conn = get_db()
+    try:
+        # Blocks committed by another process (or before a restart) reach the file here
+        sync_ledger_files(conn.cursor(), [election_id])
+    finally:
+        conn.close()
+    ledger = LEDGER_FILES.open(election_id)
+
+    if request.args.get('stream') == 'sse' or request.accept_mimetypes.best == 'text/event-stream':
+        return app.response_class(_feed_events(ledger, election_id, after_index), mimetype="text/event-stream",
+                                  headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+    tip = LEDGER_FEED.tip(election_id)
+    if tip == after_index and wait > 0:
+        tip = LEDGER_FEED.wait(election_id, after_index, min(wait, FEED_MAX_WAIT_SECONDS))
+    tip = min(tip, ledger.count - 1)
+    hi = min(tip, after_index + min(limit, FEED_PAGE_MAX))
+    blocks = ledger.json_array(after_index + 1, hi) if tip > after_index else b"[]"
+    tail = {"election_id": election_id, "next_after_index": max(hi, after_index) if tip >= after_index else tip,
+            "tip_index": tip}
+    body = b'{"blocks":%s,%s' % (blocks, json.dumps(tail, sort_keys=True, separators=(",", ":")).encode()[1:])
+    return app.response_class(body, mimetype="application/json")
 
 
-from server_backend.crypto import paillier_server
-from phe import paillier
+def _ndjson(record):
+    return json.dumps(record, sort_keys=True, separators=(",", ":")).encode() + b"\n"
+
+
+def _bundle_chunks(election_id, header):
+    """Proof bundle records, every section read from one snapshot of the database (see auditor/bundle.py)."""
+    conn = get_db()
+    try:
+        c = conn.cursor()
+        c.execute("BEGIN")
+        yield _ndjson(header)
+
+        def section(name, count_sql, rows_sql, encode):
+            count = c.execute(count_sql, (election_id,)).fetchone()[0]
+            yield _ndjson({"section": name, "count": count})
+            rows = conn.cursor()
+            rows.execute(rows_sql, (election_id,))
+            while True:
+                page = rows.fetchmany(PROOF_STREAM_BLOCKS)
+                if not page:
+                    break
+                yield b"".join(encode(row) for row in page)
+            rows.close()
+
+        checkpoint_fields = ("start_index", "end_index", "merkle_root", "last_hash", "ts", "signature")
+        yield from section("checkpoints", "SELECT COUNT(*) FROM merkle_checkpoints WHERE election_id=?",
+                           f"SELECT {', '.join(checkpoint_fields)} FROM merkle_checkpoints WHERE election_id=? ORDER BY start_index",
+                           lambda r: _ndjson(dict(zip(checkpoint_fields, r), election_id=election_id)))
+        yield from section("blocks", "SELECT COUNT(*) FROM ledger_blocks WHERE election_id=?",
+                           "SELECT ledger_index, vote_hash, prev_hash, hash, ts FROM ledger_blocks WHERE election_id=? ORDER BY ledger_index",
+                           lambda r: encode_block({"ledger_index": r[0], "vote_hash": r[1], "prev_hash": r[2], "hash": r[3],
+                                                   "ts": r[4]}))
+        # Ballots go out without their candidate_id: with the published salt anyone holding a receipt
+        # can find its ciphertext here, so a label next to it would reveal the vote (receipt-freeness).
+        # Who got what is only published as the per-candidate sums in the tally section.
+        yield from section("ballots", "SELECT COUNT(*) FROM encrypted_votes WHERE election_id=?",
+                           """SELECT ledger_index, block_position, ciphertext FROM encrypted_votes
+                              WHERE election_id=? ORDER BY ledger_index, block_position""",
+                           lambda r: _ndjson({"ledger_index": r[0], "block_position": r[1], "ciphertext": r[2]}))
+
+        # One decryption per candidate, published with a witness anyone can check against the public key.
+        # The sums cover exactly the ballots above (recounted in this snapshot if the running sums do not).
+        sums, recounted = snapshot_tally(c, election_id)
+        tally = []
+        for candidate_id, (encrypted_sum, ballots) in sorted(sums.items()):
+            record = {"candidate_id": candidate_id, "ballots": ballots, "encrypted_sum": None,
+                      "encoding": None, "witness": None, "votes": None}
+            if encrypted_sum is not None:
+                encoding, witness = PAILLIER_KEY.decryption_witness(encrypted_sum)
+                record.update(encrypted_sum=str(encrypted_sum), encoding=str(encoding), witness=str(witness))
+                try:
+                    record["votes"] = PAILLIER_KEY.decode(encoding)
+                except (ValueError, OverflowError):
+                    pass
+            tally.append(record)
+        yield _ndjson({"section": "tally", "count": len(tally)})
+        yield b"".join(_ndjson(record) for record in tally)
+        conn.commit()
+    finally:
+        conn.close()
+    if recounted is not None:
+        save_recount(election_id, sums, recounted)
+
+
+@app.route('/elections/<election_id>/proof-bundle', methods=['GET'])
+def get_proof_bundle(election_id):
+    """Everything an offline auditor needs (auditor/cli.py), as NDJSON
+
+    A header line (election, Paillier modulus, ledger public key, vote_hash salt) followed
+    by the checkpoints, blocks, ballots and tally sections, each announced by a
+    {"section": name, "count": n} line. Gzip-compressed when the client accepts it.
+    """
+    found = find_election(election_id)
+    if not found:
+        return jsonify({"error": {"code": "NOT_FOUND", "message": "Election not found"}}), 404
+    election_id = found.get('election_id')
+
+    header = {
+        "bundle": "ballotguard-proof",
+        "version": 2,
+        "election_id": election_id,
+        "status": found.get('status'),
+        "generated_at": time.time(),
+        "paillier_n": str(PAILLIER_N),
+        "ledger_public_key": CRYPTO.ledger.public_pem().decode() if CRYPTO else None,
+        "ledger_signature_alg": LEDGER_SIGNATURE_ALG,
+        "election_salt": get_election_salt(election_id),
+        "checkpoint_interval": CHECKPOINT_INTERVAL,
+    }
+    headers = {"Vary": "Accept-Encoding",
+               "Content-Disposition": f'attachment; filename="proof_bundle_{election_id}.ndjson"'}
+    chunks = _bundle_chunks(election_id, header)
+    if 'gzip' in request.accept_encodings:
+        chunks = _gzip_chunks(chunks)
+        headers["Content-Encoding"] = "gzip"
+    return app.response_class(chunks, mimetype="application/x-ndjson", headers=headers)
+
+
+@app.route('/elections/<election_id>/inclusion-proof', methods=['GET'])
+def get_inclusion_proof(election_id):
+    """Merkle inclusion proof for one ballot against its signed checkpoint.
+
+    Query parameters (one of):
+    - vote_id: the receipt's vote_id
+    - ledger_index: the receipt's ledger_index
+    """
+    vote_id = request.args.get('vote_id')
+    ledger_index = request.args.get('ledger_index', type=int)
+    if vote_id is None and ledger_index is None:
+        return jsonify({"error": {"code": "BAD_REQUEST", "message": "vote_id or ledger_index is required"}}), 400
+
+    conn = get_db()
+    try:
+        c = conn.cursor()
+        block_position = None
+        if vote_id is not None:
+            c.execute("SELECT ledger_index, block_position FROM encrypted_votes WHERE election_id=? AND vote_id=?", (election_id, vote_id))
+            row = c.fetchone()
+            if row is None:
+                return jsonify({"error": {"code": "NOT_FOUND", "message": "Vote not found"}}), 404
+            ledger_index, block_position = row[0], row[1]
+        c.execute("SELECT ledger_index, vote_hash, prev_hash, hash, ts FROM ledger_blocks WHERE election_id=? AND ledger_index=?",
+                  (election_id, ledger_index))
+        block = c.fetchone()
+        if block is None:
+            return jsonify({"error": {"code": "NOT_FOUND", "message": "Ledger block not found"}}), 404
+
+        start_index = merkle_checkpoint.window_start(ledger_index, CHECKPOINT_INTERVAL)
+        checkpoint = merkle_checkpoint.load(c, election_id, start_index)
+        if checkpoint is None:
+            # Ledgers written before checkpoints existed get theirs on first request
+            end_index = start_index + CHECKPOINT_INTERVAL - 1
+            c.execute("BEGIN IMMEDIATE")
+            try:
+                checkpoint = merkle_checkpoint.load(c, election_id, start_index)
+                if checkpoint is None:
+                    c.execute("SELECT hash, ts FROM ledger_blocks WHERE election_id=? AND ledger_index=?", (election_id, end_index))
+                    last = c.fetchone()
+                    if last is not None:
+                        checkpoint = merkle_checkpoint.create(c, election_id, start_index, end_index, last[0],
+                                                              last[1], sign_ledger_bytes)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        if checkpoint is None:
+            return jsonify({"error": {"code": "NOT_CHECKPOINTED",
+                                      "message": f"Block {ledger_index} is not covered by a checkpoint yet"}}), 409
+        proof = merkle_checkpoint.inclusion_proof(c, checkpoint, ledger_index)
+        # In a multi-vote block the ballot's own leaf and path up to the block's root
+        ballot = vote_blocks.ballot_proof(c, election_id, ledger_index, block_position) if block_position is not None else None
+    finally:
+        conn.close()
+
+    signature = checkpoint.pop("signature")
+    response = {
+        "election_id": election_id,
+        "block": {
+            "ledger_index": block[0],
+            "vote_hash": block[1],
+            "prev_hash": block[2],
+            "hash": block[3],
+            "ts": block[4]
+        },
+        "checkpoint": checkpoint,
+        "signature": signature,
+        "sig_alg": LEDGER_SIGNATURE_ALG,
+        "leaf_index": ledger_index - checkpoint["start_index"],
+        "proof": proof
+    }
+    if ballot:
+        response["ballot"] = ballot
+    return jsonify(response)
+
+
+def results_response(entry):
+    """Serve a cached results body; answers If-None-Match with 304."""
+    resp = app.response_class(entry.body, mimetype='application/json')
+    resp.set_etag(entry.etag)
+    resp.headers['Cache-Control'] = 'no-cache'
+    return resp.make_conditional(request)
+
+
+def report_tally_progress(done, total):
+    pct = (done / total * 100) if total else 100.0
+    print(f"  ⏳ Tally progress: {done:,}/{total:,} ballots ({pct:.0f}%)")
+
+
+def admin_authorized():
+    """True when the request carries the configured ADMIN_TOKEN (never when none is configured)."""
+    if not ADMIN_TOKEN:
+        return False
+    return hmac.compare_digest(request.headers.get('Authorization', '').encode(), f"Bearer {ADMIN_TOKEN}".encode())
+
+
+def snapshot_tally(c, election_id, recount=False, progress=None):
+    """Per-candidate encrypted sums as of the caller's read transaction: (sums, recounted).
+
+    When asked to, or when the running sums do not cover every stored ballot,
+    the ballots are re-summed from encrypted_votes (reads only, so /votes
+    keeps committing meanwhile) and `recounted` is the ballot count to pass to
+    save_recount(); otherwise it is None.
+    """
+    if not recount and tally_accumulator.is_consistent(c, election_id):
+        return tally_accumulator.load(c, election_id), None
+
+    def recount_on(pool):
+        return tally_accumulator.recount(c, election_id, PAILLIER_NSQUARE, workers=VERIFY_POOL_WORKERS, pool=pool,
+                                         page_size=TALLY_PAGE_SIZE, progress=progress,
+                                         progress_every=TALLY_PROGRESS_EVERY)
+
+    # Large recounts fold on the shared verification pool, replaced once if a worker died
+    try:
+        return recount_on(start_verify_pool())
+    except BrokenProcessPool:
+        stop_verify_pool()
+        return recount_on(start_verify_pool())
+
+
+def save_recount(election_id, sums, ballots):
+    """Swap recounted sums in with a short write transaction; skipped (False) if ballots were stored since."""
+    conn = get_db()
+    try:
+        c = conn.cursor()
+        c.execute("BEGIN IMMEDIATE")
+        replaced = tally_accumulator.replace(c, election_id, sums, ballots)
+        conn.commit()
+        return replaced
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
 
 @app.route('/elections/<election_id>/results', methods=['GET'])
 def get_election_results(election_id):
-    """Tally votes for an election using homomorphic encryption."""
+    """Tally votes for an election using homomorphic encryption.
+
+    Query parameter:
+    - recount=true re-sums every stored ciphertext (in parallel for large
+      elections) instead of trusting the running sums; admin only
+      (Authorization: Bearer <ADMIN_TOKEN>)
+
+    Responses are cached per ledger tip (permanently once the election is
+    closed) and carry an ETag; a matching If-None-Match gets 304.
+    """
+    recount = request.args.get('recount', 'false').lower() == 'true'
+    if recount and not admin_authorized():
+        return jsonify({"error": {"code": "FORBIDDEN", "message": "recount requires admin authorization"}}), 403
+    cache_key = _normalize_eid(str(election_id))
+    if not recount:
+        tip = LEDGER_TIPS.peek(cache_key)
+        if tip is None:
+            conn = get_db()
+            try:
+                tip = LedgerTipCache.read_tip(conn.cursor(), cache_key)
+            finally:
+                conn.close()
+        cached = RESULTS_CACHE.get(cache_key, tip)
+        if cached is not None:
+            return results_response(cached)
+    # Read before tallying so an invalidation during the tally is not lost
+    generation = RESULTS_CACHE.generation(cache_key)
+
     found = find_election(election_id)
     if not found:
         return jsonify({"error": {"code": "NOT_FOUND", "message": "Election not found"}}), 404
@@ -1541,75 +2444,43 @@ def get_election_results(election_id):
     # Build candidate map id -> name
     cand_map = {c.get('candidate_id') or c.get('id') or str(i): c.get('name') for i, c in enumerate(candidates)}
 
-    # Get encrypted votes from database
+    # Per-candidate encrypted sums (recounted from encrypted_votes if asked or out of date),
+    # tip and eligibility from one read snapshot; a recount never holds the write lock
     conn = get_db()
     c = conn.cursor()
-    c.execute("SELECT candidate_id, ciphertext FROM encrypted_votes WHERE election_id=?", (found.get('election_id'),))
-    rows = c.fetchall()
-    conn.close()
-
-    # Initialize Paillier cryptosystem
     try:
-        public_key = paillier.PaillierPublicKey(PAILLIER_N)
-        private_key = paillier.PaillierPrivateKey(public_key, PAILLIER_P, PAILLIER_Q)
-    except Exception as e:
-        return jsonify({"error": {"code": "CRYPTO_ERROR", "message": f"Error initializing cryptosystem: {str(e)}"}}), 500
-
-    # Group encrypted votes by candidate
-    candidate_votes = {}
-    for row in rows:
-        cid = row[0]
-        cipher_str = row[1]
-        if cid not in candidate_votes:
-            candidate_votes[cid] = []
+        c.execute("BEGIN")
+        encrypted_sums, recounted = snapshot_tally(c, found.get('election_id'), recount, progress=report_tally_progress)
+        tip = LedgerTipCache.read_tip(c, found.get('election_id'))
+        c.execute("SELECT COUNT(*) FROM voter_election_status WHERE election_id=? AND status='active'",
+                  (found.get('election_id'),))
+        eligible_voters = c.fetchone()[0]
+        conn.commit()
+    finally:
+        conn.close()
+    if recounted is not None:
+        save_recount(found.get('election_id'), encrypted_sums, recounted)
+
+    def decrypt_sum(cid):
+        encrypted_sum, _ = encrypted_sums.get(cid, (None, 0))
+        if encrypted_sum is None:
+            return 0
         try:
-            # Deserialize encrypted vote - convert string to integer
-            if cipher_str and cipher_str != "mock_encrypted_vote":
-                cipher_int = int(cipher_str)
-                enc_vote = paillier.EncryptedNumber(public_key, cipher_int)
-                candidate_votes[cid].append(enc_vote)
-                print(f"✅ Successfully loaded vote for candidate {cid}")
-            else:
-                print(f"⚠️ Skipping mock/invalid vote for candidate {cid}")
-        except ValueError as e:
-            print(f"❌ ValueError deserializing vote for candidate {cid}: {e}, ciphertext: {cipher_str[:50]}")
-            continue
+            return PAILLIER_KEY.decrypt(encrypted_sum)
         except Exception as e:
-            print(f"❌ Error deserializing vote for candidate {cid}: {e}")
-            continue
+            print(f"  ❌ Could not decrypt sum for candidate {cid}: {e}")
+            return 0
 
-    # Calculate encrypted sums and decrypt
+    # Decrypt one running sum per candidate
     results_list = []
     total_votes = 0
     
     print(f"\n🔢 Tallying votes for election {found.get('election_id')}")
-    print(f"📊 Candidates to tally: {[c.get('name') for c in candidates]}")
-    print(f"📦 Encrypted votes by candidate: {[(cid, len(votes)) for cid, votes in candidate_votes.items()]}")
+    print(f"📦 Ballots by candidate: {[(cid, ballots) for cid, (_, ballots) in encrypted_sums.items()]}")
 
     for c_idx, cand in enumerate(candidates):
         cid = cand.get('candidate_id') or f"C{c_idx+1}"
-        encrypted_votes = candidate_votes.get(cid, [])
-        
-        print(f"\n  Candidate: {cand.get('name')} (ID: {cid})")
-        print(f"  Encrypted votes found: {len(encrypted_votes)}")
-        
-        if encrypted_votes:
-            # Homomorphically sum encrypted votes
-            sum_votes = encrypted_votes[0]
-            for vote in encrypted_votes[1:]:
-                sum_votes += vote
-            
-            # Decrypt sum
-            try:
-                vote_count = private_key.decrypt(sum_votes)
-                print(f"  ✅ Decrypted vote count: {vote_count}")
-            except Exception as e:
-                print(f"  ❌ Could not decrypt sum for candidate {cid}: {e}")
-                vote_count = 0
-        else:
-            vote_count = 0
-            print(f"  ⚠️ No votes found")
-            
+        vote_count = decrypt_sum(cid)
         total_votes += vote_count
 
         # Calculate percentage
@@ -1622,31 +2493,12 @@ def get_election_results(election_id):
             'percentage': pct
         })
 
-    # Get eligible voters count
-    conn = get_db()
-    c = conn.cursor()
-    c.execute("SELECT COUNT(*) FROM voter_election_status WHERE election_id=? AND status='active'", 
-             (found.get('election_id'),))
-    eligible_voters = c.fetchone()[0]
-    conn.close()
-
     turnout = (total_votes / eligible_voters * 100) if eligible_voters else 0.0
 
     # Add any write-in candidates that weren't in original candidate list
-    for cid in candidate_votes.keys():
+    for cid in encrypted_sums.keys():
         if not any(r['candidate_id'] == cid for r in results_list):
-            encrypted_votes = candidate_votes[cid]
-            if encrypted_votes:
-                sum_votes = encrypted_votes[0]
-                for vote in encrypted_votes[1:]:
-                    sum_votes += vote
-                try:
-                    vote_count = private_key.decrypt(sum_votes)
-                except Exception:
-                    vote_count = 0
-            else:
-                vote_count = 0
-                
+            vote_count = decrypt_sum(cid)
             pct = (vote_count / total_votes * 100) if total_votes else 0.0
             results_list.append({
                 'candidate_id': cid,
@@ -1667,14 +2519,16 @@ def get_election_results(election_id):
             # Tie - return list
             winner = { 'tie': True, 'winners': winners }
 
-    return jsonify({
+    body = jsonify({
         'election_id': found.get('election_id'),
         'total_votes': total_votes,
         'eligible_voters': eligible_voters,
         'turnout_percentage': turnout,
         'results': results_list,
         'winner': winner
-    })
+    }).get_data()
+    final = found.get('status') in ('closed', 'archived')
+    return results_response(RESULTS_CACHE.put(found.get('election_id'), tip, body, final=final, generation=generation))
 
 if __name__ == '__main__':
     print("🗳️  BallotGuard Dummy Server Starting...")
@@ -1683,6 +2537,8 @@ if __name__ == '__main__':
     print("   GET  /elections")
     print("   GET  /elections/<id>")
     print("   GET  /elections/<id>/proof")
+    print("   GET  /elections/<id>/feed")
+    print("   GET  /elections/<id>/proof-bundle")
     print("   POST /elections")
     print("   POST /elections/<id>/<action>")
     print("   POST /voters/enroll")
@@ -1691,5 +2547,9 @@ if __name__ == '__main__':
     print("   POST /ovt/issue")
     print("   POST /votes")
     print("   GET  /health")
+    print("   GET  /admin/signing-metrics")
     print("-" * 50)
+    if SIGNING_WORKERS > 0 and os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        # Only in the process that serves requests, not in the debug reloader's watcher
+        start_signing_pool()
     app.run(host='127.0.0.1', port=8443, debug=True)
\ No newline at end of file
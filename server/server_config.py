@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 # Path to your key folder
@@ -72,3 +73,100 @@ PAILLIER_Q = paillier_priv_json["q"]
 # from phe import paillier
 # paillier_pubkey = paillier.PaillierPublicKey(PAILLIER_N)
 # paillier_privkey = paillier.PaillierPrivateKey(paillier_pubkey, PAILLIER_P, PAILLIER_Q)
+
+# SQLite connection pool tuning (see server_backend/db/pool.py)
+DB_POOL_MAX_IDLE = 32               # idle connections kept open for reuse
+DB_BUSY_TIMEOUT_MS = 5000           # wait this long on a locked database before failing
+DB_MMAP_SIZE = 256 * 1024 * 1024    # bytes of the database file to memory-map
+DB_STATEMENT_CACHE = 256            # prepared statements cached per connection
+
+# Group-commit vote ingestion (see server_backend/db/group_commit.py).
+# When enabled, /votes handlers hand ballots to one writer thread that commits
+# them in batches; each batch commit is fsynced once with synchronous=FULL.
+VOTE_GROUP_COMMIT = False
+GROUP_COMMIT_MAX_BATCH = 64         # ballots per transaction
+GROUP_COMMIT_MAX_WAIT_MS = 5        # how long the writer waits to fill a batch
+GROUP_COMMIT_SYNCHRONOUS = "FULL"   # PRAGMA synchronous for the writer connection
+GROUP_COMMIT_TIMEOUT_S = 30         # how long a handler waits for its batch
+
+# Results tally (see server_backend/crypto/tally_engine.py). A recount streams
+# encrypted_votes in pages of this many rows instead of loading them all.
+TALLY_PAGE_SIZE = 2048
+TALLY_PROGRESS_EVERY = 50000        # log progress every this many ballots
+
+# Shared secret for admin-only operations (currently /results?recount=true):
+# requests must send "Authorization: Bearer <token>". Taken from the
+# BALLOTGUARD_ADMIN_TOKEN environment variable; unset, those operations are
+# refused.
+ADMIN_TOKEN = os.environ.get("BALLOTGUARD_ADMIN_TOKEN") or None
+
+# Signed Merkle checkpoints (see server_backend/blockchain/merkle_checkpoint.py):
+# every this many blocks the ledger window's vote_hash Merkle root is signed,
+# so receipts can be checked with an O(log n) inclusion proof.
+CHECKPOINT_INTERVAL = 50
+
+# Parallel chain verification (see server_backend/blockchain/verify_engine.py).
+# Ledgers large enough to verify in segments are rehashed by one pool of this
+# many worker processes (0: one per core) that every /blockchain/verify
+# request shares, so concurrent requests queue instead of each forking a pool.
+# Tally recounts (see server_backend/crypto/tally_engine.py) use the same pool.
+VERIFY_WORKERS = 0
+
+# Multi-vote ledger blocks (see server_backend/blockchain/vote_blocks.py).
+# Above 1, the group-commit writer (started automatically) packs up to this
+# many ballots of a batch into one block over their Merkle root; receipts
+# then carry the ballot's position and inclusion path. A block can only
+# collect what one batch holds, so keep GROUP_COMMIT_MAX_BATCH >= this.
+LEDGER_VOTES_PER_BLOCK = 1
+
+# /elections/<id>/proof: most blocks per page (after_index/limit), blocks per
+# streamed chunk, and the gzip level used when the client accepts gzip.
+PROOF_PAGE_MAX = 10000
+PROOF_STREAM_BLOCKS = 4096
+PROOF_GZIP_LEVEL = 6
+
+# /elections/<id>/feed: most blocks per response or SSE batch, longest
+# long-poll wait, SSE keep-alive interval and how long one SSE stream runs
+# before the follower reconnects (with Last-Event-ID).
+FEED_PAGE_MAX = 1000
+FEED_MAX_WAIT_SECONDS = 30
+FEED_HEARTBEAT_SECONDS = 15
+FEED_SSE_MAX_SECONDS = 300
+
+# Signature suite for OVTs, receipts and ledger checkpoints (see
+# server_backend/crypto/signers.py): "RSA-PSS-SHA256" (what deployed booths
+# verify) or "Ed25519" (far cheaper to sign). Each signature carries its
+# suite ID. The Ed25519 key is a hex seed in ED25519_SEED_FILE, created on
+# first start with the Ed25519 suite; while RSA is the default, an existing
+# seed lets clients that send X-Signature-Algs: Ed25519 get Ed25519 OVTs and
+# receipts. Ledger signatures always use the default suite, so changing it
+# mid-election leaves earlier checkpoints verifiable only with the old key.
+SIGNATURE_ALG = "RSA-PSS-SHA256"
+ED25519_SEED_FILE = KEYS_DIR / "ed25519_private.seed"
+
+# Signing worker pool (see server_backend/crypto/signing_pool.py). Above 0,
+# OVT, receipt and ledger signatures are computed in this many worker
+# processes (started with the server) instead of in the request thread;
+# GET /admin/signing-metrics shows queue depth and latency.
+SIGNING_WORKERS = 0
+SIGNING_TIMEOUT_S = 10              # how long a handler waits for its signature
+
+# Batched receipts (see server_backend/crypto/receipt_batch.py). Above 0,
+# receipts issued within this many milliseconds share one signature over the
+# Merkle root of their payloads (at most RECEIPT_BATCH_MAX per signature) and
+# carry their inclusion path in receipt["batch"]; booths need
+# signing.verify_batched_receipt to check them.
+RECEIPT_BATCH_WINDOW_MS = 0
+RECEIPT_BATCH_MAX = 256
+
+# Duplicate enrollment (see server_backend/db/face_index.py). /voters/enroll
+# looks up the nearest pending or active template; within this distance the
+# new face counts as already enrolled. "flag" (the default, so enrollment
+# behaves as before) enrolls it but records the pair for review in
+# face_duplicates (GET /admin/face-duplicates), "reject" refuses it with a
+# generic 409 DUPLICATE_VOTER, "off" skips the check. Neither response names
+# the matched voter. Tighter than the 0.5 used to verify a voter's own face,
+# since one probe is compared against every voter.
+# POST /admin/face-duplicates/scan checks the voters already enrolled.
+FACE_DUPLICATE_ACTION = "flag"
+FACE_DUPLICATE_TOLERANCE = 0.4
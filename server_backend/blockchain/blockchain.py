@@ -4,9 +4,7 @@ Each block stores: index, timestamp, vote_hash, previous_hash, hash.
 The signing of the block header is done by ledger_crypto.sign_block_header and stored alongside block.
 """
 
-import hashlib
 import time
-import json
 import os
 import sys
 
@@ -16,14 +14,16 @@ if root_dir not in sys.path:
     sys.path.insert(0, root_dir)
 
 from server_backend.crypto import ledger_crypto
+from server_backend.blockchain.header_codec import HEADER_V1_JSON, block_hash
 
 class Block:
-    def __init__(self, index, timestamp, vote_hash, previous_hash, header_signature=None):
+    def __init__(self, index, timestamp, vote_hash, previous_hash, header_signature=None, header_version=HEADER_V1_JSON):
         self.index = int(index)
         self.timestamp = float(timestamp)
         self.vote_hash = vote_hash
         self.previous_hash = previous_hash
         self.header_signature = header_signature  # bytes hex string or None
+        self.header_version = header_version  # see header_codec.py; existing ledgers are v1
         self.hash = self.compute_hash()
 
     def to_dict(self):
@@ -37,13 +37,8 @@ class Block:
         }
 
     def compute_hash(self):
-        block_string = json.dumps({
-            "index": self.index,
-            "timestamp": self.timestamp,
-            "vote_hash": self.vote_hash,
-            "previous_hash": self.previous_hash
-        }, sort_keys=True).encode()
-        return hashlib.sha256(block_string).hexdigest()
+        # Same bytes as json.dumps(header, sort_keys=True) for v1, without the generic encoder
+        return block_hash(self.index, self.timestamp, self.vote_hash, self.previous_hash, self.header_version)
 
 class Blockchain:
     def __init__(self):
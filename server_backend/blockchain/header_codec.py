@@ -0,0 +1,88 @@
+"""
+Canonical block header encodings.
+
+Version 1 (HEADER_V1_JSON) is what every existing ledger uses: the bytes of
+json.dumps({"index", "timestamp", "vote_hash", "previous_hash"}, sort_keys=True)
+with the default ", " / ": " separators. encode_v1() writes those bytes from a
+fixed template (keys already in sorted order) instead of building and sorting
+a dict through the generic encoder; strings still go through json's own
+escaper, so the output is byte-identical. Non-finite timestamps, which json
+spells NaN/Infinity, fall back to json.dumps.
+
+Version 2 (HEADER_V2_BINARY) is a compact binary header for future ledgers:
+    b"BGH" | 0x02 | index u64 | timestamp f64 | len u16 | vote_hash | len u16 | previous_hash
+(big-endian, strings UTF-8). Nothing writes v2 yet; a ledger has to record
+its header version before it can switch.
+"""
+
+import hashlib
+import json
+import math
+import struct
+from json.encoder import encode_basestring_ascii
+
+HEADER_V1_JSON = 1
+HEADER_V2_BINARY = 2
+
+_V1_TEMPLATE = '{"index": %d, "previous_hash": %s, "timestamp": %s, "vote_hash": %s}'
+_V2_MAGIC = b"BGH\x02"
+_V2_FIXED = struct.Struct(">Qd")
+_V2_LEN = struct.Struct(">H")
+
+
+def _json_header(index, timestamp, vote_hash, previous_hash):
+    return json.dumps({
+        "index": index,
+        "timestamp": timestamp,
+        "vote_hash": vote_hash,
+        "previous_hash": previous_hash
+    }, sort_keys=True).encode()
+
+
+def encode_v1(index, timestamp, vote_hash, previous_hash):
+    """Header bytes identical to the json.dumps(sort_keys=True) encoding; index int, timestamp float."""
+    if type(vote_hash) is not str or type(previous_hash) is not str or not math.isfinite(timestamp):
+        return _json_header(index, timestamp, vote_hash, previous_hash)
+    return (_V1_TEMPLATE % (index, encode_basestring_ascii(previous_hash), float.__repr__(timestamp),
+                            encode_basestring_ascii(vote_hash))).encode()
+
+
+def encode_v2(index, timestamp, vote_hash, previous_hash):
+    vote = vote_hash.encode()
+    prev = previous_hash.encode()
+    return b"".join((_V2_MAGIC, _V2_FIXED.pack(index, timestamp),
+                     _V2_LEN.pack(len(vote)), vote, _V2_LEN.pack(len(prev)), prev))
+
+
+def decode_v2(data):
+    """Inverse of encode_v2; returns (index, timestamp, vote_hash, previous_hash)."""
+    if data[:4] != _V2_MAGIC:
+        raise ValueError("not a v2 block header")
+    index, timestamp = _V2_FIXED.unpack_from(data, 4)
+    offset = 4 + _V2_FIXED.size
+    (vote_len,) = _V2_LEN.unpack_from(data, offset)
+    offset += _V2_LEN.size
+    vote_hash = data[offset:offset + vote_len].decode()
+    offset += vote_len
+    (prev_len,) = _V2_LEN.unpack_from(data, offset)
+    offset += _V2_LEN.size
+    previous_hash = data[offset:offset + prev_len].decode()
+    if offset + prev_len != len(data):
+        raise ValueError("trailing bytes after v2 block header")
+    return index, timestamp, vote_hash, previous_hash
+
+
+ENCODERS = {HEADER_V1_JSON: encode_v1, HEADER_V2_BINARY: encode_v2}
+
+
+def encode_header(index, timestamp, vote_hash, previous_hash, version=HEADER_V1_JSON):
+    try:
+        encoder = ENCODERS[version]
+    except KeyError:
+        raise ValueError(f"unknown block header version: {version!r}") from None
+    return encoder(int(index), float(timestamp), vote_hash, previous_hash)
+
+
+def block_hash(index, timestamp, vote_hash, previous_hash, version=HEADER_V1_JSON):
+    """Hex SHA-256 of the encoded header (what Block.hash holds)."""
+    return hashlib.sha256(encode_header(index, timestamp, vote_hash, previous_hash, version)).hexdigest()
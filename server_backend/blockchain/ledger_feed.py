@@ -0,0 +1,41 @@
+"""
+In-process change notifications for the ledger feed.
+
+After a commit's blocks reach the ledger file the server publishes the
+election's new last ledger_index; /elections/<id>/feed requests block in
+wait() until the ledger moves past the index their follower already has (or
+a timeout passes), then read the new blocks from the ledger file. A reset
+publishes -1, which a follower sees as the tip going backwards.
+
+Like the tip cache this is per process: it sees the commits made by this
+server process.
+"""
+
+import threading
+import time
+
+
+class LedgerFeed:
+    def __init__(self):
+        self._tips = {}
+        self._cond = threading.Condition()
+
+    def publish(self, election_id, last_index):
+        with self._cond:
+            if self._tips.get(election_id) != last_index:
+                self._tips[election_id] = last_index
+                self._cond.notify_all()
+
+    def tip(self, election_id):
+        return self._tips.get(election_id, -1)
+
+    def wait(self, election_id, after_index, timeout):
+        """Block until the tip differs from after_index (new blocks or a reset) or timeout; returns the tip."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._tips.get(election_id, -1) == after_index:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            return self._tips.get(election_id, -1)
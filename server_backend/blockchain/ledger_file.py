@@ -0,0 +1,241 @@
+"""
+Append-only per-election ledger files.
+
+Next to the ledger_blocks table the server keeps every election's blocks in
+
+    <root>/<election_id>/ledger.jsonl   one block per line (compact JSON, sorted keys)
+    <root>/<election_id>/ledger.idx     big-endian u64 byte offset of each line, by ledger_index
+
+so auditors and the proof endpoint can read any block or range of blocks by
+ledger_index through mmap, without SQLite and without parsing the lines
+before it. A line is written before its index entry; on open, a torn tail
+(a line without an index entry, or an entry whose line is incomplete) is cut
+off, so a crash can only lose the last few blocks, never corrupt the file.
+
+SQLite stays the source of truth: LedgerFileStore.sync() appends whatever
+committed blocks the file does not have yet, so a missed or failed append is
+made up by the next one. The file is an append-only copy; later edits to a
+ledger_blocks row (tampering) do not reach it.
+"""
+
+import json
+import mmap
+import os
+import struct
+import threading
+
+_OFFSET = struct.Struct(">Q")
+_FIELDS = ("ledger_index", "vote_hash", "prev_hash", "hash", "ts")
+
+
+def encode_block(block):
+    return json.dumps(block, sort_keys=True, separators=(",", ":")).encode() + b"\n"
+
+
+class LedgerFile:
+    """One election's ledger.jsonl and ledger.idx."""
+
+    def __init__(self, directory, writable=False):
+        self.directory = directory
+        self.data_path = os.path.join(directory, "ledger.jsonl")
+        self.index_path = os.path.join(directory, "ledger.idx")
+        self.writable = writable
+        self._lock = threading.RLock()
+        self._data_map = None
+        self._index_map = None
+        self._mapped = 0
+        if writable:
+            os.makedirs(directory, exist_ok=True)
+            for path in (self.data_path, self.index_path):
+                if not os.path.exists(path):
+                    open(path, "wb").close()
+        self.count = self._recover() if writable else self._readable_count()
+
+    def _readable_count(self):
+        """Blocks whose line and index entry are both complete."""
+        try:
+            data_size = os.path.getsize(self.data_path)
+            entries = os.path.getsize(self.index_path) // _OFFSET.size
+        except OSError:
+            return 0
+        if entries == 0:
+            return 0
+        with open(self.index_path, "rb") as f:
+            f.seek((entries - 1) * _OFFSET.size)
+            (last,) = _OFFSET.unpack(f.read(_OFFSET.size))
+        with open(self.data_path, "rb") as f:
+            f.seek(last)
+            line = f.readline()
+        complete = last < data_size and line.endswith(b"\n")
+        return entries if complete else entries - 1
+
+    def refresh(self):
+        """Pick up blocks another process appended since this reader opened the file."""
+        with self._lock:
+            self.count = self._readable_count()
+            return self.count
+
+    def _recover(self):
+        count = self._readable_count()
+        if count:
+            with open(self.index_path, "rb") as f:
+                f.seek((count - 1) * _OFFSET.size)
+                (last,) = _OFFSET.unpack(f.read(_OFFSET.size))
+            with open(self.data_path, "rb") as f:
+                f.seek(last)
+                end = last + len(f.readline())
+        else:
+            end = 0
+        for path, size in ((self.data_path, end), (self.index_path, count * _OFFSET.size)):
+            if os.path.getsize(path) != size:
+                with open(path, "r+b") as f:
+                    f.truncate(size)
+        return count
+
+    def append(self, blocks):
+        """Append blocks (dicts, ledger order, starting at ledger_index == count)."""
+        if not self.writable:
+            raise PermissionError("ledger file opened read-only")
+        with self._lock:
+            offset = os.path.getsize(self.data_path)
+            lines, offsets = [], []
+            for expected, block in enumerate(blocks, self.count):
+                if block["ledger_index"] != expected:
+                    raise ValueError(f"ledger file expects block {expected}, got {block['ledger_index']}")
+                line = encode_block({k: block[k] for k in _FIELDS})
+                offsets.append(_OFFSET.pack(offset))
+                lines.append(line)
+                offset += len(line)
+            if not lines:
+                return 0
+            with open(self.data_path, "ab") as f:
+                f.write(b"".join(lines))
+            with open(self.index_path, "ab") as f:
+                f.write(b"".join(offsets))
+            self.count += len(lines)
+            return len(lines)
+
+    def truncate(self):
+        with self._lock:
+            self._unmap()
+            for path in (self.data_path, self.index_path):
+                with open(path, "wb"):
+                    pass
+            self.count = 0
+
+    def _maps(self):
+        """(data, index) mmaps covering at least `count` blocks."""
+        if self._mapped < self.count or self._data_map is None:
+            self._unmap()
+            with open(self.data_path, "rb") as f:
+                self._data_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            with open(self.index_path, "rb") as f:
+                self._index_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._mapped = self.count
+        return self._data_map, self._index_map
+
+    def _unmap(self):
+        for m in (self._data_map, self._index_map):
+            if m is not None:
+                m.close()
+        self._data_map = self._index_map = None
+        self._mapped = 0
+
+    def _span(self, lo, hi):
+        """Byte range of lines lo..hi (inclusive) in ledger.jsonl."""
+        data, index = self._maps()
+        start = _OFFSET.unpack_from(index, lo * _OFFSET.size)[0]
+        if hi + 1 < self.count:
+            end = _OFFSET.unpack_from(index, (hi + 1) * _OFFSET.size)[0]
+        else:
+            end = data.find(b"\n", _OFFSET.unpack_from(index, hi * _OFFSET.size)[0]) + 1
+        return data, start, end
+
+    def read_range(self, lo=0, hi=None):
+        """Raw JSONL bytes of blocks lo..hi (inclusive, clamped to the file)."""
+        with self._lock:
+            hi = self.count - 1 if hi is None else min(hi, self.count - 1)
+            lo = max(lo, 0)
+            if self.count == 0 or lo > hi:
+                return b""
+            data, start, end = self._span(lo, hi)
+            return data[start:end]
+
+    def byte_length(self):
+        """Size of ledger.jsonl up to the end of the last complete block."""
+        with self._lock:
+            if self.count == 0:
+                return 0
+            return self._span(self.count - 1, self.count - 1)[2]
+
+    def read_bytes(self, start, stop):
+        """ledger.jsonl bytes [start, stop), clamped to the complete blocks."""
+        with self._lock:
+            stop = min(stop, self.byte_length())
+            if start >= stop:
+                return b""
+            return self._maps()[0][start:stop]
+
+    def json_array(self, lo=0, hi=None):
+        """Blocks lo..hi as the bytes of a JSON array, straight from the file."""
+        lines = self.read_range(lo, hi)
+        return b"[" + lines[:-1].replace(b"\n", b",") + b"]"
+
+    def get(self, ledger_index):
+        """One block as a dict, or None past the end of the file."""
+        if not 0 <= ledger_index < self.count:
+            return None
+        return json.loads(self.read_range(ledger_index, ledger_index))
+
+    def iter_blocks(self, lo=0, hi=None):
+        for line in self.read_range(lo, hi).splitlines():
+            yield json.loads(line)
+
+    def close(self):
+        with self._lock:
+            self._unmap()
+
+
+class LedgerFileStore:
+    """The server's ledger files under one root directory, synced from ledger_blocks."""
+
+    def __init__(self, root):
+        self.root = root
+        self._files = {}
+        self._lock = threading.Lock()
+
+    def path_for(self, election_id):
+        name = str(election_id)
+        if not name or name in (".", "..") or os.path.basename(name) != name:
+            raise ValueError(f"invalid election id for a ledger path: {election_id!r}")
+        return os.path.join(self.root, name)
+
+    def open(self, election_id):
+        with self._lock:
+            ledger = self._files.get(election_id)
+            if ledger is None:
+                ledger = self._files[election_id] = LedgerFile(self.path_for(election_id), writable=True)
+            return ledger
+
+    def sync(self, c, election_id):
+        """Append the committed blocks the file is missing; returns how many were appended."""
+        ledger = self.open(election_id)
+        with ledger._lock:
+            start = max(ledger.count - 1, 0)
+            c.execute("""SELECT ledger_index, vote_hash, prev_hash, hash, ts FROM ledger_blocks
+                         WHERE election_id=? AND ledger_index>=? ORDER BY ledger_index""", (election_id, start))
+            rows = [dict(zip(_FIELDS, row)) for row in c.fetchall()]
+            if ledger.count and (not rows or rows[0]["ledger_index"] != start):
+                # The ledger shrank under the file (reset elsewhere or another database): rebuild it
+                ledger.truncate()
+                return self.sync(c, election_id)
+            return ledger.append(rows[1:] if ledger.count else rows)
+
+    def clear(self, election_id):
+        self.open(election_id).truncate()
+
+    def close(self):
+        with self._lock:
+            for ledger in self._files.values():
+                ledger.close()
+            self._files = {}
@@ -0,0 +1,80 @@
+"""
+Merkle trees over ledger vote_hash leaves.
+
+Leaves and inner nodes are domain-separated as in RFC 6962:
+leaf = sha256(0x00 || vote_hash), node = sha256(0x01 || left || right).
+An odd node at the end of a level is promoted to the next level unchanged, so
+a proof has at most ceil(log2(n)) siblings.
+
+Proofs are lists of {"side": "left" | "right", "hash": hex} from the leaf up;
+"side" is where the sibling sits relative to the running hash.
+"""
+
+import hashlib
+
+LEAF_PREFIX = b"\x00"
+NODE_PREFIX = b"\x01"
+
+
+def leaf_hash(vote_hash):
+    return hashlib.sha256(LEAF_PREFIX + vote_hash.encode()).digest()
+
+
+def node_hash(left, right):
+    return hashlib.sha256(NODE_PREFIX + left + right).digest()
+
+
+def _next_level(level):
+    parents = [node_hash(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+    if len(level) % 2:
+        parents.append(level[-1])
+    return parents
+
+
+def tree_levels(vote_hashes):
+    """Every level of the tree as digests, leaves first and the root last."""
+    levels = [[leaf_hash(v) for v in vote_hashes]]
+    while len(levels[-1]) > 1:
+        levels.append(_next_level(levels[-1]))
+    return levels
+
+
+def merkle_root(vote_hashes):
+    """Hex root over the given vote hashes (sha256 of the empty string if there are none)."""
+    if not vote_hashes:
+        return hashlib.sha256(b"").hexdigest()
+    return tree_levels(vote_hashes)[-1][0].hex()
+
+
+def proof_from_levels(levels, index):
+    """Sibling path for leaf `index` of a tree built with tree_levels()."""
+    if not 0 <= index < len(levels[0]):
+        raise IndexError(f"leaf {index} out of range for {len(levels[0])} leaves")
+    proof = []
+    for level in levels[:-1]:
+        sibling = index ^ 1
+        if sibling < len(level):
+            proof.append({"side": "left" if sibling < index else "right", "hash": level[sibling].hex()})
+        index //= 2
+    return proof
+
+
+def inclusion_proof(vote_hashes, index):
+    """Sibling path proving vote_hashes[index] is under merkle_root(vote_hashes)."""
+    return proof_from_levels(tree_levels(vote_hashes), index)
+
+
+def root_from_proof(vote_hash, proof):
+    node = leaf_hash(vote_hash)
+    for step in proof:
+        sibling = bytes.fromhex(step["hash"])
+        node = node_hash(sibling, node) if step["side"] == "left" else node_hash(node, sibling)
+    return node.hex()
+
+
+def verify_inclusion(vote_hash, proof, root):
+    """O(log n) check that vote_hash is a leaf of the tree with this root."""
+    try:
+        return root_from_proof(vote_hash, proof) == root
+    except (KeyError, TypeError, ValueError):
+        return False
@@ -0,0 +1,97 @@
+"""
+Signed Merkle checkpoints over an election's ledger.
+
+Every `interval` blocks the ingest transaction that appends the last block of
+a window [start, start + interval) stores the Merkle root of the window's
+vote_hash leaves (see merkle.py), the hash of its last block and a server
+signature over both. A voter holding a receipt can then check that their
+ballot is in the ledger with one signed checkpoint and a log2(interval)
+sibling path instead of downloading and rehashing every block.
+
+Functions take a cursor and leave transaction control to the caller.
+"""
+
+import json
+
+from server_backend.blockchain import merkle
+
+
+def init_checkpoint_table(c):
+    c.execute('''CREATE TABLE IF NOT EXISTS merkle_checkpoints (
+        election_id TEXT,
+        start_index INTEGER,
+        end_index INTEGER,
+        merkle_root TEXT,
+        last_hash TEXT,
+        ts REAL,
+        signature TEXT,
+        PRIMARY KEY (election_id, start_index)
+    )''')
+
+
+def window_start(ledger_index, interval):
+    return ledger_index - ledger_index % interval
+
+
+def signed_payload(checkpoint):
+    """Canonical bytes the signature covers (sorted keys, compact separators)."""
+    fields = {k: checkpoint[k] for k in ("election_id", "start_index", "end_index", "merkle_root", "last_hash", "ts")}
+    return json.dumps(fields, sort_keys=True, separators=(",", ":")).encode()
+
+
+def window_leaves(c, election_id, start_index, end_index):
+    c.execute("""SELECT vote_hash FROM ledger_blocks
+                 WHERE election_id=? AND ledger_index BETWEEN ? AND ? ORDER BY ledger_index""",
+              (election_id, start_index, end_index))
+    return [r[0] for r in c.fetchall()]
+
+
+def create(c, election_id, start_index, end_index, last_hash, ts, sign=None):
+    """
+    Build, sign and store the checkpoint for one full window; returns it.
+    `sign` maps payload bytes to a base64 signature (None leaves it unsigned).
+    """
+    leaves = window_leaves(c, election_id, start_index, end_index)
+    if len(leaves) != end_index - start_index + 1:
+        raise ValueError(f"ledger window {start_index}..{end_index} of {election_id} is incomplete")
+    checkpoint = {
+        "election_id": election_id,
+        "start_index": start_index,
+        "end_index": end_index,
+        "merkle_root": merkle.merkle_root(leaves),
+        "last_hash": last_hash,
+        "ts": ts,
+    }
+    checkpoint["signature"] = sign(signed_payload(checkpoint)) if sign else None
+    c.execute("""INSERT OR REPLACE INTO merkle_checkpoints
+                 (election_id, start_index, end_index, merkle_root, last_hash, ts, signature)
+                 VALUES (?, ?, ?, ?, ?, ?, ?)""",
+              (election_id, start_index, end_index, checkpoint["merkle_root"], last_hash, ts, checkpoint["signature"]))
+    return checkpoint
+
+
+def maybe_checkpoint(c, election_id, ledger_index, block_hash, ts, interval, sign=None):
+    """Call after appending a block; checkpoints the window it completes (if any)."""
+    if interval <= 0 or (ledger_index + 1) % interval:
+        return None
+    return create(c, election_id, ledger_index + 1 - interval, ledger_index, block_hash, ts, sign)
+
+
+def load(c, election_id, start_index):
+    c.execute("""SELECT election_id, start_index, end_index, merkle_root, last_hash, ts, signature
+                 FROM merkle_checkpoints WHERE election_id=? AND start_index=?""",
+              (election_id, start_index))
+    row = c.fetchone()
+    if row is None:
+        return None
+    return dict(zip(("election_id", "start_index", "end_index", "merkle_root", "last_hash", "ts", "signature"), row))
+
+
+def clear(c, election_id):
+    c.execute("DELETE FROM merkle_checkpoints WHERE election_id=?", (election_id,))
+
+
+def inclusion_proof(c, checkpoint, ledger_index):
+    """Sibling path for a block in the checkpoint's window, from the current ledger rows."""
+    leaves = window_leaves(c, checkpoint["election_id"], checkpoint["start_index"], checkpoint["end_index"])
+    return merkle.inclusion_proof(leaves, ledger_index - checkpoint["start_index"])
@@ -0,0 +1,77 @@
+"""
+In-process cache of each election's ledger tip: (ledger_index, hash) of the
+last block in ledger_blocks.
+
+The cache is authoritative for the process that writes the ledger: the ingest
+path reads and advances it while holding the SQLite write lock (BEGIN
+IMMEDIATE), so appending a block needs no MAX(ledger_index) or prev-hash
+lookup. Any failure after an advance must call invalidate() before the
+transaction is rolled back; the next reader then reloads the tip from the DB.
+"""
+
+import threading
+
+EMPTY_TIP = (-1, "GENESIS")
+
+
+class LedgerTipCache:
+    def __init__(self):
+        self._tips = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def read_tip(c, election_id):
+        """Tip as stored in ledger_blocks (ignores the cache)."""
+        c.execute("SELECT ledger_index, hash FROM ledger_blocks WHERE election_id=? ORDER BY ledger_index DESC LIMIT 1", (election_id,))
+        row = c.fetchone()
+        return (row[0], row[1]) if row else EMPTY_TIP
+
+    def warm(self, conn):
+        """Load the tip of every election that has blocks (run once at startup)."""
+        rows = conn.execute("""
+            SELECT lb.election_id, lb.ledger_index, lb.hash
+            FROM ledger_blocks lb
+            JOIN (SELECT election_id, MAX(ledger_index) AS tip FROM ledger_blocks GROUP BY election_id) t
+              ON t.election_id = lb.election_id AND t.tip = lb.ledger_index""").fetchall()
+        with self._lock:
+            self._tips = {r[0]: (r[1], r[2]) for r in rows}
+        return len(rows)
+
+    def tip(self, c, election_id):
+        """Return (last_index, last_hash); (-1, 'GENESIS') for an empty ledger."""
+        tip = self._tips.get(election_id)
+        if tip is None:
+            tip = self.read_tip(c, election_id)
+            with self._lock:
+                self._tips[election_id] = tip
+        return tip
+
+    def peek(self, election_id):
+        """Cached tip without touching the DB; None if it is not loaded."""
+        return self._tips.get(election_id)
+
+    def next_block(self, c, election_id):
+        """Return (next_ledger_index, prev_hash) for the block about to be appended."""
+        last_index, last_hash = self.tip(c, election_id)
+        return last_index + 1, last_hash
+
+    def advance(self, election_id, ledger_index, block_hash):
+        with self._lock:
+            self._tips[election_id] = (ledger_index, block_hash)
+
+    def reset(self, election_id):
+        """Mark an election's ledger as empty (its blocks were deleted)."""
+        with self._lock:
+            self._tips[election_id] = EMPTY_TIP
+
+    def invalidate(self, election_id=None):
+        """Forget a tip (or all tips); it is reloaded from the DB on next use."""
+        with self._lock:
+            if election_id is None:
+                self._tips.clear()
+            else:
+                self._tips.pop(election_id, None)
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self._tips)
@@ -0,0 +1,150 @@
+"""
+Incremental ledger verification with a persisted verified-prefix checkpoint.
+
+For each election the table ledger_verify_checkpoints remembers the last block
+that passed verification (index and hash) and a digest of the verified prefix,
+where digest_i = sha256(digest_{i-1} + hash_i). verify() then only rehashes
+blocks appended after the checkpoint.
+
+The prefix is protected by triggers: any UPDATE or DELETE of an election's
+ledger_blocks (and an INSERT at or below the checkpoint) resets its checkpoint
+to GENESIS and bumps an epoch, so the next verify() walks the whole chain
+again. A checkpoint is only written if the epoch it was read at is unchanged.
+verify(..., full=True) ignores the checkpoint and rebuilds it from GENESIS.
+"""
+
+import hashlib
+import time
+
+from server_backend.blockchain.header_codec import block_hash as header_hash
+
+GENESIS_HASH = "GENESIS"
+EMPTY_DIGEST = ""
+
+_RESET = f"""
+    INSERT OR IGNORE INTO ledger_verify_checkpoints (election_id, verified_index, verified_hash, prefix_digest, epoch)
+    VALUES ({{row}}.election_id, -1, '{GENESIS_HASH}', '{EMPTY_DIGEST}', 0);
+    UPDATE ledger_verify_checkpoints
+    SET verified_index = -1, verified_hash = '{GENESIS_HASH}', prefix_digest = '{EMPTY_DIGEST}', epoch = epoch + 1
+    WHERE election_id = {{row}}.election_id;
+"""
+
+
+def init_checkpoint_table(c):
+    c.execute('''CREATE TABLE IF NOT EXISTS ledger_verify_checkpoints (
+        election_id TEXT PRIMARY KEY,
+        verified_index INTEGER,
+        verified_hash TEXT,
+        prefix_digest TEXT,
+        epoch INTEGER DEFAULT 0,
+        verified_at REAL
+    )''')
+    c.execute(f"""CREATE TRIGGER IF NOT EXISTS ledger_blocks_update_resets_checkpoint
+        AFTER UPDATE ON ledger_blocks BEGIN {_RESET.format(row='OLD')} END""")
+    c.execute(f"""CREATE TRIGGER IF NOT EXISTS ledger_blocks_delete_resets_checkpoint
+        AFTER DELETE ON ledger_blocks BEGIN {_RESET.format(row='OLD')} END""")
+    c.execute(f"""CREATE TRIGGER IF NOT EXISTS ledger_blocks_backfill_resets_checkpoint
+        AFTER INSERT ON ledger_blocks
+        WHEN NEW.ledger_index <= (SELECT verified_index FROM ledger_verify_checkpoints WHERE election_id = NEW.election_id)
+        BEGIN {_RESET.format(row='NEW')} END""")
+
+
+def extend_digest(digest, block_hash):
+    return hashlib.sha256((digest + block_hash).encode()).hexdigest()
+
+
+def load(c, election_id):
+    """Return (verified_index, verified_hash, prefix_digest, epoch); epoch is None if no row exists."""
+    c.execute("SELECT verified_index, verified_hash, prefix_digest, epoch FROM ledger_verify_checkpoints WHERE election_id=?",
+              (election_id,))
+    row = c.fetchone()
+    if row is None:
+        return -1, GENESIS_HASH, EMPTY_DIGEST, None
+    return row[0], row[1], row[2], row[3]
+
+
+def store(c, election_id, verified_index, verified_hash, prefix_digest, epoch, verified_at, rewind=False):
+    """
+    Write a checkpoint computed from a snapshot read at `epoch`; False if it went
+    stale. A checkpoint only moves forward unless rewind is set (full re-verify).
+    """
+    if epoch is None:
+        c.execute("""INSERT OR IGNORE INTO ledger_verify_checkpoints
+                     (election_id, verified_index, verified_hash, prefix_digest, epoch, verified_at)
+                     VALUES (?, ?, ?, ?, 0, ?)""",
+                  (election_id, verified_index, verified_hash, prefix_digest, verified_at))
+    else:
+        c.execute("""UPDATE ledger_verify_checkpoints
+                     SET verified_index=?, verified_hash=?, prefix_digest=?, verified_at=?
+                     WHERE election_id=? AND epoch=? AND (? OR verified_index<=?)""",
+                  (verified_index, verified_hash, prefix_digest, verified_at, election_id, epoch, rewind, verified_index))
+    return c.rowcount == 1
+
+
+def verify(conn, election_id, full=False, page_size=4096, now=None):
+    """
+    Verify an election's ledger from its checkpoint (or from GENESIS if full).
+
+    Returns a dict with:
+    - status: "valid" | "tampered" | "empty"
+    - invalid_block: first block that failed (None if valid)
+    - verified_index / verified_hash / prefix_digest: the verified prefix
+    - checked: blocks rehashed by this call
+    - verified_blocks: length of the verified prefix (ledger indexes start at 0)
+    - mode: "full" | "incremental"
+    """
+    c = conn.cursor()
+    c.execute("BEGIN")
+    try:
+        verified_index, verified_hash, digest, epoch = load(c, election_id)
+        start_index, start_hash, start_digest = verified_index, verified_hash, digest
+        if full:
+            verified_index, verified_hash, digest = -1, GENESIS_HASH, EMPTY_DIGEST
+        rows = conn.cursor()
+        rows.execute("""SELECT ledger_index, vote_hash, prev_hash, hash, ts FROM ledger_blocks
+                        WHERE election_id=? AND ledger_index>? ORDER BY ledger_index""",
+                     (election_id, verified_index))
+        invalid_block = None
+        checked = 0
+        while invalid_block is None:
+            page = rows.fetchmany(page_size)
+            if not page:
+                break
+            for ledger_index, vote_hash, prev_hash, block_hash, ts in page:
+                checked += 1
+                expected = header_hash(ledger_index, ts, vote_hash, prev_hash)
+                if prev_hash != verified_hash or block_hash != expected:
+                    invalid_block = ledger_index
+                    break
+                verified_index, verified_hash = ledger_index, block_hash
+                digest = extend_digest(digest, block_hash)
+        rows.close()
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+    if (verified_index, verified_hash, digest) != (start_index, start_hash, start_digest):
+        c.execute("BEGIN IMMEDIATE")
+        try:
+            store(c, election_id, verified_index, verified_hash, digest, epoch,
+                  now if now is not None else time.time(), rewind=full)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    if invalid_block is not None:
+        status = "tampered"
+    else:
+        status = "valid" if verified_index >= 0 else "empty"
+    return {
+        "status": status,
+        "invalid_block": invalid_block,
+        "verified_index": verified_index,
+        "verified_hash": verified_hash,
+        "prefix_digest": digest,
+        "checked": checked,
+        "verified_blocks": verified_index + 1,
+        "mode": "full" if full else "incremental",
+    }
@@ -0,0 +1,149 @@
+"""
+Parallel segment verification of an election's hash chain.
+
+A block's stored hash depends only on its own row (index, ts, vote_hash and
+the stored prev_hash), so rehashing is embarrassingly parallel. The chain is
+split into ledger_index ranges that worker processes read (read-only SQLite
+connections) and rehash independently, checking continuity inside their
+segment. The parent then stitches segments together: the first block of each
+segment must point at the last hash of the previous non-empty segment.
+
+A block is reported invalid exactly when verify_blockchain in server.py marks
+it invalid: its prev_hash differs from the previous row's stored hash
+(GENESIS for the first row) or its stored hash differs from its recomputed
+header hash.
+
+Workers read their segments at slightly different times; blocks appended
+past the range measured at the start are ignored.
+
+Callers that verify repeatedly (the server) pass a long-lived `pool`, so
+concurrent verifications share one bounded set of workers; without one, a
+pool is started and shut down for the call.
+"""
+
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+
+from server_backend.blockchain.header_codec import block_hash as header_hash
+
+GENESIS_HASH = "GENESIS"
+
+# Below this many blocks process start-up costs more than it saves
+PARALLEL_THRESHOLD = 20000
+DEFAULT_SEGMENT_SIZE = 50000
+
+_SELECT_RANGE = """SELECT ledger_index, ts, vote_hash, prev_hash, hash FROM ledger_blocks
+                   WHERE election_id=? AND ledger_index BETWEEN ? AND ? ORDER BY ledger_index"""
+
+
+def check_segment(rows):
+    """
+    Rehash one ordered run of (ledger_index, ts, vote_hash, prev_hash, hash) rows.
+
+    Returns (first_index, first_prev_hash, last_hash, invalid, count); the
+    first row's continuity is left to stitch().
+    """
+    invalid = []
+    first_index = first_prev = last_hash = None
+    count = 0
+    for ledger_index, ts, vote_hash, prev_hash, block_hash in rows:
+        if count == 0:
+            first_index, first_prev = ledger_index, prev_hash
+        elif prev_hash != last_hash:
+            invalid.append(ledger_index)
+            last_hash = block_hash
+            count += 1
+            continue
+        if block_hash != header_hash(ledger_index, ts, vote_hash, prev_hash):
+            invalid.append(ledger_index)
+        last_hash = block_hash
+        count += 1
+    return first_index, first_prev, last_hash, invalid, count
+
+
+def _check_db_segment(db_path, election_id, lo, hi):
+    """Worker entry point: read and check ledger_index lo..hi."""
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        return check_segment(conn.execute(_SELECT_RANGE, (election_id, lo, hi)))
+    finally:
+        conn.close()
+
+
+def stitch(segments):
+    """Join ordered segment results; returns (sorted invalid indices, block count, last hash)."""
+    invalid = set()
+    last_hash = GENESIS_HASH
+    total = 0
+    for first_index, first_prev, seg_last, seg_invalid, count in segments:
+        if count == 0:
+            continue
+        if first_prev != last_hash:
+            invalid.add(first_index)
+        invalid.update(seg_invalid)
+        last_hash = seg_last
+        total += count
+    return sorted(invalid), total, last_hash
+
+
+def _result(invalid, total, last_hash, segments, workers):
+    if total == 0:
+        status = "empty"
+    else:
+        status = "tampered" if invalid else "valid"
+    return {
+        "status": status,
+        "total_blocks": total,
+        "invalid_indices": invalid,
+        # verify_blockchain reports the last invalid block it saw
+        "invalid_block": invalid[-1] if invalid else None,
+        "first_invalid": invalid[0] if invalid else None,
+        "last_hash": last_hash,
+        "segments": segments,
+        "workers": workers,
+    }
+
+
+def _map(pool, workers, fn, *iterables):
+    if pool is not None:
+        return list(pool.map(fn, *iterables))
+    with ProcessPoolExecutor(max_workers=workers) as own_pool:
+        return list(own_pool.map(fn, *iterables))
+
+
+def verify_rows(rows, workers=None, segment_size=DEFAULT_SEGMENT_SIZE, parallel_threshold=PARALLEL_THRESHOLD,
+                pool=None):
+    """Verify an in-memory list of (ledger_index, ts, vote_hash, prev_hash, hash) rows in ledger order."""
+    rows = list(rows)
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(rows) < parallel_threshold:
+        return _result(*stitch([check_segment(rows)]), 1, 1)
+    segments = [rows[i:i + segment_size] for i in range(0, len(rows), segment_size)]
+    results = _map(pool, workers, check_segment, segments)
+    return _result(*stitch(results), len(segments), workers)
+
+
+def verify_ledger(db_path, election_id, workers=None, segment_size=DEFAULT_SEGMENT_SIZE,
+                  parallel_threshold=PARALLEL_THRESHOLD, upto=None, pool=None):
+    """Verify an election's chain in the SQLite database at db_path (up to ledger_index `upto`).
+
+    pool: executor with `workers` processes to run the segments in (started per call if None).
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        lo, hi, count = conn.execute("""SELECT MIN(ledger_index), MAX(ledger_index), COUNT(*) FROM ledger_blocks
+                                        WHERE election_id=? AND ledger_index<=?""",
+                                     (election_id, upto if upto is not None else 2 ** 62)).fetchone()
+        workers = workers or os.cpu_count() or 1
+        if count == 0:
+            return _result([], 0, GENESIS_HASH, 0, 1)
+        if workers <= 1 or count < parallel_threshold:
+            return _result(*stitch([check_segment(conn.execute(_SELECT_RANGE, (election_id, lo, hi)))]), 1, 1)
+    finally:
+        conn.close()
+
+    bounds = [(start, min(start + segment_size - 1, hi)) for start in range(lo, hi + 1, segment_size)]
+    results = _map(pool, workers, _check_db_segment, [db_path] * len(bounds), [election_id] * len(bounds),
+                   [b[0] for b in bounds], [b[1] for b in bounds])
+    return _result(*stitch(results), len(bounds), workers)
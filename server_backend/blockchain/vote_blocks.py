@@ -0,0 +1,71 @@
+"""
+Multi-vote ledger blocks.
+
+In this ledger mode one block commits to up to K ballots: its vote_hash
+column holds the Merkle root (see merkle.py) of the ballots' vote_hash
+leaves, and the leaves are kept in ledger_block_votes in block order. Header
+hashing and chain verification are unchanged; a block simply stands for K
+ballots, so the chain is K times shorter.
+
+Each ballot keeps its own tamper evidence: its receipt carries the block
+header, its position in the block and its sibling path, so anyone can check
+leaf -> root -> block_hash without the other ballots. invalid_roots() finds
+blocks whose stored leaves no longer reproduce their root.
+
+Functions take a cursor and leave transaction control to the caller.
+"""
+
+from server_backend.blockchain import merkle
+
+
+def init_block_votes_table(c):
+    c.execute('''CREATE TABLE IF NOT EXISTS ledger_block_votes (
+        election_id TEXT,
+        ledger_index INTEGER,
+        position INTEGER,
+        vote_hash TEXT,
+        PRIMARY KEY (election_id, ledger_index, position)
+    )''')
+
+
+def store(c, election_id, ledger_index, vote_hashes):
+    c.executemany("INSERT INTO ledger_block_votes (election_id, ledger_index, position, vote_hash) VALUES (?, ?, ?, ?)",
+                  [(election_id, ledger_index, position, v) for position, v in enumerate(vote_hashes)])
+
+
+def leaves(c, election_id, ledger_index):
+    """vote_hash leaves of one block in position order ([] for a single-vote block)."""
+    c.execute("SELECT vote_hash FROM ledger_block_votes WHERE election_id=? AND ledger_index=? ORDER BY position",
+              (election_id, ledger_index))
+    return [r[0] for r in c.fetchall()]
+
+
+def ballot_proof(c, election_id, ledger_index, position):
+    """{"position", "vote_hash", "path"} for one ballot of a multi-vote block, or None."""
+    block_leaves = leaves(c, election_id, ledger_index)
+    if not 0 <= position < len(block_leaves):
+        return None
+    return {
+        "position": position,
+        "vote_hash": block_leaves[position],
+        "path": merkle.inclusion_proof(block_leaves, position),
+    }
+
+
+def invalid_roots(c, election_id):
+    """Ledger indexes of multi-vote blocks whose leaves do not hash to the stored root."""
+    c.execute("""SELECT bv.ledger_index, lb.vote_hash, bv.vote_hash FROM ledger_block_votes bv
+                 LEFT JOIN ledger_blocks lb ON lb.election_id = bv.election_id AND lb.ledger_index = bv.ledger_index
+                 WHERE bv.election_id=? ORDER BY bv.ledger_index, bv.position""", (election_id,))
+    invalid, current, root, block_leaves = [], None, None, []
+    for ledger_index, block_root, vote_hash in c.fetchall() + [(None, None, None)]:
+        if ledger_index != current:
+            if current is not None and merkle.merkle_root(block_leaves) != root:
+                invalid.append(current)
+            current, root, block_leaves = ledger_index, block_root, []
+        block_leaves.append(vote_hash)
+    return invalid
+
+
+def clear(c, election_id):
+    c.execute("DELETE FROM ledger_block_votes WHERE election_id=?", (election_id,))
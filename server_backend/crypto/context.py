@@ -0,0 +1,108 @@
+"""
+Process-wide server crypto context: the server's keys, parsed once.
+
+Keys are read from server/keys (or handed over by server/server.py from
+server_config):
+- receipt_private.pem: RSA key that signs receipts; it also signs OVTs and
+  ledger block headers unless ovt_private.pem / ledger_private.pem exist
+- paillier_public.json / paillier_private.json: tally key
+- ed25519_private.seed: optional Ed25519 key (hex seed) for the Ed25519 suite
+
+PEM parsing, the signer objects and the Paillier CRT decryption parameters
+are set up once here instead of per request or per import. The signature
+suite (see signers.py) picks which key signs OVTs, receipts and the ledger.
+"""
+
+import json
+import os
+import threading
+
+from Crypto.PublicKey import RSA
+
+from server_backend.crypto.paillier_fast import RawPaillier
+from server_backend.crypto.signers import ED25519, RSA_PSS_SHA256, Ed25519Signer, RSASigner
+
+DEFAULT_KEYS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'server', 'keys'))
+
+
+class CryptoContext:
+    """
+    - receipt_priv_pem: server signing key (PEM str/bytes) or None
+    - paillier_n/p/q: tally key; p and q may be omitted for a public-only key
+    - ledger_priv_pem, ovt_priv_pem: optional dedicated RSA keys
+    - signature_alg: suite that signs OVTs, receipts and the ledger by default
+    - ed25519_seed: 32-byte Ed25519 key; required for the Ed25519 suite and,
+      when given with RSA as the default, offered to clients that ask for it
+    """
+
+    def __init__(self, receipt_priv_pem=None, paillier_n=None, paillier_p=None, paillier_q=None,
+                 ledger_priv_pem=None, ovt_priv_pem=None, signature_alg=RSA_PSS_SHA256, ed25519_seed=None):
+        if signature_alg not in (RSA_PSS_SHA256, ED25519):
+            raise ValueError(f"unknown signature suite {signature_alg!r}")
+        if signature_alg == ED25519 and ed25519_seed is None:
+            raise ValueError("the Ed25519 suite needs an Ed25519 seed")
+        rsa_receipt = RSASigner.from_pem(receipt_priv_pem) if receipt_priv_pem else None
+        # Suites this context can sign with, keyed by algorithm ID
+        self.signers = {}
+        if rsa_receipt:
+            self.signers[RSA_PSS_SHA256] = rsa_receipt
+        if ed25519_seed is not None:
+            self.signers[ED25519] = Ed25519Signer(ed25519_seed)
+        self.signature_alg = signature_alg
+        if signature_alg == ED25519:
+            self.receipt = self.ledger = self.ovt = self.signers[ED25519]
+        else:
+            self.receipt = rsa_receipt
+            self.ledger = RSASigner.from_pem(ledger_priv_pem) if ledger_priv_pem else self.receipt
+            self.ovt = RSASigner.from_pem(ovt_priv_pem) if ovt_priv_pem else self.receipt
+        self.paillier = RawPaillier(paillier_n, paillier_p, paillier_q) if paillier_n else None
+
+    def signer_for(self, accepted=None):
+        """The first suite in `accepted` (algorithm IDs, by preference) this context has, else the default signer."""
+        for alg in accepted or ():
+            if alg in self.signers:
+                return self.signers[alg]
+        return self.receipt
+
+    @classmethod
+    def from_keys_dir(cls, keys_dir=DEFAULT_KEYS_DIR, signature_alg=RSA_PSS_SHA256):
+        def read(name):
+            path = os.path.join(keys_dir, name)
+            if not os.path.exists(path):
+                return None
+            with open(path, encoding="utf-8") as f:
+                return f.read()
+
+        public = json.loads(read("paillier_public.json") or "{}")
+        private = json.loads(read("paillier_private.json") or "{}")
+        receipt_pem = read("receipt_private.pem")
+        if receipt_pem is None:
+            # Fresh checkout without keys: sign with a throwaway key like the old demo did
+            print(f"⚠️  No receipt_private.pem in {keys_dir}; using an ephemeral RSA key")
+            receipt_pem = RSA.generate(2048).export_key('PEM')
+        seed_hex = read("ed25519_private.seed")
+        return cls(receipt_pem, public.get("n"), private.get("p"), private.get("q"),
+                   ledger_priv_pem=read("ledger_private.pem"), ovt_priv_pem=read("ovt_private.pem"),
+                   signature_alg=signature_alg, ed25519_seed=bytes.fromhex(seed_hex.strip()) if seed_hex else None)
+
+
+_context = None
+_context_lock = threading.Lock()
+
+
+def set_context(context):
+    """Install the process-wide context (the server does this at startup)."""
+    global _context
+    with _context_lock:
+        _context = context
+    return context
+
+
+def get_context():
+    """Return the process-wide context, loading it from server/keys on first use."""
+    global _context
+    if _context is None:
+        with _context_lock:
+            if _context is None:
+                _context = CryptoContext.from_keys_dir()
+    return _context
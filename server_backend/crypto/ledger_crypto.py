@@ -1,25 +1,32 @@
 """
-Ledger (block) signing using RSA-2048.
-Block headers are JSON-dicts; we compute SHA-256 on the canonical JSON bytes and sign that.
+Ledger (block) signing, RSA-PSS by default (or Ed25519, see signers.py).
+Block headers are JSON-dicts; we sign their canonical JSON bytes.
+The ledger key (SK_ledger_sign / PK_ledger_sign) comes from the shared crypto
+context (server/keys), loaded on first use.
 """
 
 from Crypto.PublicKey import RSA
-from Crypto.Signature import pss
-from Crypto.Hash import SHA256
 import hashlib
 import json
 import time
 from client_app.storage.localdb import store_receipt, init, connect
 import os
 
+from server_backend.crypto.context import get_context
+from server_backend.crypto import signers
+
 
 # Generate ledger RSA keys (server should persist and protect SK_ledger)
 def generate_ledger_keys(key_size=2048):
     key = RSA.generate(key_size)
     return key, key.publickey()
 
-# In-memory keys (for demo). In production load from secure storage.
-SK_ledger_sign, PK_ledger_sign = generate_ledger_keys()
+def __getattr__(name):
+    if name == "SK_ledger_sign":
+        return get_context().ledger.private_key
+    if name == "PK_ledger_sign":
+        return get_context().ledger.public_key
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def create_block_header(index, vote_hash, previous_hash, timestamp=None):
     if timestamp is None:
@@ -42,39 +49,32 @@ def sha256_of_dict(data: dict) -> bytes:
 
 def sign_block_header(block_header: dict) -> bytes:
     """
-    Sign the SHA-256 of block header using RSA-PSS + SHA256.
+    Sign the block header with the ledger key (RSA-PSS + SHA256 by default).
     Returns signature bytes.
     """
-    msg_bytes = canonical_json_bytes(block_header)
-    h = SHA256.new(msg_bytes)
-    signer = pss.new(SK_ledger_sign)
-    signature = signer.sign(h)
-    return signature
+    return get_context().ledger.sign(canonical_json_bytes(block_header))
 
 def verify_block_header_signature(block_header: dict, signature: bytes, public_key_pem: bytes = None) -> bool:
     """
-    Verify signature using either provided PEM public key or in-memory PK_ledger_sign.
+    Verify signature using either provided PEM public key (RSA or Ed25519) or in-memory PK_ledger_sign.
     """
     msg_bytes = canonical_json_bytes(block_header)
-    h = SHA256.new(msg_bytes)
-    if public_key_pem:
-        pk = RSA.import_key(public_key_pem)
-    else:
-        pk = PK_ledger_sign
+    if not public_key_pem:
+        return get_context().ledger.verify(msg_bytes, signature)
     try:
-        verifier = pss.new(pk)
-        verifier.verify(h, signature)
-        return True
+        return signers.verify(signers.alg_for_pem(public_key_pem), public_key_pem, msg_bytes, signature)
     except Exception:
         return False
 
 def export_ledger_public_key_pem():
-    return PK_ledger_sign.export_key('PEM')
+    return get_context().ledger.public_pem()
 
 def export_ledger_private_key_pem(password: bytes = None):
-    if password:
-        return SK_ledger_sign.export_key('PEM', passphrase=password)
-    return SK_ledger_sign.export_key('PEM')
+    """
+    PEM of the ledger private key in its own suite: RSA as before, Ed25519 as
+    PKCS#8. Encrypted if a password is given.
+    """
+    return get_context().ledger.private_pem(password)
 
 def fetch_last_block(election_id: str, db_path=None):
     if db_path is None:
@@ -1,22 +1,31 @@
 """
-OVT (One-Time Voting Token) using RSA-2048 signatures.
+OVT (One-Time Voting Token) signatures: RSA-PSS by default, or Ed25519
+(see signers.py).
 
-- SK_server_sign: server-side RSA private key (keep secure)
-- PK_server_sign: RSA public key (distribute to booths for verification)
+- SK_server_sign: server-side private key (keep secure)
+- PK_server_sign: public key (distribute to booths for verification)
+
+Both come from the shared crypto context (server/keys), loaded on first use.
 """
 
 from Crypto.PublicKey import RSA
-from Crypto.Signature import pss
-from Crypto.Hash import SHA256
 import secrets
 
+from server_backend.crypto.context import get_context
+from server_backend.crypto import signers
+
 # --- Key generation (run once and persist securely) ---
 def generate_rsa_keypair(key_size=2048):
     key = RSA.generate(key_size)
     return key, key.publickey()
 
-# For convenience, generate in-memory keys (in production load from secure storage)
-SK_server_sign, PK_server_sign = generate_rsa_keypair()
+def __getattr__(name):
+    # SK_server_sign / PK_server_sign resolve to the context's persistent OVT key
+    if name == "SK_server_sign":
+        return get_context().ovt.private_key
+    if name == "PK_server_sign":
+        return get_context().ovt.public_key
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # --- OVT functions ---
 def generate_ovt(length=16):
@@ -27,23 +36,17 @@ def generate_ovt(length=16):
 
 def sign_ovt(token_bytes):
     """
-    Sign a token (bytes) with server private RSA key (PSS+SHA256).
+    Sign a token (bytes) with the server's OVT key (RSA-PSS+SHA256 by default).
     Returns signature bytes.
     """
-    h = SHA256.new(token_bytes)
-    signer = pss.new(SK_server_sign)
-    return signer.sign(h)
+    return get_context().ovt.sign(token_bytes)
 
 def verify_ovt_with_pubkey_bytes(pubkey_pem: bytes, token_bytes: bytes, signature: bytes) -> bool:
     """
-    Verify signature using a provided public key PEM (useful for distributed verification).
+    Verify signature using a provided public key PEM, RSA or Ed25519 (useful for distributed verification).
     """
     try:
-        pk = RSA.import_key(pubkey_pem)
-        h = SHA256.new(token_bytes)
-        verifier = pss.new(pk)
-        verifier.verify(h, signature)
-        return True
+        return signers.verify(signers.alg_for_pem(pubkey_pem), pubkey_pem, token_bytes, signature)
     except Exception:
         return False
 
@@ -51,13 +54,7 @@ def verify_ovt(token_bytes, signature_bytes):
     """
     Verify using server's in-memory public key.
     """
-    try:
-        h = SHA256.new(token_bytes)
-        verifier = pss.new(PK_server_sign)
-        verifier.verify(h, signature_bytes)
-        return True
-    except Exception:
-        return False
+    return get_context().ovt.verify(token_bytes, signature_bytes)
 
 # --- Key export helpers (public) ---
 def export_public_key_pem(public_key):
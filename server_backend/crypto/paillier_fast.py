@@ -0,0 +1,153 @@
+"""
+Raw-integer Paillier for the server's tally path.
+
+phe wraps every ciphertext in an EncryptedNumber and checks exponents on each
+`+`; the server only ever adds ballots that all encrypt integers, so it can
+work on the ciphertext integers directly: addition is a product mod n^2 and
+decryption uses the CRT parameters computed once per key. Results are
+identical to phe's (same CRT decryption, same signed decoding).
+
+gmpy2 is used for the big-integer arithmetic when it is installed; otherwise
+plain Python ints are used.
+"""
+
+try:
+    import gmpy2
+except ImportError:
+    gmpy2 = None
+
+HAVE_GMPY2 = gmpy2 is not None
+
+# phe encodes with base 16; only needed for the rare non-zero exponent
+_BASE = 16
+
+
+def _backend(use_gmpy2):
+    if use_gmpy2 is None:
+        use_gmpy2 = HAVE_GMPY2
+    if use_gmpy2 and not HAVE_GMPY2:
+        raise RuntimeError("gmpy2 is not installed")
+    return use_gmpy2
+
+
+def parse_ciphertext(value, use_gmpy2=None):
+    """Return a stored ciphertext (int or decimal string) as a number, or None for mock/invalid values."""
+    if value is None:
+        return None
+    try:
+        if _backend(use_gmpy2):
+            return gmpy2.mpz(value)
+        return value if isinstance(value, int) else int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class RawPaillier:
+    """
+    Paillier arithmetic on ciphertext integers for one key.
+
+    - n: public modulus; p, q: private factors (only needed to decrypt)
+    - use_gmpy2: None picks gmpy2 when available; False forces plain ints
+    """
+
+    def __init__(self, n, p=None, q=None, use_gmpy2=None):
+        self.use_gmpy2 = _backend(use_gmpy2)
+        num = gmpy2.mpz if self.use_gmpy2 else int
+        self.n = int(n)
+        self.nsquare = self.n * self.n
+        self.max_int = self.n // 3 - 1
+        self._nsquare = num(self.nsquare)
+        self.can_decrypt = p is not None and q is not None
+        if not self.can_decrypt:
+            return
+        p, q = int(p), int(q)
+        if p * q != self.n:
+            raise ValueError("given public key does not match the given p and q.")
+        if q < p:
+            p, q = q, p
+        self._p, self._q = num(p), num(q)
+        self._psquare, self._qsquare = num(p * p), num(q * q)
+        self._p_inverse = num(pow(p, -1, q))
+        self._hp = self._h_function(p, p * p)
+        self._hq = self._h_function(q, q * q)
+
+    def _powmod(self, base, exp, modulus):
+        if self.use_gmpy2:
+            return gmpy2.powmod(base, exp, modulus)
+        return pow(base, exp, modulus)
+
+    def _h_function(self, x, xsquare):
+        # g = n + 1, as in phe
+        l_value = (pow(self.n + 1, x - 1, xsquare) - 1) // x
+        value = pow(l_value, -1, x)
+        return gmpy2.mpz(value) if self.use_gmpy2 else value
+
+    def parse(self, value):
+        return parse_ciphertext(value, self.use_gmpy2)
+
+    def add(self, a, b):
+        """Homomorphic addition of two ciphertexts."""
+        return int((self.parse(a) * self.parse(b)) % self._nsquare)
+
+    def sum(self, ciphertexts):
+        """Homomorphic sum of the valid ciphertexts; None if there are none."""
+        acc = None
+        nsquare = self._nsquare
+        for value in ciphertexts:
+            value = self.parse(value)
+            if value is None:
+                continue
+            acc = value % nsquare if acc is None else (acc * value) % nsquare
+        return int(acc) if acc is not None else None
+
+    def raw_decrypt(self, ciphertext):
+        """Paillier decryption of a ciphertext integer; returns the encoding in [0, n)."""
+        if not self.can_decrypt:
+            raise ValueError("private key factors are required to decrypt")
+        c = self.parse(ciphertext)
+        if c is None:
+            raise TypeError(f"Expected a ciphertext integer, not: {ciphertext!r}")
+        p, q = self._p, self._q
+        mp = ((self._powmod(c, p - 1, self._psquare) - 1) // p) * self._hp % p
+        mq = ((self._powmod(c, q - 1, self._qsquare) - 1) // q) * self._hq % q
+        u = (mq - mp) * self._p_inverse % q
+        return int(mp + u * p)
+
+    def decode(self, encoding, exponent=0):
+        """Signed decoding of a raw plaintext, as phe's EncodedNumber.decode."""
+        if encoding >= self.n:
+            raise ValueError("Attempted to decode corrupted number")
+        elif encoding <= self.max_int:
+            mantissa = encoding
+        elif encoding >= self.n - self.max_int:
+            mantissa = encoding - self.n
+        else:
+            raise OverflowError("Overflow detected in decrypted number")
+        if exponent >= 0:
+            return mantissa * _BASE ** exponent
+        return mantissa / _BASE ** -exponent
+
+    def decrypt(self, ciphertext, exponent=0):
+        return self.decode(self.raw_decrypt(ciphertext), exponent)
+
+    def decryption_witness(self, ciphertext):
+        """
+        (encoding, r) with ciphertext == (1 + encoding * n) * r^n mod n^2, so
+        anyone with the public key can check a published decryption
+        (verify_decryption) without the private factors.
+        """
+        encoding = self.raw_decrypt(ciphertext)
+        c = int(self.parse(ciphertext))
+        phi = int((self._p - 1) * (self._q - 1))
+        r = pow(c % self.n, pow(self.n, -1, phi), self.n)
+        return encoding, r
+
+
+def verify_decryption(n, ciphertext, encoding, r, use_gmpy2=None):
+    """True if `encoding` is the decryption of `ciphertext` under public modulus n, witnessed by r."""
+    num = gmpy2.mpz if _backend(use_gmpy2) else int
+    n, nsquare = num(n), num(n) * num(n)
+    if not (0 <= encoding < n and 0 < r < n):
+        return False
+    g_m = (1 + num(encoding) * n) % nsquare
+    return (g_m * pow(num(r), n, nsquare)) % nsquare == num(ciphertext) % nsquare
@@ -6,6 +6,8 @@ Uses phe (Python Paillier).
 from phe import paillier
 import json
 
+from server_backend.crypto import tally_engine, paillier_fast
+
 def generate_paillier_keys():
     """
     Generate Paillier keypair. Return (public_key, private_key).
@@ -26,18 +28,27 @@ def public_key_from_dict(d):
     """
     return paillier.PaillierPublicKey(d["n"])
 
-def paillier_tally(private_key, encrypted_votes):
+def paillier_tally(private_key, encrypted_votes, workers=None):
     """
     Homomorphically sum a list of EncryptedNumber objects (all for same pubkey)
     and decrypt the result. Returns integer total.
     If encrypted_votes is a list of EncryptedNumber, returns private_key.decrypt(sum).
+    Large tallies are multiplied out in parallel by tally_engine; ballots with
+    mixed exponents fall back to phe's own addition.
     """
     if not encrypted_votes:
         return 0
-    total_enc = encrypted_votes[0]
-    for enc in encrypted_votes[1:]:
-        total_enc += enc
-    return private_key.decrypt(total_enc)
+    public_key = encrypted_votes[0].public_key
+    exponent = encrypted_votes[0].exponent
+    if any(enc.exponent != exponent for enc in encrypted_votes):
+        total_enc = encrypted_votes[0]
+        for enc in encrypted_votes[1:]:
+            total_enc += enc
+        return private_key.decrypt(total_enc)
+    total = tally_engine.homomorphic_sum([enc.ciphertext(be_secure=False) for enc in encrypted_votes],
+                                         public_key.nsquare, workers=workers)
+    key = paillier_fast.RawPaillier(public_key.n, private_key.p, private_key.q)
+    return key.decrypt(total, exponent)
 
 def paillier_decrypt(private_key, encrypted_number):
     """
@@ -0,0 +1,129 @@
+"""
+Batched vote receipts: one signature over the Merkle root of every receipt
+issued within a short window.
+
+Handlers submit a receipt's canonical payload bytes. A single batcher
+thread collects payloads for up to `window_ms` (or `max_batch` of them),
+builds a Merkle tree over leaf = sha256(payload) (merkle.py, RFC 6962
+domain separation), signs the canonical batch header
+
+    {"type": "receipt-batch", "merkle_root": root, "size": n, "ts": ts}
+
+once and hands every handler the root, its leaf index and its inclusion
+path. A receipt is then checked on its own: hash the payload, walk the
+path to the root, verify the header signature
+(client_app/crypto/signing.verify_batched_receipt). Payloads are grouped by
+signer so each batch is signed in the suite its clients asked for.
+"""
+
+import hashlib
+import json
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from server_backend.blockchain import merkle
+
+_STOP = object()
+
+
+def receipt_leaf(payload_bytes):
+    return hashlib.sha256(payload_bytes).hexdigest()
+
+
+def batch_header(merkle_root, size, ts):
+    return {"type": "receipt-batch", "merkle_root": merkle_root, "size": size, "ts": ts}
+
+
+def header_bytes(header):
+    return json.dumps(header, sort_keys=True, separators=(",", ":")).encode()
+
+
+class ReceiptBatcher:
+    def __init__(self, sign_fn, max_batch=256, window_ms=5):
+        """
+        - sign_fn(signer, data_bytes): signer's signature of data_bytes, as it goes into receipts (base64)
+        - max_batch: most receipts under one signature
+        - window_ms: how long the batcher waits to fill a batch after its first receipt
+        """
+        self.sign_fn = sign_fn
+        self.max_batch = max_batch
+        self.window = window_ms / 1000.0
+        self._queue = queue.Queue()
+        self._thread = None
+        self.batches = 0
+        self.receipts = 0
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="receipt-batcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+            self._thread = None
+
+    def submit(self, signer, payload_bytes):
+        """Queue a receipt payload; the Future resolves to its batch fields (merkle_root, size, ts, leaf_index, path, sig)."""
+        if self._thread is None:
+            raise RuntimeError("ReceiptBatcher is not running")
+        future = Future()
+        self._queue.put((signer, payload_bytes, future))
+        return future
+
+    def stats(self):
+        return {
+            "batches": self.batches,
+            "receipts": self.receipts,
+            "avg_batch": (self.receipts / self.batches) if self.batches else 0.0,
+            "queue_depth": self._queue.qsize(),
+        }
+
+    def _collect(self, first):
+        batch = [first]
+        deadline = time.monotonic() + self.window
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                self._queue.put(_STOP)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is _STOP:
+                return
+            by_signer = {}
+            for item in self._collect(first):
+                by_signer.setdefault(id(item[0]), []).append(item)
+            for items in by_signer.values():
+                self._sign_batch(items)
+
+    def _sign_batch(self, items):
+        try:
+            levels = merkle.tree_levels([receipt_leaf(payload) for _, payload, _ in items])
+            root = levels[-1][0].hex()
+            ts = time.time()
+            header = batch_header(root, len(items), ts)
+            sig = self.sign_fn(items[0][0], header_bytes(header))
+        except Exception as e:
+            for _, _, future in items:
+                future.set_exception(e)
+            return
+        self.batches += 1
+        self.receipts += len(items)
+        for index, (_, _, future) in enumerate(items):
+            future.set_result({"merkle_root": root, "size": len(items), "ts": ts, "leaf_index": index,
+                               "path": merkle.proof_from_levels(levels, index), "sig": sig})
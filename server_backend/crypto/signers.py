@@ -0,0 +1,216 @@
+"""
+Signature suites for OVTs, receipts and ledger checkpoints.
+
+Every signer has the same interface: sign(bytes) -> signature bytes,
+verify(bytes, signature) -> bool, public_pem(), private_pem(passphrase) and
+`alg`, the suite name that travels next to each signature so verifiers know
+which check to run:
+
+- RSA-PSS-SHA256: RSA-PSS with SHA-256 (the default; what deployed booths verify)
+- Ed25519: pynacl; signing is orders of magnitude cheaper than RSA-3072
+
+Ed25519 public keys are exported as SubjectPublicKeyInfo PEM like RSA keys,
+so either kind can be distributed and pinned the same way. Ed25519 private
+keys are exported as PKCS#8 PEM (RFC 8410).
+"""
+
+import base64
+import os
+
+from Crypto.Hash import SHA256
+from Crypto.IO import PEM, PKCS8
+from Crypto.PublicKey import RSA
+from Crypto.Signature import pss
+
+try:
+    import nacl.exceptions
+    import nacl.signing
+    HAVE_NACL = True
+except ImportError:  # pynacl is optional; only the Ed25519 suite needs it
+    HAVE_NACL = False
+
+RSA_PSS_SHA256 = "RSA-PSS-SHA256"
+ED25519 = "Ed25519"
+SUITES = (RSA_PSS_SHA256, ED25519)
+
+# DER prefix of an Ed25519 SubjectPublicKeyInfo (RFC 8410); the raw 32-byte key follows
+_ED25519_SPKI_PREFIX = bytes.fromhex("302a300506032b6570032100")
+_ED25519_OID = "1.3.101.112"
+
+
+def _require_nacl():
+    if not HAVE_NACL:
+        raise RuntimeError("pynacl is not installed (needed for Ed25519 signatures)")
+
+
+def ed25519_public_pem(raw_key):
+    body = base64.encodebytes(_ED25519_SPKI_PREFIX + bytes(raw_key)).decode().strip()
+    return f"-----BEGIN PUBLIC KEY-----\n{body}\n-----END PUBLIC KEY-----".encode()
+
+
+def ed25519_private_pem(seed, passphrase=None):
+    """PKCS#8 PEM of an Ed25519 seed, encrypted (PBKDF2 + AES-128) when a passphrase is given."""
+    # The PKCS#8 payload is the seed wrapped as an OCTET STRING (CurvePrivateKey)
+    key_der = b"\x04\x20" + bytes(seed)
+    if passphrase:
+        der = PKCS8.wrap(key_der, _ED25519_OID, passphrase=passphrase, key_params=None,
+                         protection="PBKDF2WithHMAC-SHA1AndAES128-CBC")
+        return PEM.encode(der, "ENCRYPTED PRIVATE KEY").encode()
+    return PEM.encode(PKCS8.wrap(key_der, _ED25519_OID, key_params=None), "PRIVATE KEY").encode()
+
+
+def ed25519_raw_key(public_pem):
+    """The 32-byte key inside an Ed25519 public key PEM, or None if it is not one."""
+    if isinstance(public_pem, str):
+        public_pem = public_pem.encode()
+    lines = [line for line in public_pem.strip().splitlines() if not line.startswith(b"-----")]
+    try:
+        der = base64.b64decode(b"".join(lines))
+    except ValueError:
+        return None
+    if len(der) != len(_ED25519_SPKI_PREFIX) + 32 or not der.startswith(_ED25519_SPKI_PREFIX):
+        return None
+    return der[len(_ED25519_SPKI_PREFIX):]
+
+
+def alg_for_pem(public_pem):
+    return ED25519 if ed25519_raw_key(public_pem) is not None else RSA_PSS_SHA256
+
+
+class RSASigner:
+    """RSA-PSS (SHA-256) signer/verifier around one parsed key."""
+
+    alg = RSA_PSS_SHA256
+
+    def __init__(self, private_key):
+        self.private_key = private_key
+        self.public_key = private_key.publickey()
+        self._signer = pss.new(private_key)
+        self._verifier = pss.new(self.public_key)
+
+    @classmethod
+    def from_pem(cls, pem):
+        return cls(RSA.import_key(pem))
+
+    def sign(self, data_bytes):
+        return self._signer.sign(SHA256.new(data_bytes))
+
+    def verify(self, data_bytes, signature):
+        try:
+            self._verifier.verify(SHA256.new(data_bytes), signature)
+            return True
+        except (ValueError, TypeError):
+            return False
+
+    def public_pem(self):
+        return self.public_key.export_key('PEM')
+
+    def private_pem(self, passphrase=None):
+        """PEM of the private key (encrypted if a passphrase is given)."""
+        if passphrase:
+            return self.private_key.export_key('PEM', passphrase=passphrase)
+        return self.private_key.export_key('PEM')
+
+    def spec(self):
+        """(alg, private key material) to rebuild this signer elsewhere, e.g. in a worker process."""
+        return self.alg, self.private_key.export_key('PEM')
+
+
+class Ed25519Signer:
+    """Ed25519 signer/verifier around one pynacl signing key (32-byte seed)."""
+
+    alg = ED25519
+
+    def __init__(self, seed):
+        _require_nacl()
+        self.private_key = nacl.signing.SigningKey(bytes(seed))
+        self.public_key = self.private_key.verify_key
+
+    @classmethod
+    def generate(cls):
+        return cls(os.urandom(32))
+
+    def sign(self, data_bytes):
+        return self.private_key.sign(data_bytes).signature
+
+    def verify(self, data_bytes, signature):
+        try:
+            self.public_key.verify(data_bytes, signature)
+            return True
+        except (nacl.exceptions.BadSignatureError, ValueError, TypeError):
+            return False
+
+    def public_pem(self):
+        return ed25519_public_pem(bytes(self.public_key))
+
+    def private_pem(self, passphrase=None):
+        return ed25519_private_pem(bytes(self.private_key), passphrase)
+
+    def spec(self):
+        return self.alg, bytes(self.private_key)
+
+
+def from_spec(alg, material):
+    """Inverse of signer.spec()."""
+    if alg == RSA_PSS_SHA256:
+        return RSASigner.from_pem(material)
+    if alg == ED25519:
+        return Ed25519Signer(material)
+    raise ValueError(f"unknown signature suite {alg!r}")
+
+
+def public_verifier(alg, public_pem):
+    """verify(data_bytes, signature_bytes) -> bool for a public key of suite `alg`."""
+    if alg == RSA_PSS_SHA256:
+        verifier = pss.new(RSA.import_key(public_pem))
+
+        def verify(data_bytes, signature):
+            try:
+                verifier.verify(SHA256.new(data_bytes), signature)
+                return True
+            except (ValueError, TypeError):
+                return False
+        return verify
+    if alg == ED25519:
+        _require_nacl()
+        raw_key = ed25519_raw_key(public_pem)
+        if raw_key is None:
+            raise ValueError("not an Ed25519 public key")
+        key = nacl.signing.VerifyKey(raw_key)
+
+        def verify(data_bytes, signature):
+            try:
+                key.verify(data_bytes, signature)
+                return True
+            except (nacl.exceptions.BadSignatureError, ValueError, TypeError):
+                return False
+        return verify
+    raise ValueError(f"unknown signature suite {alg!r}")
+
+
+def verify(alg, public_pem, data_bytes, signature):
+    try:
+        return public_verifier(alg, public_pem)(data_bytes, signature)
+    except ValueError:
+        return False
+
+
+def load_ed25519_seed(path, create=False):
+    """
+    The hex-encoded 32-byte seed stored at `path`; with create=True a new one
+    is written (owner-readable only) if the file does not exist yet, otherwise
+    a missing file gives None.
+    """
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            seed = bytes.fromhex(f.read().strip())
+        if len(seed) != 32:
+            raise ValueError(f"{path} does not hold a 32-byte Ed25519 seed")
+        return seed
+    if not create:
+        return None
+    seed = os.urandom(32)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(seed.hex() + "\n")
+    return seed
@@ -0,0 +1,143 @@
+"""
+Signing service backed by a process pool.
+
+pycryptodome holds the GIL through an RSA private-key operation, so request
+threads that sign inline take turns on one core. SigningPool hands the
+canonical bytes to worker processes instead; each worker rebuilds the
+signers from their private keys once, at start-up, and then only signs.
+Handlers submit and wait on the returned Future, so signing capacity grows
+with the number of worker processes (and cores) rather than with one
+interpreter.
+
+All workers are started in start(), before the pool takes requests, so none
+is started later from a busy server.
+
+stats() reports queue depth (submitted, not yet signed), throughput and
+latency over the last LATENCY_WINDOW signatures: total time from submit to
+signature and the part of it spent signing in the worker.
+"""
+
+import collections
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from server_backend.crypto import signers
+
+LATENCY_WINDOW = 1024
+
+_worker_signers = None
+
+
+def _init_worker(specs):
+    global _worker_signers
+    _worker_signers = [signers.from_spec(alg, material) for alg, material in specs]
+
+
+def _sign(index, data_bytes):
+    start = time.perf_counter()
+    signature = _worker_signers[index].sign(data_bytes)
+    return signature, time.perf_counter() - start
+
+
+def _percentile(ordered, fraction):
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+class SigningPool:
+    def __init__(self, signer_list, workers=None):
+        """
+        - signer_list: signers (signers.RSASigner / Ed25519Signer) the workers
+          hold; the same signer objects are passed to submit()
+        - workers: worker processes (default: CPU count)
+        """
+        self._index = {}
+        specs = []
+        for signer in signer_list:
+            if id(signer) not in self._index:
+                self._index[id(signer)] = len(specs)
+                specs.append(signer.spec())
+        self._specs = specs
+        self.workers = workers or multiprocessing.cpu_count()
+        self._executor = None
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self._latency = collections.deque(maxlen=LATENCY_WINDOW)
+        self._service = collections.deque(maxlen=LATENCY_WINDOW)
+        self._started_at = None
+
+    def start(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                                 initargs=(self._specs,))
+            self._started_at = time.monotonic()
+            # Start the workers (and load their keys) now rather than on the first request
+            warm_up = [self._executor.submit(_sign, i % len(self._specs), b"") for i in range(self.workers)]
+            for future in warm_up:
+                future.result()
+        return self
+
+    def stop(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def covers(self, signer):
+        return id(signer) in self._index
+
+    def submit(self, signer, data_bytes):
+        """Queue `data_bytes` for signing; the returned Future resolves to the signature bytes."""
+        if self._executor is None:
+            raise RuntimeError("SigningPool is not running")
+        submitted_at = time.perf_counter()
+        result = Future()
+        with self._lock:
+            self.submitted += 1
+
+        def done(future):
+            error = future.exception()
+            with self._lock:
+                if error is None:
+                    signature, service = future.result()
+                    self.completed += 1
+                    self._latency.append(time.perf_counter() - submitted_at)
+                    self._service.append(service)
+                else:
+                    self.failed += 1
+            if error is None:
+                result.set_result(signature)
+            else:
+                result.set_exception(error)
+
+        self._executor.submit(_sign, self._index[id(signer)], data_bytes).add_done_callback(done)
+        return result
+
+    def sign(self, signer, data_bytes, timeout=None):
+        return self.submit(signer, data_bytes).result(timeout=timeout)
+
+    def stats(self):
+        with self._lock:
+            latency = sorted(self._latency)
+            service = sorted(self._service)
+            stats = {
+                "workers": self.workers,
+                "running": self._executor is not None,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "queue_depth": self.submitted - self.completed - self.failed,
+            }
+        elapsed = time.monotonic() - self._started_at if self._started_at else 0
+        stats["signatures_per_second"] = self.completed / elapsed if elapsed else 0.0
+        if latency:
+            stats["latency_ms"] = {
+                "p50": _percentile(latency, 0.50) * 1e3,
+                "p95": _percentile(latency, 0.95) * 1e3,
+                "max": latency[-1] * 1e3,
+                "mean": sum(latency) / len(latency) * 1e3,
+            }
+            stats["sign_ms"] = {"p50": _percentile(service, 0.50) * 1e3, "mean": sum(service) / len(service) * 1e3}
+        return stats
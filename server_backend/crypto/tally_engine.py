@@ -0,0 +1,189 @@
+"""
+Parallel homomorphic tally engine.
+
+Adding Paillier ciphertexts means multiplying them mod n^2. The product is
+associative, so a large election is split into chunks that worker processes
+fold independently; the partial products are then merged pairwise (a tree
+reduction) and the caller decrypts once per candidate.
+
+Ciphertexts may be given as ints or as the decimal strings stored in
+encrypted_votes; parsing happens in the workers too. Mock/invalid values are
+skipped, matching the serial tally. The products use gmpy2 when it is
+installed (see paillier_fast).
+
+The parallel paths take an optional `pool` (a ProcessPoolExecutor the
+caller keeps across calls, e.g. the server's shared verification pool);
+without one they start and shut down their own.
+"""
+
+import contextlib
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from server_backend.crypto.paillier_fast import parse_ciphertext
+
+# Below this many ballots the process start-up and pickling cost more than
+# they save, so the engine folds in-process.
+PARALLEL_THRESHOLD = 20000
+DEFAULT_CHUNK_SIZE = 4096
+DEFAULT_PAGE_SIZE = 2048
+
+
+def fold_product(values, modulus):
+    """Multiply every valid ciphertext in `values` mod `modulus`; None if none are valid."""
+    modulus = parse_ciphertext(modulus)
+    acc = None
+    for v in values:
+        v = parse_ciphertext(v)
+        if v is None:
+            continue
+        acc = v % modulus if acc is None else (acc * v) % modulus
+    return int(acc) if acc is not None else None
+
+
+def _fold_tagged_chunk(chunk, modulus):
+    """Worker entry point: chunk is (key, [ciphertexts]); returns (key, partial)."""
+    key, values = chunk
+    return key, fold_product(values, modulus)
+
+
+def tree_reduce(partials, modulus):
+    """Merge partial products pairwise; None entries (empty chunks) are dropped."""
+    modulus = parse_ciphertext(modulus)
+    level = [parse_ciphertext(p) for p in partials if p is not None]
+    if not level:
+        return None
+    while len(level) > 1:
+        merged = [(level[i] * level[i + 1]) % modulus for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            merged.append(level[-1])
+        level = merged
+    return int(level[0])
+
+
+def _chunks(values, chunk_size):
+    for start in range(0, len(values), chunk_size):
+        yield values[start:start + chunk_size]
+
+
+def _own_or_shared(pool, workers):
+    if pool is not None:
+        return contextlib.nullcontext(pool)
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def homomorphic_sums(groups, modulus, workers=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                     parallel_threshold=PARALLEL_THRESHOLD, pool=None):
+    """
+    Compute the encrypted sum for each group of ciphertexts.
+
+    - groups: {key: [ciphertext, ...]} (e.g. candidate_id -> ballots)
+    - modulus: n^2 of the Paillier public key
+    Returns {key: encrypted_sum or None}.
+    """
+    total = sum(len(v) for v in groups.values())
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or total < parallel_threshold:
+        return {key: fold_product(values, modulus) for key, values in groups.items()}
+
+    tagged = [(key, chunk) for key, values in groups.items() for chunk in _chunks(values, chunk_size)]
+    partials = {key: [] for key in groups}
+    with _own_or_shared(pool, workers) as executor:
+        for key, partial in executor.map(_fold_tagged_chunk, tagged, [modulus] * len(tagged)):
+            partials[key].append(partial)
+    return {key: tree_reduce(parts, modulus) for key, parts in partials.items()}
+
+
+def homomorphic_sum(ciphertexts, modulus, workers=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                    parallel_threshold=PARALLEL_THRESHOLD, pool=None):
+    """Encrypted sum of a single list of ciphertexts (None if it is empty)."""
+    return homomorphic_sums({None: ciphertexts}, modulus, workers=workers, chunk_size=chunk_size,
+                            parallel_threshold=parallel_threshold, pool=pool)[None]
+
+
+def iter_cursor(cursor, page_size=DEFAULT_PAGE_SIZE):
+    """Yield the rows of an executed cursor one fetchmany() page at a time."""
+    while True:
+        page = cursor.fetchmany(page_size)
+        if not page:
+            return
+        yield from page
+
+
+def stream_sums(rows, modulus, workers=None, total=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                max_in_flight=None, parallel_threshold=PARALLEL_THRESHOLD,
+                progress=None, progress_every=DEFAULT_CHUNK_SIZE * 16, pool=None):
+    """
+    Fold a stream of (key, ciphertext) rows into one encrypted sum per key.
+
+    Memory stays flat with the number of rows: the serial path keeps only the
+    running product per key, and the parallel path holds at most
+    `max_in_flight` chunks (default 2 per worker) plus one filling buffer per
+    key, folding each finished partial into its key's product right away.
+
+    - total: row count if known; decides serial vs parallel and is passed to
+      progress(done, total), which is called every `progress_every` rows and
+      once at the end
+    Returns {key: (encrypted_sum or None, rows)}.
+    """
+    modulus = parse_ciphertext(modulus)
+    workers = workers or os.cpu_count() or 1
+    sums = {}
+    counts = {}
+    done = 0
+    next_report = progress_every
+
+    def fold(key, value):
+        acc = sums.get(key)
+        sums[key] = value % modulus if acc is None else (acc * value) % modulus
+
+    def tick():
+        nonlocal next_report
+        if progress and done >= next_report:
+            progress(done, total)
+            next_report = done + progress_every
+
+    if workers <= 1 or total is None or total < parallel_threshold:
+        for key, ciphertext in rows:
+            counts[key] = counts.get(key, 0) + 1
+            value = parse_ciphertext(ciphertext)
+            if value is not None:
+                fold(key, value)
+            done += 1
+            tick()
+    else:
+        max_in_flight = max_in_flight or workers * 2
+        buffers = {}
+        pending = set()
+
+        def collect(futures):
+            for future in futures:
+                key, partial = future.result()
+                if partial is not None:
+                    fold(key, parse_ciphertext(partial))
+
+        with _own_or_shared(pool, workers) as executor:
+            def submit(key, chunk):
+                if len(pending) >= max_in_flight:
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    pending.difference_update(finished)
+                    collect(finished)
+                pending.add(executor.submit(_fold_tagged_chunk, (key, chunk), modulus))
+
+            for key, ciphertext in rows:
+                counts[key] = counts.get(key, 0) + 1
+                buffer = buffers.setdefault(key, [])
+                buffer.append(ciphertext)
+                if len(buffer) >= chunk_size:
+                    submit(key, buffer)
+                    buffers[key] = []
+                done += 1
+                tick()
+            for key, buffer in buffers.items():
+                if buffer:
+                    submit(key, buffer)
+            collect(pending)
+
+    if progress:
+        progress(done, total)
+    return {key: (int(sums[key]) if key in sums else None, counts[key]) for key in counts}
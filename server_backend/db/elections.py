@@ -2,19 +2,21 @@
 Election database operations. This replaces the in-memory ELECTIONS list with proper DB storage.
 """
 
-import sqlite3
 import uuid
 import time
 import os
 import json
 from datetime import datetime
 
-DB_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'database', 'server_voters.db')
+from server_backend.db.pool import ConnectionPool
+
+DB_PATH = os.environ.get('BALLOTGUARD_DB_PATH') or os.path.join(os.path.dirname(__file__), '..', '..', 'database', 'server_voters.db')
+
+# Shared with every helper below; close() hands the connection back to the pool.
+DB_POOL = ConnectionPool(DB_PATH)
 
 def get_db():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+    return DB_POOL.connect()
 
 def init_elections_table():
     """Create elections table if it doesn't exist"""
@@ -0,0 +1,82 @@
+"""
+Duplicate-enrollment records and the background scan that finds them.
+
+A pair of voters whose face templates are within the duplicate tolerance is
+stored once in face_duplicates as (voter_a, voter_b) with voter_a < voter_b,
+whether it was flagged at enrollment (source 'enroll') or found by a scan
+over every indexed template (source 'scan', FaceTemplateIndex.duplicate_pairs).
+Nothing is blocked automatically; an administrator reviews the pairs.
+"""
+
+import threading
+import time
+
+
+def init_duplicates_table(c):
+    c.execute('''CREATE TABLE IF NOT EXISTS face_duplicates (
+        voter_a TEXT,
+        voter_b TEXT,
+        distance REAL,
+        source TEXT,
+        detected_at REAL,
+        PRIMARY KEY (voter_a, voter_b)
+    )''')
+
+
+def record_duplicates(c, pairs, source):
+    """Store (voter_id, voter_id, distance) pairs; a pair already on record keeps its first source."""
+    now = time.time()
+    c.executemany("INSERT OR IGNORE INTO face_duplicates (voter_a, voter_b, distance, source, detected_at) VALUES (?, ?, ?, ?, ?)",
+                  [(min(a, b), max(a, b), distance, source, now) for a, b, distance in pairs])
+
+
+def list_duplicates(c, limit=1000):
+    c.execute("SELECT voter_a, voter_b, distance, source, detected_at FROM face_duplicates ORDER BY distance LIMIT ?", (limit,))
+    return [dict(zip(("voter_a", "voter_b", "distance", "source", "detected_at"), row)) for row in c.fetchall()]
+
+
+class DuplicateScan:
+    """One duplicate scan at a time, run in a background thread."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._thread = None
+        self._status = {"state": "idle"}
+
+    def start(self, index, tolerance, save_fn, block=4096):
+        """
+        Scan `index` for pairs within `tolerance` and hand them to save_fn(pairs).
+        Returns False if a scan is already running.
+        """
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return False
+            self._status = {"state": "running", "tolerance": tolerance, "started_at": time.time(),
+                            "rows_done": 0, "rows_total": len(index)}
+            self._thread = threading.Thread(target=self._run, args=(index, tolerance, save_fn, block),
+                                            name="face-duplicate-scan", daemon=True)
+            self._thread.start()
+            return True
+
+    def join(self, timeout=None):
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def status(self):
+        with self._lock:
+            return dict(self._status)
+
+    def _progress(self, done, total):
+        with self._lock:
+            self._status.update(rows_done=done, rows_total=total)
+
+    def _run(self, index, tolerance, save_fn, block):
+        try:
+            pairs = index.duplicate_pairs(tolerance, block=block, progress=self._progress)
+            save_fn(pairs)
+            update = {"state": "done", "pairs": len(pairs)}
+        except Exception as e:
+            update = {"state": "failed", "error": str(e)}
+        with self._lock:
+            self._status.update(update, finished_at=time.time())
@@ -0,0 +1,204 @@
+"""
+In-process index of enrolled voters' face templates.
+
+Every pending or active voter's 128-d encoding is held as one row of a
+contiguous float32 matrix, with voter_id -> row and voter_id -> status maps
+beside it. /auth/face/verify reads the voter's status and computes the
+probe's distance from here, so the request path never parses the
+face_encoding JSON column. Blocked voters are not indexed.
+
+The index is loaded once at startup (load()) and the server keeps it in step
+with the voters table on enroll, approve and block. A voter missing from the
+index (inserted behind the server's back, or with no valid template) is not
+an error: callers fall back to the voters row and may upsert() it.
+
+Removal swaps the last row into the freed one, so the indexed rows stay one
+dense block at the top of the matrix. Each row's squared norm is kept beside
+it, so a search against every template is one matrix-vector product:
+|t - p|^2 = |t|^2 - 2 t.p + |p|^2 (nearest() for a single probe,
+duplicate_pairs() for every pair, in tiles of the Gram matrix).
+"""
+
+import json
+import threading
+
+import numpy as np
+
+FACE_DIM = 128
+INDEXED_STATUSES = ("pending", "active")
+
+
+def parse_template(face_encoding, dim=FACE_DIM):
+    """float32 vector from a face_encoding column value (JSON text) or list, or None if it is not `dim` floats."""
+    try:
+        if isinstance(face_encoding, (str, bytes)):
+            face_encoding = json.loads(face_encoding)
+        vec = np.asarray(face_encoding, dtype=np.float32).reshape(-1)
+    except (TypeError, ValueError):
+        return None
+    return vec if vec.shape[0] == dim else None
+
+
+class FaceTemplateIndex:
+    def __init__(self, dim=FACE_DIM, capacity=1024):
+        self.dim = dim
+        self._matrix = np.zeros((capacity, dim), dtype=np.float32)
+        self._sqnorms = np.zeros(capacity, dtype=np.float32)
+        self._ids = []
+        self._rows = {}
+        self._status = {}
+        self._lock = threading.Lock()
+
+    def load(self, c):
+        """Replace the contents with every indexable voter in the voters table (run once at startup)."""
+        placeholders = ",".join("?" * len(INDEXED_STATUSES))
+        c.execute(f"SELECT voter_id, status, face_encoding FROM voters WHERE status IN ({placeholders})", INDEXED_STATUSES)
+        ids, statuses, vectors = [], {}, []
+        for voter_id, status, face_encoding in c.fetchall():
+            vec = parse_template(face_encoding, self.dim)
+            if vec is not None:
+                ids.append(voter_id)
+                statuses[voter_id] = status
+                vectors.append(vec)
+        matrix = np.zeros((max(len(ids) * 2, 1024), self.dim), dtype=np.float32)
+        if vectors:
+            matrix[:len(vectors)] = np.stack(vectors)
+        sqnorms = np.einsum("ij,ij->i", matrix, matrix)
+        with self._lock:
+            self._matrix = matrix
+            self._sqnorms = sqnorms
+            self._ids = ids
+            self._rows = {voter_id: row for row, voter_id in enumerate(ids)}
+            self._status = statuses
+        return len(ids)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, voter_id):
+        return voter_id in self._rows
+
+    def status(self, voter_id):
+        """Indexed status ('pending' or 'active'), or None if the voter is not indexed."""
+        return self._status.get(voter_id)
+
+    def upsert(self, voter_id, template, status):
+        """Index (or replace) a voter's template; blocked or unparsable ones are dropped instead. Returns True if indexed."""
+        vec = parse_template(template, self.dim)
+        if vec is None or status not in INDEXED_STATUSES:
+            self.remove(voter_id)
+            return False
+        with self._lock:
+            row = self._rows.get(voter_id)
+            if row is None:
+                row = len(self._ids)
+                if row == self._matrix.shape[0]:
+                    grown = np.zeros((row * 2, self.dim), dtype=np.float32)
+                    grown[:row] = self._matrix
+                    self._matrix = grown
+                    self._sqnorms = np.resize(self._sqnorms, row * 2)
+                self._ids.append(voter_id)
+                self._rows[voter_id] = row
+            self._matrix[row] = vec
+            self._sqnorms[row] = np.dot(vec, vec)
+            self._status[voter_id] = status
+        return True
+
+    def set_status(self, voter_id, status):
+        """Change an indexed voter's status (a blocked voter is removed). Returns False if the voter is not indexed."""
+        if status not in INDEXED_STATUSES:
+            return self.remove(voter_id)
+        with self._lock:
+            if voter_id not in self._rows:
+                return False
+            self._status[voter_id] = status
+            return True
+
+    def remove(self, voter_id):
+        with self._lock:
+            row = self._rows.pop(voter_id, None)
+            if row is None:
+                return False
+            del self._status[voter_id]
+            last = len(self._ids) - 1
+            if row != last:
+                moved = self._ids[last]
+                self._matrix[row] = self._matrix[last]
+                self._sqnorms[row] = self._sqnorms[last]
+                self._ids[row] = moved
+                self._rows[moved] = row
+            self._ids.pop()
+            return True
+
+    def template(self, voter_id):
+        """Copy of a voter's stored template, or None."""
+        with self._lock:
+            row = self._rows.get(voter_id)
+            return None if row is None else self._matrix[row].copy()
+
+    def _probe(self, probe):
+        probe = np.asarray(probe, dtype=np.float32).reshape(-1)
+        if probe.shape[0] != self.dim:
+            raise ValueError(f"face encoding must be length {self.dim}")
+        return probe
+
+    def distance(self, voter_id, probe):
+        """Euclidean distance between a voter's template and `probe` (128 floats), or None if the voter is not indexed."""
+        probe = self._probe(probe)
+        with self._lock:
+            row = self._rows.get(voter_id)
+            if row is None:
+                return None
+            diff = self._matrix[row] - probe
+        return float(np.sqrt(np.dot(diff, diff)))
+
+    def nearest(self, probe, exclude=None):
+        """(voter_id, distance) of the indexed template closest to `probe`, skipping voter `exclude`; None if there is none."""
+        probe = self._probe(probe)
+        with self._lock:
+            n = len(self._ids)
+            sq = self._sqnorms[:n] - 2.0 * (self._matrix[:n] @ probe)
+            row = self._rows.get(exclude)
+            if row is not None:
+                sq[row] = np.inf
+            if not np.isfinite(sq).any():
+                return None
+            best = int(np.argmin(sq))
+            voter_id = self._ids[best]
+        return voter_id, float(np.sqrt(max(float(sq[best]) + float(np.dot(probe, probe)), 0.0)))
+
+    def duplicate_pairs(self, tolerance, block=4096, progress=None):
+        """
+        Every pair of indexed voters whose templates are within `tolerance`, as
+        (voter_id, voter_id, distance) sorted by distance.
+
+        Works on a snapshot of the matrix (enrollment carries on meanwhile) in
+        block x block tiles; progress(rows_done, rows_total) is called after
+        each row band.
+        """
+        with self._lock:
+            n = len(self._ids)
+            ids = list(self._ids)
+            matrix = self._matrix[:n].copy()
+            sqnorms = self._sqnorms[:n].copy()
+        # |t_i - t_j| <= tol  <=>  t_i.t_j - |t_j|^2/2 >= (|t_i|^2 - tol^2)/2: two passes over each tile
+        half_sq = sqnorms / 2
+        floors = (sqnorms - np.float32(tolerance) ** 2) / 2
+        pairs = []
+        for i0 in range(0, n, block):
+            band = matrix[i0:i0 + block]
+            for j0 in range(i0, n, block):
+                tile = band @ matrix[j0:j0 + block].T
+                tile -= half_sq[None, j0:j0 + block]
+                hits = tile >= floors[i0:i0 + block, None]
+                if j0 == i0:
+                    hits = np.triu(hits, k=1)
+                if not hits.any():
+                    continue
+                for i, j in zip(*np.nonzero(hits)):
+                    sq = sqnorms[i0 + i] - 2.0 * (tile[i, j] + half_sq[j0 + j]) + sqnorms[j0 + j]
+                    pairs.append((ids[i0 + i], ids[j0 + j], float(np.sqrt(max(float(sq), 0.0)))))
+            if progress is not None:
+                progress(min(i0 + block, n), n)
+        pairs.sort(key=lambda pair: pair[2])
+        return pairs
@@ -0,0 +1,154 @@
+"""
+Group-commit writer for vote ingestion.
+
+Request handlers submit validated ballots to a queue. A single writer thread
+drains it, applies up to `max_batch` ballots (or whatever arrived within
+`max_wait_ms`) inside one BEGIN IMMEDIATE transaction and commits once, so a
+batch pays for one fsync instead of one per ballot. Each ballot runs under its
+own SAVEPOINT: a rejected ballot is rolled back on its own without aborting
+the rest of the batch. Handlers are released only after the batch commits.
+
+Because ballots are applied in order on one connection, exactly-once checks
+(vote_id replay, OVT compare-and-set) see earlier ballots of the same batch.
+An optional finish_fn runs after the last ballot, in the same transaction,
+e.g. to seal the batch's ballots into multi-vote ledger blocks; after_commit
+runs once the batch is durable, before handlers are released.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+_STOP = object()
+
+
+class GroupCommitWriter:
+    def __init__(self, pool, apply_fn, max_batch=64, max_wait_ms=5,
+                 synchronous="FULL", on_abort=None, finish_fn=None, after_commit=None):
+        """
+        - pool: ConnectionPool to take the writer's dedicated connection from
+        - apply_fn(cursor, job): applies one job, returns its result or raises
+        - synchronous: PRAGMA synchronous for the writer connection; FULL makes
+          every batch commit durable
+        - on_abort(): called before rolling back a failed job's savepoint or a
+          batch whose commit failed, to drop state cached from the rolled-back writes
+        - finish_fn(cursor, results): runs before the commit with the results of
+          the accepted jobs (in order); raising aborts the whole batch
+        - after_commit(cursor, jobs): runs after the commit with the accepted
+          jobs; errors are logged and do not affect the batch
+        """
+        self.pool = pool
+        self.apply_fn = apply_fn
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self.synchronous = synchronous
+        self.on_abort = on_abort
+        self.finish_fn = finish_fn
+        self.after_commit = after_commit
+        self._queue = queue.Queue()
+        self._thread = None
+        self.batches = 0
+        self.jobs = 0
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="vote-group-commit", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+            self._thread = None
+
+    def submit(self, job):
+        """Queue a job; the returned Future resolves after its batch commits."""
+        if self._thread is None:
+            raise RuntimeError("GroupCommitWriter is not running")
+        future = Future()
+        self._queue.put((job, future))
+        return future
+
+    def stats(self):
+        return {
+            "batches": self.batches,
+            "jobs": self.jobs,
+            "avg_batch": (self.jobs / self.batches) if self.batches else 0.0,
+            "queue_depth": self._queue.qsize(),
+        }
+
+    def _collect(self, first):
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                self._queue.put(_STOP)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        conn = self.pool.connect()
+        if self.synchronous:
+            # The connection goes back to the pool afterwards: restore its setting
+            previous = conn.execute("PRAGMA synchronous").fetchone()[0]
+            conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        try:
+            while True:
+                item = self._queue.get()
+                if item is _STOP:
+                    break
+                self._commit(conn, self._collect(item))
+        finally:
+            if self.synchronous:
+                conn.execute(f"PRAGMA synchronous={previous}")
+            conn.close()
+
+    def _commit(self, conn, batch):
+        c = conn.cursor()
+        outcomes = []
+        try:
+            c.execute("BEGIN IMMEDIATE")
+            for job, future in batch:
+                c.execute("SAVEPOINT ballot")
+                try:
+                    result = self.apply_fn(c, job)
+                    c.execute("RELEASE ballot")
+                    outcomes.append((future, result, None))
+                except Exception as e:
+                    if self.on_abort:
+                        self.on_abort()
+                    c.execute("ROLLBACK TO ballot")
+                    c.execute("RELEASE ballot")
+                    outcomes.append((future, None, e))
+            if self.finish_fn:
+                self.finish_fn(c, [result for _, result, error in outcomes if error is None])
+            conn.commit()
+        except Exception as e:
+            if self.on_abort:
+                self.on_abort()
+            conn.rollback()
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        if self.after_commit:
+            try:
+                self.after_commit(c, [job for (job, _), (_, _, error) in zip(batch, outcomes) if error is None])
+            except Exception as e:
+                print(f"Warning: group commit after_commit failed: {e}")
+
+        self.batches += 1
+        self.jobs += len(batch)
+        for future, result, error in outcomes:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
@@ -0,0 +1,142 @@
+"""
+Pooled SQLite connections for the server.
+
+Opening a fresh sqlite3 connection for every query costs a file open, schema
+parse and pragma setup each time. The pool keeps long-lived connections that
+are tuned once (WAL journal, synchronous=NORMAL, busy timeout, mmap and a
+prepared statement cache) and hands one to each worker thread for the duration
+of a request.
+
+Callers keep the usual pattern:
+
+    conn = pool.connect()
+    ...
+    conn.close()   # returns the connection to the pool instead of closing it
+"""
+
+import sqlite3
+import threading
+
+
+class PooledConnection:
+    """
+    Thin proxy around a sqlite3.Connection checked out from a ConnectionPool.
+    Everything is delegated to the real connection except close(), which
+    rolls back any unfinished transaction and returns it to the pool.
+    """
+
+    __slots__ = ("_pool", "_conn")
+
+    def __init__(self, pool, conn):
+        object.__setattr__(self, "_pool", pool)
+        object.__setattr__(self, "_conn", conn)
+
+    def __getattr__(self, name):
+        conn = object.__getattribute__(self, "_conn")
+        if conn is None:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+        return getattr(conn, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._conn, name, value)
+
+    def __enter__(self):
+        return self._conn.__enter__()
+
+    def __exit__(self, exc_type, exc, tb):
+        return self._conn.__exit__(exc_type, exc, tb)
+
+    def close(self):
+        conn = self._conn
+        if conn is None:
+            return
+        object.__setattr__(self, "_conn", None)
+        self._pool._release(conn)
+
+    def __del__(self):
+        # Early-return paths that forget close() still give the connection back.
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class ConnectionPool:
+    """
+    LIFO pool of tuned sqlite3 connections for one database file.
+
+    - journal_mode is persistent in the database file, so it is set once when
+      the pool is created.
+    - The remaining pragmas are per-connection and applied when a connection
+      is first opened; since connections are reused they are never re-applied
+      per request.
+    """
+
+    def __init__(self, db_path, max_idle=32, busy_timeout_ms=5000,
+                 mmap_size=256 * 1024 * 1024, cached_statements=256,
+                 journal_mode="WAL", synchronous="NORMAL"):
+        self.db_path = db_path
+        self.max_idle = max_idle
+        self.busy_timeout_ms = busy_timeout_ms
+        self.mmap_size = mmap_size
+        self.cached_statements = cached_statements
+        self.synchronous = synchronous
+        self._idle = []
+        self._lock = threading.Lock()
+        self._opened = 0
+
+        conn = self._open()
+        try:
+            if journal_mode:
+                conn.execute(f"PRAGMA journal_mode={journal_mode}")
+        finally:
+            self._release(conn)
+
+    def _open(self):
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.busy_timeout_ms / 1000.0,
+            check_same_thread=False,
+            cached_statements=self.cached_statements,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+        conn.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        with self._lock:
+            self._opened += 1
+        return conn
+
+    def connect(self):
+        """Check out a connection (opening a new one only if none are idle)."""
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+        if conn is None:
+            conn = self._open()
+        return PooledConnection(self, conn)
+
+    def _release(self, conn):
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            conn.row_factory = sqlite3.Row
+        except sqlite3.Error:
+            conn.close()
+            return
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def close_all(self):
+        """Close every idle connection (checked-out ones close on release)."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def stats(self):
+        with self._lock:
+            return {"opened": self._opened, "idle": len(self._idle)}
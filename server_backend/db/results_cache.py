@@ -0,0 +1,63 @@
+"""
+In-process cache of rendered /elections/<id>/results responses.
+
+An entry is keyed on the election's ledger tip (ledger_index, hash) at the
+time it was tallied: a new ballot moves the tip, so the next poll misses and
+re-tallies. Entries for closed elections are final and served without looking
+at the tip. Anything else that changes the response (a stored ballot, reset,
+re-open, voter eligibility) must call invalidate().
+
+invalidate() also bumps a per-election generation; a tally that started
+before the invalidation is not stored (see put()).
+"""
+
+import hashlib
+import threading
+from collections import namedtuple
+
+CachedResults = namedtuple("CachedResults", "tip body etag final")
+
+
+class ResultsCache:
+    def __init__(self):
+        self._entries = {}
+        self._generations = {}
+        self._epoch = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def generation(self, election_id):
+        """Token to pass to put(); read it before tallying."""
+        with self._lock:
+            return self._epoch, self._generations.get(election_id, 0)
+
+    def get(self, election_id, tip):
+        """Return the cached entry if it is final or was built at `tip`, else None."""
+        entry = self._entries.get(election_id)
+        if entry is not None and (entry.final or (tip is not None and entry.tip == tip)):
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    def put(self, election_id, tip, body, final=False, generation=None):
+        """Store a rendered body (bytes) and return its entry (with a strong ETag)."""
+        entry = CachedResults(tip, body, hashlib.sha256(body).hexdigest()[:32], final)
+        with self._lock:
+            if generation is None or generation == (self._epoch, self._generations.get(election_id, 0)):
+                self._entries[election_id] = entry
+        return entry
+
+    def invalidate(self, election_id=None):
+        """Drop one election's entry (or all of them)."""
+        with self._lock:
+            if election_id is None:
+                self._entries.clear()
+                self._epoch += 1
+            else:
+                self._entries.pop(election_id, None)
+                self._generations[election_id] = self._generations.get(election_id, 0) + 1
+
+    def stats(self):
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
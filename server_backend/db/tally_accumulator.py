@@ -0,0 +1,116 @@
+"""
+Persisted homomorphic running sums per (election, candidate).
+
+Paillier addition of two ciphertexts is their product mod n^2, so the server
+keeps one encrypted running total per candidate and folds every ballot into it
+inside the ingest transaction. A results request then costs one decryption per
+candidate no matter how many ballots were cast.
+
+All functions take a cursor and leave transaction control to the caller. The
+accumulator can always be rebuilt from encrypted_votes (e.g. for databases
+created before this table existed).
+"""
+
+from server_backend.crypto import tally_engine, paillier_fast
+
+
+def init_tally_table(c):
+    c.execute('''CREATE TABLE IF NOT EXISTS tally_accumulators (
+        election_id TEXT,
+        candidate_id TEXT,
+        ciphertext TEXT,
+        ballots INTEGER,
+        PRIMARY KEY (election_id, candidate_id)
+    )''')
+    c.execute("CREATE INDEX IF NOT EXISTS idx_encrypted_votes_election ON encrypted_votes (election_id, candidate_id)")
+
+
+def add_ballot(c, election_id, candidate_id, ciphertext, nsquare):
+    """Fold one stored ballot into its candidate's running sum."""
+    value = paillier_fast.parse_ciphertext(ciphertext)
+    c.execute("SELECT ciphertext, ballots FROM tally_accumulators WHERE election_id=? AND candidate_id=?",
+              (election_id, candidate_id))
+    row = c.fetchone()
+    if row is None:
+        total = value % nsquare if value is not None else None
+        c.execute("INSERT INTO tally_accumulators (election_id, candidate_id, ciphertext, ballots) VALUES (?, ?, ?, ?)",
+                  (election_id, candidate_id, str(total) if total is not None else None, 1))
+        return
+    total = paillier_fast.parse_ciphertext(row[0])
+    if value is not None:
+        total = value % nsquare if total is None else (total * value) % nsquare
+    c.execute("UPDATE tally_accumulators SET ciphertext=?, ballots=? WHERE election_id=? AND candidate_id=?",
+              (str(total) if total is not None else None, row[1] + 1, election_id, candidate_id))
+
+
+def load(c, election_id):
+    """Return {candidate_id: (encrypted_sum or None, ballots)} for an election."""
+    c.execute("SELECT candidate_id, ciphertext, ballots FROM tally_accumulators WHERE election_id=?", (election_id,))
+    return {r[0]: (int(r[1]) if r[1] is not None else None, r[2]) for r in c.fetchall()}
+
+
+def is_consistent(c, election_id):
+    """True when the accumulator covers exactly the ballots in encrypted_votes.
+
+    Both counts are read in one read transaction (the caller's, if one is
+    open), so a ballot committed between them cannot make a consistent
+    accumulator look stale.
+    """
+    own_snapshot = not c.connection.in_transaction
+    if own_snapshot:
+        c.execute("BEGIN")
+    try:
+        c.execute("SELECT COALESCE(SUM(ballots), 0) FROM tally_accumulators WHERE election_id=?", (election_id,))
+        accumulated = c.fetchone()[0]
+        c.execute("SELECT COUNT(*) FROM encrypted_votes WHERE election_id=?", (election_id,))
+        return accumulated == c.fetchone()[0]
+    finally:
+        if own_snapshot:
+            c.connection.commit()
+
+
+def clear(c, election_id):
+    c.execute("DELETE FROM tally_accumulators WHERE election_id=?", (election_id,))
+
+
+def recount(c, election_id, nsquare, workers=None, page_size=tally_engine.DEFAULT_PAGE_SIZE,
+            progress=None, progress_every=None, pool=None):
+    """Re-sum an election's ballots from encrypted_votes without writing anything.
+
+    Run it inside a read transaction so the ballot count and the rows come
+    from one snapshot. Rows are streamed from the cursor a page at a time and
+    folded as they arrive, so memory does not grow with the election; large
+    elections are summed in parallel by tally_engine (on `pool` if given).
+    progress(done, total) and progress_every are passed on to
+    tally_engine.stream_sums.
+    Returns (sums, ballots) with sums shaped like load().
+    """
+    c.execute("SELECT COUNT(*) FROM encrypted_votes WHERE election_id=?", (election_id,))
+    row_count = c.fetchone()[0]
+    rows = c.connection.cursor()
+    try:
+        rows.execute("SELECT candidate_id, ciphertext FROM encrypted_votes WHERE election_id=?", (election_id,))
+        sums = tally_engine.stream_sums(tally_engine.iter_cursor(rows, page_size), nsquare,
+                                        workers=workers, total=row_count, progress=progress,
+                                        progress_every=progress_every or page_size * 32, pool=pool)
+    finally:
+        rows.close()
+    return sums, row_count
+
+
+def replace(c, election_id, sums, ballots):
+    """Swap recount() results in for the running sums; the caller holds the write lock.
+
+    Returns False, leaving the running sums alone, when encrypted_votes no
+    longer holds `ballots` ballots (votes were stored since the recount's
+    snapshot and are already folded into the running sums).
+    """
+    c.execute("SELECT COUNT(*) FROM encrypted_votes WHERE election_id=?", (election_id,))
+    if c.fetchone()[0] != ballots:
+        return False
+    clear(c, election_id)
+    c.executemany("INSERT INTO tally_accumulators (election_id, candidate_id, ciphertext, ballots) VALUES (?, ?, ?, ?)",
+                  [(election_id, cid, str(total) if total is not None else None, count)
+                   for cid, (total, count) in sums.items()])
+    return True
+
@@ -25,6 +25,10 @@ setup(
             'run-admin=admin.admin_panel_ui.main:main',
             # Run the voter UI: dispatch to the client_app voting app
             'run-voter=client_app.voting.app:main',
+            # Follow and verify an election's ledger from a running server
+            'ballotguard-follow=auditor.follower:main',
+            # Audit a downloaded proof bundle offline
+            'ballotguard-audit=auditor.cli:main',
         ]
     },
     long_description='''
@@ -0,0 +1,37 @@
+import contextlib
+import io
+import tempfile
+
+from Crypto.PublicKey import RSA
+from phe import paillier
+from server_backend.crypto import context, ovt, ledger_crypto
+
+# --- Step 1: The default context loads the persistent keys from server/keys ---
+ctx = context.get_context()
+with open(f"{context.DEFAULT_KEYS_DIR}/receipt_public.pem") as f:
+    receipt_pub = RSA.import_key(f.read())
+print("receipt key from server/keys:", ctx.receipt.public_key == receipt_pub)  # Should be True
+assert ctx.receipt.public_key == receipt_pub
+assert context.get_context() is ctx
+
+# --- Step 2: OVT and ledger signing use the context keys (no keys generated at import) ---
+token = ovt.generate_ovt()
+signature = ovt.sign_ovt(token)
+print("OVT verifies with receipt public key:", ovt.verify_ovt_with_pubkey_bytes(receipt_pub.export_key(), token, signature))  # Should be True
+assert ovt.verify_ovt_with_pubkey_bytes(receipt_pub.export_key(), token, signature)
+assert ovt.PK_server_sign == receipt_pub and ledger_crypto.PK_ledger_sign == receipt_pub
+header = ledger_crypto.create_block_header(0, "ab" * 32, "GENESIS", timestamp=1.0)
+assert ledger_crypto.verify_block_header_signature(header, ledger_crypto.sign_block_header(header))
+assert not ctx.receipt.verify(b"other", signature)
+
+# --- Step 3: The Paillier tally key decrypts like phe ---
+pub = paillier.PaillierPublicKey(ctx.paillier.n)
+print("paillier decrypt:", ctx.paillier.decrypt(pub.encrypt(7).ciphertext()))  # Should be 7
+assert ctx.paillier.decrypt(pub.encrypt(7).ciphertext()) == 7
+
+# --- Step 4: A keys dir without a receipt key falls back to an ephemeral key ---
+with tempfile.TemporaryDirectory() as empty, contextlib.redirect_stdout(io.StringIO()):
+    bare = context.CryptoContext.from_keys_dir(empty)
+print("ephemeral key:", bare.receipt.public_key != receipt_pub, bare.paillier)  # Should be True None
+assert bare.receipt.public_key != receipt_pub and bare.paillier is None
+assert bare.ovt is bare.receipt and bare.ledger is bare.receipt
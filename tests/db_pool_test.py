@@ -0,0 +1,58 @@
+import os
+import tempfile
+import threading
+
+from server_backend.db.pool import ConnectionPool
+
+db_path = os.path.join(tempfile.mkdtemp(), "pool_test.db")
+pool = ConnectionPool(db_path, max_idle=4)
+
+# --- Step 1: Pragmas are applied once per pooled connection ---
+conn = pool.connect()
+print("journal_mode:", conn.execute("PRAGMA journal_mode").fetchone()[0])  # Should be wal
+print("synchronous:", conn.execute("PRAGMA synchronous").fetchone()[0])    # Should be 1 (NORMAL)
+assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+conn.execute("CREATE TABLE IF NOT EXISTS t (k INTEGER PRIMARY KEY, v TEXT)")
+conn.commit()
+conn.close()
+
+# --- Step 2: close() returns the connection instead of reopening ---
+before = pool.stats()["opened"]
+for i in range(50):
+    conn = pool.connect()
+    conn.execute("INSERT INTO t (k, v) VALUES (?, ?)", (i, "x"))
+    conn.commit()
+    conn.close()
+print("connections opened for 50 sequential requests:", pool.stats()["opened"] - before)  # Should be 0
+assert pool.stats()["opened"] == before
+
+# --- Step 3: An uncommitted transaction is rolled back on release ---
+conn = pool.connect()
+conn.execute("INSERT INTO t (k, v) VALUES (?, ?)", (1000, "uncommitted"))
+conn.close()
+conn = pool.connect()
+leaked = conn.execute("SELECT COUNT(*) FROM t WHERE k=1000").fetchone()[0]
+conn.close()
+print("uncommitted rows visible after release:", leaked)  # Should be 0
+assert leaked == 0
+
+# --- Step 4: Concurrent workers each get their own connection ---
+def worker(base):
+    for i in range(20):
+        c = pool.connect()
+        c.execute("INSERT INTO t (k, v) VALUES (?, ?)", (base + i, "y"))
+        c.commit()
+        c.close()
+
+threads = [threading.Thread(target=worker, args=(10000 + 100 * n,)) for n in range(8)]
+for t in threads:
+    t.start()
+for t in threads:
+    t.join()
+conn = pool.connect()
+total = conn.execute("SELECT COUNT(*) FROM t WHERE k >= 10000").fetchone()[0]
+conn.close()
+print("rows written by 8 threads:", total)  # Should be 160
+assert total == 160
+print("pool stats:", pool.stats())
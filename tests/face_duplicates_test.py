@@ -0,0 +1,72 @@
+import numpy as np
+
+from server_fixture import load_server
+from server_backend.db.face_index import FaceTemplateIndex
+
+server = load_server()
+client = server.app.test_client()
+rng = np.random.default_rng(11)
+
+def face():
+    return rng.standard_normal(128) * 0.1
+
+def near(enc, distance):
+    step = rng.standard_normal(128)
+    return enc + step / np.linalg.norm(step) * distance
+
+# --- Step 1: nearest() and duplicate_pairs() agree with a brute-force search ---
+index = FaceTemplateIndex(capacity=4)
+templates = {f"V{i:03d}": face() for i in range(300)}
+templates["V900"] = near(templates["V007"], 0.2)
+templates["V901"] = near(templates["V123"], 0.35)
+for voter_id, enc in templates.items():
+    index.upsert(voter_id, enc.tolist(), "active")
+index.remove("V050")
+del templates["V050"]
+probe = near(templates["V042"], 0.1)
+brute = min(templates, key=lambda v: np.linalg.norm(templates[v] - probe))
+voter_id, distance = index.nearest(probe)
+print("nearest:", voter_id, round(distance, 2))  # Should be V042 0.1
+assert voter_id == brute == "V042" and abs(distance - 0.1) < 1e-4
+assert index.nearest(probe, exclude="V042")[0] != "V042"
+assert FaceTemplateIndex().nearest(probe) is None
+pairs = index.duplicate_pairs(0.4, block=64)
+print("pairs:", [(a, b) for a, b, _ in pairs])  # Should be V007/V900 then V123/V901
+assert [sorted(p[:2]) for p in pairs] == [["V007", "V900"], ["V123", "V901"]]
+assert abs(pairs[0][2] - 0.2) < 1e-4 and abs(index.duplicate_pairs(0.3, block=7)[0][2] - pairs[0][2]) < 1e-4
+
+# --- Step 2: In reject mode /voters/enroll refuses a face that is already enrolled, without naming its voter ---
+assert server.FACE_DUPLICATE_ACTION == "flag"
+server.FACE_DUPLICATE_ACTION = "reject"
+enc = face()
+first = client.post("/voters/enroll", json={"name": "Ada", "face_encoding": enc.tolist()})
+again = client.post("/voters/enroll", json={"name": "Ada 2", "face_encoding": near(enc, 0.05).tolist()})
+print("re-enroll:", again.status_code, again.get_json()["error"]["code"])  # Should be 409 DUPLICATE_VOTER
+assert first.status_code == 201 and again.status_code == 409
+assert first.get_json()["voter_id"] not in again.get_data(as_text=True) and "distance" not in again.get_data(as_text=True)
+assert client.post("/voters/enroll", json={"name": "Bob", "face_encoding": face().tolist()}).status_code == 201
+
+# --- Step 3: In flag mode (the default) the voter is enrolled and the pair recorded for admins only ---
+server.FACE_DUPLICATE_ACTION = "flag"
+flagged = client.post("/voters/enroll", json={"name": "Ada 3", "face_encoding": near(enc, 0.05).tolist()})
+body = flagged.get_json()
+assert flagged.status_code == 201 and body["duplicate_flagged"] and first.get_json()["voter_id"] not in flagged.get_data(as_text=True)
+recorded = client.get("/admin/face-duplicates").get_json()["duplicates"]
+print("recorded:", [(d["source"], round(d["distance"], 2)) for d in recorded])  # Should be [('enroll', 0.05)]
+assert len(recorded) == 1 and {recorded[0]["voter_a"], recorded[0]["voter_b"]} == {body["voter_id"], first.get_json()["voter_id"]}
+server.FACE_DUPLICATE_ACTION = "off"
+assert "duplicate_flagged" not in client.post("/voters/enroll", json={"name": "Ada 4", "face_encoding": enc.tolist()}).get_json()
+server.FACE_DUPLICATE_ACTION = "flag"
+
+# --- Step 4: The admin scan finds every duplicate among enrolled voters ---
+resp = client.post("/admin/face-duplicates/scan", json={})
+assert resp.status_code == 202 and resp.get_json()["state"] == "running"
+server.FACE_DUPLICATE_SCAN.join(timeout=60)
+result = client.get("/admin/face-duplicates").get_json()
+print("scan:", result["scan"]["state"], result["scan"]["pairs"], len(result["duplicates"]))  # Should be done 3 3
+assert result["scan"]["state"] == "done" and result["scan"]["rows_done"] == result["scan"]["rows_total"]
+# Ada, Ada 3 and Ada 4 pairwise: three pairs, the enroll-time one kept as it was recorded
+assert result["scan"]["pairs"] == len(result["duplicates"]) == 3 and sum(d["source"] == "enroll" for d in result["duplicates"]) == 1
+assert client.post("/admin/face-duplicates/scan", json={"tolerance": "x"}).status_code == 400
+
+print("face duplicate tests passed")
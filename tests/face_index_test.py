@@ -0,0 +1,80 @@
+import contextlib
+import io
+import json
+
+import numpy as np
+
+from server_fixture import load_server, seed_voters, ELECTION_ID
+from server_backend.db.face_index import FaceTemplateIndex
+
+server = load_server()
+client = server.app.test_client()
+rng = np.random.default_rng(7)
+
+def face():
+    return (rng.standard_normal(128) * 0.1).tolist()
+
+# --- Step 1: Rows stay dense through upserts, status changes and removals ---
+index = FaceTemplateIndex(capacity=2)
+faces = {f"V{i}": face() for i in range(5)}
+for voter_id, enc in faces.items():
+    assert index.upsert(voter_id, enc, "pending")
+assert not index.upsert("V-BAD", "[]", "active") and not index.upsert("V-BLOCKED", face(), "blocked")
+index.remove("V1")
+assert index.set_status("V4", "active") and not index.set_status("V1", "active")
+assert index.set_status("V3", "blocked") is True and "V3" not in index
+print("indexed:", len(index), index.status("V4"), index.status("V0"))  # Should be 3 active pending
+assert len(index) == 3 and index.status("V4") == "active" and index.status("V1") is None
+for voter_id in ("V0", "V2", "V4"):
+    assert np.allclose(index.template(voter_id), faces[voter_id])
+    assert index.distance(voter_id, faces[voter_id]) < 1e-6
+expected = float(np.linalg.norm(np.asarray(faces["V2"]) - np.asarray(faces["V4"])))
+assert abs(index.distance("V2", faces["V4"]) - expected) < 1e-5 and index.distance("V1", faces["V1"]) is None
+
+# --- Step 2: Enroll, approve and block keep FACE_INDEX in step with the voters table ---
+enc = face()
+voter_id = client.post("/voters/enroll", json={"name": "Ada", "face_encoding": enc}).get_json()["voter_id"]
+print("after enroll:", server.FACE_INDEX.status(voter_id))  # Should be pending
+assert server.FACE_INDEX.status(voter_id) == "pending"
+with contextlib.redirect_stdout(io.StringIO()):
+    resp = client.post("/auth/face/verify", json={"voter_id": voter_id, "election_id": ELECTION_ID, "face_encoding": enc})
+assert resp.status_code == 403 and resp.get_json()["error"]["code"] == "VOTER_INACTIVE"
+client.post(f"/voters/{voter_id}/approve", json={"election_id": ELECTION_ID})
+assert server.FACE_INDEX.status(voter_id) == "active"
+
+# --- Step 3: verify_face matches from the index without reading the template column ---
+conn = server.get_db()
+conn.execute("UPDATE voters SET face_encoding=? WHERE voter_id=?", (json.dumps([9.0] * 128), voter_id))
+conn.commit()
+conn.close()
+with contextlib.redirect_stdout(io.StringIO()):
+    same = client.post("/auth/face/verify", json={"voter_id": voter_id, "election_id": ELECTION_ID, "face_encoding": enc}).get_json()
+    other = client.post("/auth/face/verify", json={"voter_id": voter_id, "election_id": ELECTION_ID, "face_encoding": face()}).get_json()
+print("same face / other face:", same["pass"], other["pass"])  # Should be True False
+assert same["pass"] and same["confidence"] > 0.99 and not other["pass"]
+
+# --- Step 4: Blocked voters leave the index; voters inserted directly are picked up on first use ---
+client.post(f"/voters/{voter_id}/block")
+assert voter_id not in server.FACE_INDEX
+with contextlib.redirect_stdout(io.StringIO()):
+    resp = client.post("/auth/face/verify", json={"voter_id": voter_id, "election_id": ELECTION_ID, "face_encoding": enc})
+assert resp.status_code == 403
+seeded = seed_voters(server, 1)[0]
+conn = server.get_db()
+conn.execute("UPDATE voters SET face_encoding=? WHERE voter_id=?", (json.dumps(enc), seeded))
+conn.commit()
+conn.close()
+with contextlib.redirect_stdout(io.StringIO()):
+    ok = client.post("/auth/face/verify", json={"voter_id": seeded, "election_id": ELECTION_ID, "face_encoding": enc}).get_json()
+    missing = client.post("/auth/face/verify", json={"voter_id": "VOTER-NOPE", "election_id": ELECTION_ID, "face_encoding": enc})
+print("seeded voter verifies:", ok["pass"], server.FACE_INDEX.status(seeded))  # Should be True active
+assert ok["pass"] and missing.status_code == 404
+
+# --- Step 5: load() rebuilds the same index from the voters table ---
+reloaded = FaceTemplateIndex()
+conn = server.get_db()
+count = reloaded.load(conn.cursor())
+conn.close()
+assert count == len(server.FACE_INDEX) and reloaded.status(seeded) == "active" and voter_id not in reloaded
+
+print("face index tests passed")
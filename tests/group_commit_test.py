@@ -0,0 +1,86 @@
+import contextlib
+import io
+import threading
+
+from server_fixture import load_server, seed_voters, issue_ovt, vote_payload, ELECTION_ID
+
+server = load_server()
+client = server.app.test_client()
+writer = server.start_vote_writer(max_batch=32, max_wait_ms=20)
+
+# --- Step 1: Build ballots, plus a replayed vote_id and a reused OVT ---
+voters = seed_voters(server, 40)
+payloads = [vote_payload(issue_ovt(client, v)) for v in voters]
+replayed = payloads[0]
+ovt_reuse = dict(payloads[1], vote_id="second-vote-same-ovt")
+submissions = payloads + [replayed, ovt_reuse]
+
+# --- Step 2: Submit everything concurrently so duplicates share a batch ---
+results = {}
+lock = threading.Lock()
+
+def submit(payload, key):
+    resp = server.app.test_client().post("/votes", json=payload)
+    with lock:
+        results[key] = (resp.status_code, resp.get_json())
+
+threads = [threading.Thread(target=submit, args=(p, i)) for i, p in enumerate(submissions)]
+with contextlib.redirect_stdout(io.StringIO()):
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+print("writer stats:", writer.stats())
+assert writer.stats()["batches"] < len(submissions)
+
+# --- Step 3: Exactly-once on vote_id and OVT ---
+first, replay = results[0], results[len(payloads)]
+print("replay got same index:", first[1]["ledger_index"] == replay[1]["ledger_index"])  # Should be True
+assert first[0] == replay[0] == 200 and first[1]["ledger_index"] == replay[1]["ledger_index"]
+
+ovt_codes = sorted([results[1][0], results[len(payloads) + 1][0]])
+print("same OVT twice ->", ovt_codes)  # Should be [200, 409]
+assert ovt_codes == [200, 409]
+
+conn = server.get_db()
+indices = [r[0] for r in conn.execute("SELECT ledger_index FROM ledger_blocks WHERE election_id=? ORDER BY ledger_index", (ELECTION_ID,))]
+conn.close()
+print("blocks stored:", len(indices), "duplicates:", len(indices) - len(set(indices)))  # Should be 40 0
+assert indices == list(range(len(payloads)))
+
+# --- Step 4: The batched chain verifies ---
+status = client.get(f"/blockchain/verify/{ELECTION_ID}").get_json()["status"]
+print("chain status:", status)  # Should be valid
+assert status == "valid"
+
+# --- Step 5: A ballot that fails after advancing the tip leaves no gap for the rest of the batch ---
+real_advance = server.LEDGER_TIPS.advance
+failures = []
+def advance_then_fail(*args):
+    real_advance(*args)
+    if not failures:
+        failures.append(args)
+        raise RuntimeError("ballot failed after its block was chained")
+server.LEDGER_TIPS.advance = advance_then_fail
+more = [vote_payload(issue_ovt(client, v)) for v in seed_voters(server, 6)]
+codes = []
+threads = [threading.Thread(target=lambda p=p: codes.append(server.app.test_client().post("/votes", json=p).status_code)) for p in more]
+with contextlib.redirect_stdout(io.StringIO()):
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+del server.LEDGER_TIPS.advance
+conn = server.get_db()
+indices = [r[0] for r in conn.execute("SELECT ledger_index FROM ledger_blocks WHERE election_id=? ORDER BY ledger_index", (ELECTION_ID,))]
+conn.close()
+print("after a failed ballot:", sorted(codes), len(indices))  # Should be [200, 200, 200, 200, 200, 500] 45
+assert sorted(codes) == [200] * 5 + [500] and indices == list(range(len(payloads) + 5))
+assert client.get(f"/blockchain/verify/{ELECTION_ID}").get_json()["status"] == "valid"
+
+# --- Step 6: The writer's connection goes back to the pool with its synchronous setting restored ---
+server.stop_vote_writer()
+conn = server.get_db()
+print("pooled synchronous:", conn.execute("PRAGMA synchronous").fetchone()[0])  # Should be 1 (NORMAL)
+assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+conn.close()
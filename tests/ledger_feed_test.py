@@ -0,0 +1,97 @@
+import contextlib
+import io
+import os
+import threading
+import time
+
+from server_fixture import load_server, seed_voters, issue_ovt, vote_payload, ELECTION_ID, SCRATCH_DIR
+from auditor.follower import Follower, SSEParser, handle_events
+
+server = load_server()
+server.FEED_HEARTBEAT_SECONDS = 0.2
+server.FEED_SSE_MAX_SECONDS = 1.5
+client = server.app.test_client()
+url = f"/elections/{ELECTION_ID}/feed"
+replica = os.path.join(SCRATCH_DIR, "replica.db")
+
+def cast(count, delay=0):
+    time.sleep(delay)
+    voters = seed_voters(server, count)
+    with contextlib.redirect_stdout(io.StringIO()):
+        codes = [server.app.test_client().post("/votes", json=vote_payload(issue_ovt(client, v))).status_code for v in voters]
+    assert all(code == 200 for code in codes), codes
+
+# --- Step 1: A follower catches up from the feed and verifies every block ---
+cast(10)
+follower = Follower(replica, ELECTION_ID)
+page = client.get(f"{url}?after_index=-1&limit=4").get_json()
+assert [b["ledger_index"] for b in page["blocks"]] == [0, 1, 2, 3] and page["tip_index"] == 9
+while follower.last_index < page["tip_index"]:
+    page = client.get(f"{url}?after_index={follower.last_index}&limit=4").get_json()
+    assert follower.handle_page(page) == []
+print("replica:", follower.last_index, follower.invalid_indices())  # Should be 9 []
+assert follower.last_index == 9
+
+# --- Step 2: A long poll returns as soon as new blocks are committed ---
+empty_start = time.monotonic()
+assert client.get(f"{url}?after_index=9&wait=0.2").get_json()["blocks"] == []
+assert time.monotonic() - empty_start >= 0.2
+writer = threading.Thread(target=cast, args=(3, 0.3))
+writer.start()
+start = time.monotonic()
+page = client.get(f"{url}?after_index=9&wait=10").get_json()
+elapsed = time.monotonic() - start
+writer.join()
+print("long poll:", [b["ledger_index"] for b in page["blocks"]][:1], f"after {elapsed:.1f}s")  # Should be [10] well before 10s
+assert page["blocks"] and page["blocks"][0]["ledger_index"] == 10 and elapsed < 5
+assert follower.handle_page(client.get(f"{url}?after_index=9").get_json()) == [] and follower.last_index == 12
+
+# --- Step 3: Server-sent events resume after Last-Event-ID and deliver new blocks live ---
+writer = threading.Thread(target=cast, args=(4, 0.3))
+writer.start()
+response = client.get(url, headers={"Accept": "text/event-stream", "Last-Event-ID": "12"}, buffered=False)
+parser, ids = SSEParser(), []
+for chunk in response.response:
+    events = parser.feed(chunk.decode())
+    ids += [int(event_id) for event, event_id, _ in events if event == "block"]
+    assert handle_events(follower, events) == ([], False)
+writer.join()
+print("sse ids:", ids)  # Should be [13, 14, 15, 16]
+assert ids == [13, 14, 15, 16] and follower.last_index == 16
+
+# --- Step 4: A reconnect that replays blocks already held skips them; a real gap still raises ---
+response = client.get(url, headers={"Accept": "text/event-stream", "Last-Event-ID": "14"}, buffered=False)
+parser, replayed = SSEParser(), []
+for chunk in response.response:
+    events = parser.feed(chunk.decode())
+    replayed += [int(event_id) for event, event_id, _ in events if event == "block"]
+    assert handle_events(follower, events) == ([], False)
+print("replayed ids:", replayed, follower.last_index)  # Should be [15, 16] 16
+assert replayed == [15, 16] and follower.last_index == 16 and follower.invalid_indices() == []
+try:
+    follower.apply([{"ledger_index": 18}])
+    raise AssertionError("a gap in the feed was accepted")
+except ValueError:
+    pass
+
+# --- Step 5: A block altered in transit is flagged; the replica survives a restart ---
+page = client.get(f"{url}?after_index=16").get_json()
+assert page["blocks"] == []
+cast(2)
+page = client.get(f"{url}?after_index=16").get_json()
+page["blocks"][0]["vote_hash"] = "0" * 64
+print("altered block flagged:", follower.handle_page(page))  # Should be [17]
+assert follower.invalid_indices() == [17]
+follower.close()
+follower = Follower(replica, ELECTION_ID)
+assert follower.last_index == 18 and follower.invalid_indices() == [17]
+
+# --- Step 6: A reset on the server resets the replica ---
+client.post(f"/elections/{ELECTION_ID}/reset")
+page = client.get(f"{url}?after_index=18").get_json()
+follower.handle_page(page)
+print("after reset:", page["tip_index"], follower.last_index)  # Should be -1 -1
+assert page["tip_index"] == -1 and follower.last_index == -1 and follower.invalid_indices() == []
+follower.close()
+
+print("ledger feed tests passed")
@@ -0,0 +1,53 @@
+import contextlib
+import io
+
+from server_fixture import load_server, seed_voters, issue_ovt, vote_payload, ELECTION_ID
+from server_backend.blockchain.tip_cache import LedgerTipCache
+
+server = load_server()
+client = server.app.test_client()
+
+def cast(voter_id):
+    with contextlib.redirect_stdout(io.StringIO()):
+        resp = client.post("/votes", json=vote_payload(issue_ovt(client, voter_id)))
+    assert resp.status_code == 200, resp.get_json()
+    return resp.get_json()
+
+def db_tip():
+    conn = server.get_db()
+    row = conn.execute("SELECT ledger_index, hash FROM ledger_blocks WHERE election_id=? ORDER BY ledger_index DESC LIMIT 1", (ELECTION_ID,)).fetchone()
+    conn.close()
+    return (row[0], row[1]) if row else (-1, "GENESIS")
+
+# --- Step 1: The cache advances with each ingested block ---
+voters = seed_voters(server, 4)
+for v in voters[:3]:
+    ack = cast(v)
+print("cached tip:", server.LEDGER_TIPS.snapshot()[ELECTION_ID])
+assert server.LEDGER_TIPS.snapshot()[ELECTION_ID] == db_tip() == (2, ack["block_hash"])
+
+# --- Step 2: A fresh cache warmed from the DB agrees ---
+fresh = LedgerTipCache()
+conn = server.get_db()
+fresh.warm(conn)
+conn.close()
+print("warmed tip matches:", fresh.snapshot()[ELECTION_ID] == db_tip())  # Should be True
+assert fresh.snapshot()[ELECTION_ID] == db_tip()
+
+# --- Step 3: reset empties the tip and the next vote starts at GENESIS ---
+client.post(f"/elections/{ELECTION_ID}/reset")
+print("tip after reset:", server.LEDGER_TIPS.snapshot()[ELECTION_ID])  # Should be (-1, 'GENESIS')
+assert server.LEDGER_TIPS.snapshot()[ELECTION_ID] == (-1, "GENESIS")
+ack = cast(voters[3])
+conn = server.get_db()
+prev = conn.execute("SELECT prev_hash FROM ledger_blocks WHERE election_id=? AND ledger_index=0", (ELECTION_ID,)).fetchone()[0]
+conn.close()
+print("first block after reset:", ack["ledger_index"], prev)  # Should be 0 GENESIS
+assert ack["ledger_index"] == 0 and prev == "GENESIS"
+
+# --- Step 4: An invalidated tip is reloaded from the DB ---
+server.LEDGER_TIPS.invalidate(ELECTION_ID)
+conn = server.get_db()
+print("reloaded next block:", server.LEDGER_TIPS.next_block(conn.cursor(), ELECTION_ID)[0])  # Should be 1
+assert server.LEDGER_TIPS.next_block(conn.cursor(), ELECTION_ID) == (1, ack["block_hash"])
+conn.close()
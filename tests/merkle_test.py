@@ -0,0 +1,69 @@
+import base64
+import contextlib
+import io
+
+from server_fixture import load_server, seed_voters, issue_ovt, vote_payload, ELECTION_ID
+from server_backend.blockchain import merkle
+from client_app.crypto.vote_crypto import verify_inclusion_proof
+
+server = load_server()
+server.CHECKPOINT_INTERVAL = 4
+client = server.app.test_client()
+pubkey_b64 = base64.b64encode(server.RSA_PUB_PEM.encode()).decode()
+
+# --- Step 1: Every leaf of odd and even sized trees verifies, with at most ceil(log2 n) siblings ---
+for size in (1, 2, 3, 7, 8, 50):
+    leaves = [f"{i:064x}" for i in range(size)]
+    root = merkle.merkle_root(leaves)
+    for i in range(size):
+        proof = merkle.inclusion_proof(leaves, i)
+        assert merkle.verify_inclusion(leaves[i], proof, root)
+        assert len(proof) <= max(size - 1, 0).bit_length()
+print("proof length for 50 leaves:", len(merkle.inclusion_proof([f"{i:064x}" for i in range(50)], 0)))  # Should be 6
+assert not merkle.verify_inclusion("f" * 64, merkle.inclusion_proof(leaves, 0), root)
+
+# --- Step 2: Casting 6 ballots signs one checkpoint over blocks 0..3 ---
+receipts = {}
+with contextlib.redirect_stdout(io.StringIO()):
+    for voter_id in seed_voters(server, 6):
+        body = vote_payload(issue_ovt(client, voter_id))
+        resp = client.post("/votes", json=body)
+        assert resp.status_code == 200
+        receipts[body["vote_id"]] = resp.get_json()["receipt"]
+
+first_vote = next(v for v, r in receipts.items() if r["ledger_index"] == 2)
+resp = client.get(f"/elections/{ELECTION_ID}/inclusion-proof?vote_id={first_vote}")
+data = resp.get_json()
+print("checkpoint window:", data["checkpoint"]["start_index"], data["checkpoint"]["end_index"], len(data["proof"]))  # Should be 0 3 2
+assert resp.status_code == 200 and data["leaf_index"] == 2
+assert verify_inclusion_proof(receipts[first_vote], data, pubkey_b64)
+
+# --- Step 3: Blocks past the last full window are not checkpointed yet ---
+resp = client.get(f"/elections/{ELECTION_ID}/inclusion-proof?ledger_index=5")
+print("uncovered block:", resp.status_code, resp.get_json()["error"]["code"])  # Should be 409 NOT_CHECKPOINTED
+assert resp.status_code == 409
+assert client.get(f"/elections/{ELECTION_ID}/inclusion-proof?vote_id=missing").status_code == 404
+
+# --- Step 4: A forged signature or a tampered ledger fails client verification ---
+forged = dict(data, signature=base64.b64encode(b"x" * 384).decode())
+assert not verify_inclusion_proof(receipts[first_vote], forged, pubkey_b64)
+
+# Rewrite a neighbouring leaf in the same window: the signed root no longer matches
+conn = server.get_db()
+conn.execute("UPDATE ledger_blocks SET vote_hash = 'TAMPERED' || vote_hash WHERE election_id=? AND ledger_index=1", (ELECTION_ID,))
+conn.commit()
+tampered = client.get(f"/elections/{ELECTION_ID}/inclusion-proof?vote_id={first_vote}").get_json()
+print("verifies after tampering:", verify_inclusion_proof(receipts[first_vote], tampered, pubkey_b64))  # Should be False
+assert not verify_inclusion_proof(receipts[first_vote], tampered, pubkey_b64)
+conn.execute("UPDATE ledger_blocks SET vote_hash = substr(vote_hash, 9) WHERE election_id=? AND ledger_index=1", (ELECTION_ID,))
+conn.commit()
+conn.close()
+assert verify_inclusion_proof(receipts[first_vote], client.get(f"/elections/{ELECTION_ID}/inclusion-proof?vote_id={first_vote}").get_json(), pubkey_b64)
+
+# --- Step 5: Reset drops the election's checkpoints ---
+client.post(f"/elections/{ELECTION_ID}/reset")
+resp = client.get(f"/elections/{ELECTION_ID}/inclusion-proof?ledger_index=0")
+print("after reset:", resp.status_code)  # Should be 404
+assert resp.status_code == 404
+
+print("merkle inclusion proof tests passed")
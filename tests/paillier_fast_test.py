@@ -0,0 +1,47 @@
+import random
+from phe import paillier
+from server_backend.crypto import paillier_fast
+
+pub, priv = paillier.generate_paillier_keypair(n_length=512)
+backends = [False] + ([True] if paillier_fast.HAVE_GMPY2 else [])
+print("gmpy2 available:", paillier_fast.HAVE_GMPY2)
+
+for use_gmpy2 in backends:
+    key = paillier_fast.RawPaillier(pub.n, priv.p, priv.q, use_gmpy2=use_gmpy2)
+
+    # --- Step 1: Decryption matches phe, including negatives and the int range edges ---
+    values = [0, 1, -1, 42, -9999, pub.max_int, -pub.max_int] + [random.randint(-10**12, 10**12) for _ in range(20)]
+    ok = all(key.decrypt(pub.encrypt(v).ciphertext()) == priv.decrypt(pub.encrypt(v)) == v for v in values)
+    print(f"[gmpy2={use_gmpy2}] decrypt matches phe:", ok)  # Should be True
+    assert ok
+
+    # --- Step 2: Raw sums decrypt to the same total as phe's EncryptedNumber addition ---
+    votes = [random.choice([0, 1]) for _ in range(50)]
+    enc = [pub.encrypt(v) for v in votes]
+    phe_total = sum(enc[1:], enc[0])
+    raw_total = key.sum(str(e.ciphertext()) for e in enc)
+    print(f"[gmpy2={use_gmpy2}] sum:", key.decrypt(raw_total), "phe:", priv.decrypt(phe_total))  # Should be equal
+    assert key.decrypt(raw_total) == priv.decrypt(phe_total) == sum(votes)
+    assert key.decrypt(key.add(enc[0].ciphertext(), enc[1].ciphertext())) == votes[0] + votes[1]
+
+    # --- Step 3: Mock ciphertexts are skipped, empty sums are None ---
+    assert key.sum(["mock_encrypted_vote", None]) is None
+    assert key.decrypt(key.sum([enc[0].ciphertext(), "mock_encrypted_vote"])) == votes[0]
+
+    # --- Step 4: Non-zero exponents decode like phe ---
+    enc_float = pub.encrypt(2.75)
+    print(f"[gmpy2={use_gmpy2}] float:", key.decrypt(enc_float.ciphertext(), enc_float.exponent))  # Should be 2.75
+    assert key.decrypt(enc_float.ciphertext(), enc_float.exponent) == priv.decrypt(enc_float)
+
+# --- Step 5: A public-only key can add but not decrypt; mismatched factors are rejected ---
+public_only = paillier_fast.RawPaillier(pub.n)
+try:
+    public_only.decrypt(pub.encrypt(1).ciphertext())
+    assert False, "decrypt without factors should fail"
+except ValueError:
+    print("public-only decrypt rejected")  # Should print
+try:
+    paillier_fast.RawPaillier(pub.n, priv.p, priv.q + 2)
+    assert False, "mismatched factors should fail"
+except ValueError:
+    print("mismatched factors rejected")  # Should print
@@ -0,0 +1,104 @@
+import contextlib
+import io
+import json
+import os
+
+from phe import paillier
+from server_fixture import load_server, seed_voters, issue_ovt, vote_payload, ELECTION_ID, SCRATCH_DIR
+from auditor.bundle import audit
+from auditor.cli import main as audit_main
+
+server = load_server()
+server.CHECKPOINT_INTERVAL = 5
+client = server.app.test_client()
+public_key = paillier.PaillierPublicKey(server.PAILLIER_N)
+url = f"/elections/{ELECTION_ID}/proof-bundle"
+
+def export(name, edit=None):
+    lines = client.get(url).get_data().splitlines(keepends=True)
+    if edit:
+        records = [json.loads(line) for line in lines]
+        edit(records)
+        lines = [json.dumps(r).encode() + b"\n" for r in records]
+    path = os.path.join(SCRATCH_DIR, name)
+    with open(path, "wb") as f:
+        f.writelines(lines)
+    return path
+
+def section(records, name):
+    start = next(i for i, r in enumerate(records) if r.get("section") == name)
+    return records[start + 1:start + 1 + records[start]["count"]]
+
+voters = seed_voters(server, 12)
+with contextlib.redirect_stdout(io.StringIO()):
+    for i, voter_id in enumerate(voters):
+        payload = vote_payload(issue_ovt(client, voter_id), ciphertext=public_key.encrypt(1).ciphertext(),
+                               candidate_id="C1" if i < 7 else "C2")
+        assert client.post("/votes", json=payload).status_code == 200
+
+# --- Step 1: A fresh bundle audits clean, with the decrypted tally ---
+path = export("bundle.ndjson")
+report = audit(path, workers=1, chunk_size=5)
+print("audit:", report["valid"], report["claimed_tally"])  # Should be True {'C1': 7, 'C2': 5}
+assert report["valid"] and report["claimed_tally"] == {"C1": 7, "C2": 5}
+assert report["chain"]["blocks"] == 12 and report["checkpoints"] == {"count": 2, "invalid": []}
+assert report["ballots"]["count"] == 12 and report["signatures_checked"] and report["aggregate"]["ballots_match"]
+# No ballot record says whom it was cast for (its ciphertext is findable from a receipt)
+assert all(set(b) == {"ledger_index", "block_position", "ciphertext"} for b in section(
+    [json.loads(line) for line in client.get(url).get_data().splitlines()], "ballots"))
+
+# --- Step 2: The gzip download and worker processes give the same verdict ---
+gz_path = os.path.join(SCRATCH_DIR, "bundle.ndjson.gz")
+with open(gz_path, "wb") as f:
+    f.write(client.get(url, headers={"Accept-Encoding": "gzip"}).get_data())
+parallel = audit(gz_path, workers=2, chunk_size=4)
+print("parallel audit:", parallel["valid"])  # Should be True
+assert parallel["valid"] and parallel["aggregate"] == report["aggregate"] and parallel["claimed_tally"] == report["claimed_tally"] and parallel["chain"] == report["chain"]
+
+# --- Step 3: A block whose vote_hash was rewritten in the database is reported ---
+conn = server.get_db()
+original = conn.execute("SELECT vote_hash FROM ledger_blocks WHERE election_id=? AND ledger_index=3", (ELECTION_ID,)).fetchone()[0]
+conn.execute("UPDATE ledger_blocks SET vote_hash=? WHERE election_id=? AND ledger_index=3", ("0" * 64, ELECTION_ID))
+conn.commit()
+report = audit(export("tampered_block.ndjson"), workers=1)
+print("tampered block:", report["chain"]["invalid"], report["ballots"]["invalid_blocks"], report["checkpoints"]["invalid"])  # Should be [3] [3] [0]
+assert report["chain"]["invalid"] == [3] and report["ballots"]["invalid_blocks"] == [3] and report["checkpoints"]["invalid"] == [0]
+conn.execute("UPDATE ledger_blocks SET vote_hash=? WHERE election_id=? AND ledger_index=3", (original, ELECTION_ID))
+conn.commit()
+
+# --- Step 4: A swapped ciphertext breaks its block and no longer matches the encrypted sums ---
+def swap_ciphertext(records):
+    ballot = next(b for b in section(records, "ballots") if b["ledger_index"] == 8)
+    ballot["ciphertext"] = str(public_key.encrypt(1).ciphertext())
+report = audit(export("tampered_ballot.ndjson", swap_ciphertext), workers=1)
+print("swapped ballot:", report["ballots"]["invalid_blocks"], report["aggregate"]["ballots_match"])  # Should be [8] False
+assert report["ballots"]["invalid_blocks"] == [8] and not report["aggregate"]["ballots_match"] and not report["chain"]["invalid"]
+
+# --- Step 5: Candidate ballot counts that do not add up to the ballots are reported ---
+def shift(records):
+    c1, c2 = section(records, "tally")
+    c1["ballots"], c2["ballots"] = c1["ballots"] + 1, c2["ballots"] - 2
+report = audit(export("shifted_counts.ndjson", shift), workers=1)
+assert not report["aggregate"]["ballots_match"] and not report["valid"]
+
+# --- Step 6: A published count that the witness does not support is reported ---
+def inflate(records):
+    record = section(records, "tally")[0]
+    record["encoding"], record["votes"] = str(int(record["encoding"]) + 1), record["votes"] + 1
+report = audit(export("tampered_tally.ndjson", inflate), workers=1)
+print("inflated tally:", report["aggregate"]["invalid"])  # Should be ['C1']
+assert report["aggregate"]["invalid"] == ["C1"] and not report["valid"]
+
+# --- Step 7: A forged checkpoint signature is reported; the CLI exits non-zero ---
+def forge(records):
+    section(records, "checkpoints")[1]["signature"] = section(records, "checkpoints")[0]["signature"]
+forged = export("forged_checkpoint.ndjson", forge)
+assert audit(forged, workers=1)["checkpoints"]["invalid"] == [5]
+with contextlib.redirect_stdout(io.StringIO()) as out:
+    codes = audit_main([forged, "--workers", "1"]), audit_main([path, "--workers", "1"])
+print("cli exit codes:", codes)  # Should be (1, 0)
+assert codes == (1, 0) and "[FAIL] checkpoints" in out.getvalue()
+# The per-candidate split is printed as the server's claim, not as a passed check
+assert "[OK] aggregate" in out.getvalue() and "claimed by the server (not verified): C1: 7, C2: 5" in out.getvalue()
+
+print("proof bundle tests passed")
@@ -0,0 +1,58 @@
+import contextlib
+import gzip
+import io
+import json
+
+from server_fixture import load_server, seed_voters, issue_ovt, vote_payload, ELECTION_ID
+
+server = load_server()
+server.PROOF_STREAM_BLOCKS = 4
+client = server.app.test_client()
+url = f"/elections/{ELECTION_ID}/proof"
+
+def cast(count):
+    with contextlib.redirect_stdout(io.StringIO()):
+        codes = [client.post("/votes", json=vote_payload(issue_ovt(client, v))).status_code for v in seed_voters(server, count)]
+    assert all(code == 200 for code in codes), codes
+
+# --- Step 1: The whole-ledger JSON is streamed in chunks and still parses as one document ---
+cast(25)
+full = client.get(url).get_json()["blocks"]
+print("blocks:", len(full))  # Should be 25
+assert [b["ledger_index"] for b in full] == list(range(25))
+
+# --- Step 2: Cursor pagination walks the ledger with after_index / limit ---
+pages, after = [], -1
+while True:
+    page = client.get(f"{url}?after_index={after}&limit=10").get_json()
+    pages.append(len(page["blocks"]))
+    if not page["has_more"]:
+        break
+    after = page["next_after_index"]
+print("page sizes:", pages)  # Should be [10, 10, 5]
+assert pages == [10, 10, 5] and page["next_after_index"] == 24
+assert client.get(f"{url}?after_index=24").get_json()["blocks"] == []
+assert client.get(f"{url}?after_index=5&limit=2").get_json()["blocks"] == full[6:8]
+assert client.get(f"{url}?limit=0").status_code == 400 and client.get(f"{url}?after_index=x").status_code == 400
+
+# --- Step 3: NDJSON and gzip carry the same blocks ---
+ndjson = client.get(f"{url}?format=ndjson")
+assert ndjson.mimetype == "application/x-ndjson"
+assert [json.loads(line) for line in ndjson.data.splitlines()] == full
+compressed = client.get(f"{url}?format=ndjson", headers={"Accept-Encoding": "gzip"})
+print("gzip:", compressed.headers.get("Content-Encoding"), len(compressed.data), "<", len(ndjson.data))  # Should be gzip, smaller
+assert compressed.headers["Content-Encoding"] == "gzip" and gzip.decompress(compressed.data) == ndjson.data
+assert json.loads(gzip.decompress(client.get(url, headers={"Accept-Encoding": "gzip"}).data))["blocks"] == full
+
+# --- Step 4: Range requests sync only the bytes a follower does not have yet ---
+have = ndjson.data
+cast(5)
+tail = client.get(f"{url}?format=ndjson", headers={"Range": f"bytes={len(have)}-"})
+print("range:", tail.status_code, tail.headers["Content-Range"])  # Should be 206 bytes <old size>-<new size - 1>/<new size>
+assert tail.status_code == 206
+assert have + tail.data == client.get(f"{url}?format=ndjson").data
+assert len((have + tail.data).splitlines()) == 30
+past_end = client.get(f"{url}?format=ndjson", headers={"Range": f"bytes={len(have) + len(tail.data)}-"})
+assert past_end.status_code == 416
+
+print("proof export tests passed")
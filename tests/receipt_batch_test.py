@@ -0,0 +1,73 @@
+import base64
+import contextlib
+import io
+import json
+import threading
+
+from server_fixture import load_server, seed_voters, issue_ovt, vote_payload
+from client_app.crypto.signing import verify_batched_receipt, verify_signature
+from server_backend.crypto import signers
+from server_backend.crypto.receipt_batch import ReceiptBatcher
+
+server = load_server()
+client = server.app.test_client()
+rsa = server.CRYPTO.receipt
+pub_b64 = base64.b64encode(server.RSA_PUB_PEM.encode()).decode()
+fields = ("vote_id", "election_id", "ledger_index", "block_hash")
+
+def canonical(obj):
+    return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode()
+
+# --- Step 1: Receipts submitted together share one signature over their Merkle root ---
+signed = []
+def sign(signer, data):
+    signed.append(data)
+    return base64.b64encode(signer.sign(data)).decode()
+batcher = ReceiptBatcher(sign, max_batch=64, window_ms=200).start()
+payloads = [{"vote_id": f"v{i}", "election_id": "E", "ledger_index": i, "block_hash": f"{i:064x}"} for i in range(20)]
+futures = [batcher.submit(rsa, canonical(p)) for p in payloads]
+batches = [f.result(timeout=30) for f in futures]
+batcher.stop()
+print("signatures for 20 receipts:", len(signed), batcher.stats()["avg_batch"])  # Should be 1 20.0
+assert len(signed) == 1 and {b["merkle_root"] for b in batches} == {batches[0]["merkle_root"]}
+assert [b["leaf_index"] for b in batches] == list(range(20))
+assert all(verify_batched_receipt(p, b, b["sig"], pub_b64, signers.RSA_PSS_SHA256) for p, b in zip(payloads, batches))
+
+# --- Step 2: A receipt does not verify against another receipt's path or a wrong payload, quietly ---
+with contextlib.redirect_stdout(io.StringIO()) as out:
+    assert not verify_batched_receipt(payloads[0], batches[1], batches[1]["sig"], pub_b64)
+    assert not verify_batched_receipt({**payloads[3], "ledger_index": 99}, batches[3], batches[3]["sig"], pub_b64)
+    assert not verify_batched_receipt(payloads[3], {**batches[3], "size": 21}, batches[3]["sig"], pub_b64)
+    assert not verify_batched_receipt(payloads[3], {"merkle_root": batches[3]["merkle_root"]}, batches[3]["sig"], pub_b64)
+    assert not verify_batched_receipt(payloads[3], batches[3], "not base64!", pub_b64)
+print("output on rejects:", repr(out.getvalue()))  # Should be ''
+assert out.getvalue() == ""
+
+# --- Step 3: /votes issues batched receipts that verify one by one ---
+server.start_receipt_batcher(window_ms=200)
+receipts = []
+def vote(voter_id):
+    local = server.app.test_client()
+    receipts.append(local.post("/votes", json=vote_payload(issue_ovt(local, voter_id))).get_json()["receipt"])
+voters = seed_voters(server, 10)
+with contextlib.redirect_stdout(io.StringIO()):
+    threads = [threading.Thread(target=vote, args=(v,)) for v in voters]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+stats = client.get("/admin/signing-metrics").get_json()["receipt_batches"]
+print("receipts per signature:", stats["receipts"], stats["batches"])  # Should be 10 and fewer batches
+assert stats["receipts"] == 10 and stats["batches"] < 10
+ok = all(verify_batched_receipt({k: r[k] for k in fields}, r["batch"], r["sig"], pub_b64, r["sig_alg"]) for r in receipts)
+print("batched receipts verify:", ok)  # Should be True
+assert ok and all(not verify_signature({k: r[k] for k in fields}, r["sig"], pub_b64, r["sig_alg"]) for r in receipts)
+
+# --- Step 4: Without the batcher every receipt carries its own signature again ---
+server.stop_receipt_batcher()
+with contextlib.redirect_stdout(io.StringIO()):
+    receipt = client.post("/votes", json=vote_payload(issue_ovt(client, seed_voters(server, 1)[0]))).get_json()["receipt"]
+assert "batch" not in receipt and verify_signature({k: receipt[k] for k in fields}, receipt["sig"], pub_b64, receipt["sig_alg"])
+assert "receipt_batches" not in client.get("/admin/signing-metrics").get_json()
+
+print("receipt batch tests passed")
@@ -0,0 +1,79 @@
+import contextlib
+import io
+import time
+
+from phe import paillier
+from server_fixture import load_server, seed_voters, issue_ovt, vote_payload, ELECTION_ID
+
+server = load_server()
+client = server.app.test_client()
+public_key = paillier.PaillierPublicKey(server.PAILLIER_N)
+url = f"/elections/{ELECTION_ID}/results"
+
+def cast(cid):
+    voter_id = seed_voters(server, 1)[0]
+    payload = vote_payload(issue_ovt(client, voter_id), ciphertext=public_key.encrypt(1).ciphertext(), candidate_id=cid)
+    assert client.post("/votes", json=payload).status_code == 200
+
+def get(headers=None):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return client.get(url, headers=headers)
+
+def votes(resp):
+    return {r["candidate_id"]: r["votes"] for r in resp.get_json()["results"]}
+
+with contextlib.redirect_stdout(io.StringIO()):
+    cast("C1")
+    cast("C2")
+
+# --- Step 1: The first poll tallies, the second is served from the cache ---
+first = get()
+etag = first.headers["ETag"]
+hits = server.RESULTS_CACHE.hits
+second = get()
+print("same ETag on repeat poll:", second.headers["ETag"] == etag)  # Should be True
+assert second.headers["ETag"] == etag and server.RESULTS_CACHE.hits == hits + 1
+assert second.get_data() == first.get_data()
+
+# --- Step 2: If-None-Match with the current ETag returns 304 and no body ---
+not_modified = get({"If-None-Match": etag})
+print("conditional poll:", not_modified.status_code)  # Should be 304
+assert not_modified.status_code == 304 and not_modified.get_data() == b""
+
+# --- Step 3: A new ballot moves the tip, so the next poll re-tallies ---
+with contextlib.redirect_stdout(io.StringIO()):
+    cast("C1")
+after_vote = get({"If-None-Match": etag})
+print("after vote:", after_vote.status_code, votes(after_vote))  # Should be 200 with C1: 2
+assert after_vote.status_code == 200 and votes(after_vote)["C1"] == 2
+
+# --- Step 4: Approving a voter changes eligibility and invalidates the entry ---
+eligible = after_vote.get_json()["eligible_voters"]
+conn = server.get_db()
+conn.execute("INSERT INTO voters (voter_id, name, face_encoding, status, created_at) VALUES (?, ?, ?, ?, ?)",
+             ("VOTER-PENDING-1", "Pending", "[]", "pending", time.time()))
+conn.commit()
+conn.close()
+client.post("/voters/VOTER-PENDING-1/approve", json={"election_id": ELECTION_ID})
+print("eligible after approve:", get().get_json()["eligible_voters"])  # Should be one more
+assert get().get_json()["eligible_voters"] == eligible + 1
+
+# --- Step 5: A closed election's results are final and skip the tip check ---
+client.post(f"/elections/{ELECTION_ID}/close")
+closed_etag = get().headers["ETag"]
+assert server.RESULTS_CACHE.get(ELECTION_ID, None).final
+server.LEDGER_TIPS.invalidate(ELECTION_ID)
+print("closed poll served from cache:", get({"If-None-Match": closed_etag}).status_code)  # Should be 304
+assert get({"If-None-Match": closed_etag}).status_code == 304
+
+# --- Step 6: reset invalidates the final entry; recount re-tallies ---
+client.post(f"/elections/{ELECTION_ID}/reset")
+print("after reset:", votes(get()))  # Should be all zeros
+assert set(votes(get()).values()) == {0}
+print("recount without admin token:", client.get(url + "?recount=true").status_code)  # Should be 403
+assert client.get(url + "?recount=true").status_code == 403
+server.ADMIN_TOKEN = "test-admin-token"
+assert client.get(url + "?recount=true", headers={"Authorization": "Bearer wrong"}).status_code == 403
+with contextlib.redirect_stdout(io.StringIO()):
+    recount = client.get(url + "?recount=true", headers={"Authorization": "Bearer test-admin-token"})
+assert recount.status_code == 200 and set(votes(recount).values()) == {0}
@@ -8,6 +8,30 @@ TESTS = [
     "ovt_test.py",
     "paillier_test.py",
     "database_test.py",
+    "db_pool_test.py",
+    "vote_ingest_stress_test.py",
+    "ledger_tip_test.py",
+    "group_commit_test.py",
+    "tally_accumulator_test.py",
+    "tally_engine_test.py",
+    "paillier_fast_test.py",
+    "streaming_tally_test.py",
+    "results_cache_test.py",
+    "crypto_context_test.py",
+    "verify_checkpoint_test.py",
+    "merkle_test.py",
+    "verify_engine_test.py",
+    "header_codec_test.py",
+    "vote_blocks_test.py",
+    "ledger_file_test.py",
+    "proof_export_test.py",
+    "ledger_feed_test.py",
+    "proof_bundle_test.py",
+    "signers_test.py",
+    "signing_pool_test.py",
+    "receipt_batch_test.py",
+    "face_index_test.py",
+    "face_duplicates_test.py",
 ]
 
 def run_test(script):
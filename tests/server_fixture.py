@@ -0,0 +1,61 @@
+"""
+Helpers for tests that exercise server/server.py through Flask's test client.
+
+Importing this module points the server at a scratch database and ledger
+directory (via BALLOTGUARD_DB_PATH and BALLOTGUARD_LEDGER_DIR) so the tracked
+database/server_voters.db is never touched.
+"""
+
+import os
+import sys
+import tempfile
+import time
+import uuid
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+for path in (ROOT_DIR, os.path.join(ROOT_DIR, 'server')):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+SCRATCH_DIR = tempfile.mkdtemp(prefix="ballotguard-test-")
+os.environ["BALLOTGUARD_DB_PATH"] = os.path.join(SCRATCH_DIR, "server_test.db")
+os.environ["BALLOTGUARD_LEDGER_DIR"] = os.path.join(SCRATCH_DIR, "ledger")
+
+ELECTION_ID = "EL-2025-01"
+
+
+def load_server():
+    import server
+    return server
+
+
+def seed_voters(server, count, election_id=ELECTION_ID):
+    """Insert `count` active voters eligible for `election_id`; returns their ids."""
+    conn = server.get_db()
+    c = conn.cursor()
+    voter_ids = []
+    for _ in range(count):
+        voter_id = f"VOTER-{uuid.uuid4().hex[:12].upper()}"
+        c.execute("INSERT INTO voters (voter_id, name, face_encoding, status, created_at) VALUES (?, ?, ?, ?, ?)",
+                  (voter_id, "Test", "[]", "active", time.time()))
+        c.execute("INSERT OR REPLACE INTO voter_election_status (election_id, voter_id, status, voted_flag, last_auth_ts) VALUES (?, ?, ?, ?, ?)",
+                  (election_id, voter_id, "active", 0, None))
+        voter_ids.append(voter_id)
+    conn.commit()
+    conn.close()
+    return voter_ids
+
+
+def issue_ovt(client, voter_id, election_id=ELECTION_ID):
+    resp = client.post("/ovt/issue", json={"voter_id": voter_id, "election_id": election_id})
+    return resp.get_json()["ovt"]
+
+
+def vote_payload(ovt, ciphertext=None, election_id=ELECTION_ID, candidate_id="C1"):
+    return {
+        "vote_id": str(uuid.uuid4()),
+        "election_id": election_id,
+        "candidate_id": candidate_id,
+        "encrypted_vote": {"ciphertext": str(ciphertext or uuid.uuid4().int), "exponent": 0},
+        "ovt": ovt,
+    }
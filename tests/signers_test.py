@@ -0,0 +1,89 @@
+import base64
+import contextlib
+import io
+import os
+
+from Crypto.PublicKey import ECC, RSA
+
+from server_fixture import load_server, seed_voters, issue_ovt, vote_payload, ELECTION_ID, SCRATCH_DIR
+from client_app.crypto.signing import canonical_json_bytes, verify_signature
+from server_backend.crypto import context, ledger_crypto, ovt, signers
+
+def b64(pem):
+    return base64.b64encode(pem if isinstance(pem, bytes) else pem.encode()).decode()
+
+# --- Step 1: Both suites sign and verify through the same interface ---
+seed = signers.load_ed25519_seed(os.path.join(SCRATCH_DIR, "ed25519.seed"), create=True)
+assert signers.load_ed25519_seed(os.path.join(SCRATCH_DIR, "ed25519.seed")) == seed
+assert signers.load_ed25519_seed(os.path.join(SCRATCH_DIR, "missing.seed")) is None
+ed = signers.Ed25519Signer(seed)
+rsa = context.get_context().signers[signers.RSA_PSS_SHA256]
+for signer in (rsa, ed):
+    signature = signer.sign(b"payload")
+    pem = signer.public_pem()
+    print(signer.alg, "signature bytes:", len(signature), signers.alg_for_pem(pem))  # Should be 384/64 and its own alg
+    assert signer.verify(b"payload", signature) and not signer.verify(b"other", signature)
+    assert signers.alg_for_pem(pem) == signer.alg
+    assert signers.verify(signer.alg, pem, b"payload", signature)
+assert not signers.verify(signers.ED25519, rsa.public_pem(), b"payload", ed.sign(b"payload"))
+assert not signers.verify("HMAC", ed.public_pem(), b"payload", ed.sign(b"payload"))
+
+# --- Step 2: An Ed25519 context signs OVTs and ledger headers with Ed25519 ---
+ed_ctx = context.CryptoContext(signature_alg=signers.ED25519, ed25519_seed=seed)
+assert ed_ctx.receipt is ed_ctx.ovt is ed_ctx.ledger and ed_ctx.ovt.alg == signers.ED25519
+token = ovt.generate_ovt()
+assert ovt.verify_ovt_with_pubkey_bytes(ed.public_pem(), token, ed_ctx.ovt.sign(token))
+header = ledger_crypto.create_block_header(0, "ab" * 32, "GENESIS", timestamp=1.0)
+header_sig = ed_ctx.ledger.sign(ledger_crypto.canonical_json_bytes(header))
+assert ledger_crypto.verify_block_header_signature(header, header_sig, ed.public_pem())
+try:
+    context.CryptoContext(signature_alg=signers.ED25519)
+    raise AssertionError("Ed25519 suite without a seed was accepted")
+except ValueError:
+    pass
+
+# --- Step 3: The server signs OVTs and receipts in the suite the client asks for ---
+server = load_server()
+client = server.app.test_client()
+server.CRYPTO = context.CryptoContext(server.RECEIPT_RSA_PRIV_PEM, ed25519_seed=seed)
+keys = client.get("/public-key").get_json()
+print("suites on offer:", sorted(keys["public_keys"]), keys["sig_alg"])  # Should be ['Ed25519', 'RSA-PSS-SHA256'] RSA-PSS-SHA256
+assert sorted(keys["public_keys"]) == [signers.ED25519, signers.RSA_PSS_SHA256]
+voter_ed, voter_rsa = seed_voters(server, 2)
+prefer_ed = {"X-Signature-Algs": "Ed25519, RSA-PSS-SHA256"}
+issued = client.post("/ovt/issue", json={"voter_id": voter_ed, "election_id": ELECTION_ID}, headers=prefer_ed).get_json()
+print("OVT sig_alg:", issued["sig_alg"])  # Should be Ed25519
+assert issued["sig_alg"] == signers.ED25519
+assert verify_signature(issued["ovt"], issued["server_sig"], b64(keys["public_keys"][issued["sig_alg"]]), issued["sig_alg"])
+with contextlib.redirect_stdout(io.StringIO()):
+    receipt = client.post("/votes", json=vote_payload(issued["ovt"]), headers=prefer_ed).get_json()["receipt"]
+    rsa_receipt = client.post("/votes", json=vote_payload(issue_ovt(client, voter_rsa))).get_json()["receipt"]
+print("receipt sig_alg:", receipt["sig_alg"], rsa_receipt["sig_alg"])  # Should be Ed25519 RSA-PSS-SHA256
+assert (receipt["sig_alg"], rsa_receipt["sig_alg"]) == (signers.ED25519, signers.RSA_PSS_SHA256)
+
+# --- Step 4: Client verification follows the tag; a wrong tag or key fails ---
+fields = ("vote_id", "election_id", "ledger_index", "block_hash")
+for r in (receipt, rsa_receipt):
+    payload = {k: r[k] for k in fields}
+    assert verify_signature(payload, r["sig"], b64(keys["public_keys"][r["sig_alg"]]), r["sig_alg"])
+payload = {k: receipt[k] for k in fields}
+assert not verify_signature(payload, receipt["sig"], b64(keys["public_keys"][signers.RSA_PSS_SHA256]), signers.RSA_PSS_SHA256)
+assert not verify_signature(payload, receipt["sig"], b64(keys["public_keys"][signers.ED25519]), "HMAC")
+assert not verify_signature({**payload, "ledger_index": -1}, receipt["sig"], b64(keys["public_keys"][signers.ED25519]), signers.ED25519)
+assert canonical_json_bytes(payload) == ledger_crypto.canonical_json_bytes(payload)
+
+# --- Step 5: The ledger private key exports in its own suite, plain or encrypted ---
+default_ctx = context.get_context()
+print("default ledger suite:", default_ctx.ledger.alg)  # Should be RSA-PSS-SHA256
+for password in (None, b"secret"):
+    exported = RSA.import_key(ledger_crypto.export_ledger_private_key_pem(password), passphrase=password)
+    assert exported.publickey().export_key('PEM') == default_ctx.ledger.public_pem()
+context.set_context(ed_ctx)
+try:
+    pems = [ledger_crypto.export_ledger_private_key_pem(password) for password in (None, b"secret")]
+finally:
+    context.set_context(default_ctx)
+print("Ed25519 export:", pems[0].splitlines()[0], pems[1].splitlines()[0])  # Should be PRIVATE KEY and ENCRYPTED PRIVATE KEY headers
+assert ECC.import_key(pems[0]).seed == seed and ECC.import_key(pems[1], passphrase=b"secret").seed == seed
+
+print("signers tests passed")
@@ -0,0 +1,57 @@
+import base64
+import contextlib
+import io
+import threading
+
+from server_fixture import load_server, seed_voters, issue_ovt, vote_payload, ELECTION_ID
+from client_app.crypto.signing import verify_signature
+from server_backend.crypto import signers
+from server_backend.crypto.signing_pool import SigningPool
+
+# --- Step 1: Worker processes sign with the same keys as the parent ---
+rsa = signers.RSASigner.from_pem(load_server().RECEIPT_RSA_PRIV_PEM)
+ed = signers.Ed25519Signer.generate()
+pool = SigningPool([rsa, ed, rsa], workers=2).start()
+futures = [(signer, i, pool.submit(signer, f"message {i}".encode())) for i in range(6) for signer in (rsa, ed)]
+ok = all(signer.verify(f"message {i}".encode(), future.result(timeout=30)) for signer, i, future in futures)
+stats = pool.stats()
+print("pooled signatures verify:", ok, stats["completed"], stats["queue_depth"])  # Should be True 12 0
+assert ok and stats["completed"] == 12 and stats["queue_depth"] == 0 and stats["failed"] == 0
+assert stats["latency_ms"]["p50"] >= stats["sign_ms"]["p50"] > 0
+assert not pool.covers(signers.Ed25519Signer.generate())
+pool.stop()
+
+# --- Step 2: With the pool running, OVTs and receipts are signed in the workers ---
+server = load_server()
+client = server.app.test_client()
+server.start_signing_pool(workers=2)
+rsa_pub_b64 = base64.b64encode(server.RSA_PUB_PEM.encode()).decode()
+voters = seed_voters(server, 8)
+receipts = []
+
+def vote(voter_id):
+    local = server.app.test_client()
+    issued = local.post("/ovt/issue", json={"voter_id": voter_id, "election_id": ELECTION_ID}).get_json()
+    assert verify_signature(issued["ovt"], issued["server_sig"], rsa_pub_b64, issued["sig_alg"])
+    receipts.append(local.post("/votes", json=vote_payload(issued["ovt"])).get_json()["receipt"])
+
+with contextlib.redirect_stdout(io.StringIO()):
+    threads = [threading.Thread(target=vote, args=(v,)) for v in voters]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+fields = ("vote_id", "election_id", "ledger_index", "block_hash")
+assert len(receipts) == 8 and all(verify_signature({k: r[k] for k in fields}, r["sig"], rsa_pub_b64, r["sig_alg"]) for r in receipts)
+metrics = client.get("/admin/signing-metrics").get_json()
+print("metrics:", metrics["workers"], metrics["completed"], metrics["queue_depth"])  # Should be 2 16 0
+assert metrics["running"] and metrics["completed"] == 16 and metrics["queue_depth"] == 0
+
+# --- Step 3: Stopping the pool goes back to signing in the request thread ---
+server.stop_signing_pool()
+assert client.get("/admin/signing-metrics").get_json() == {"workers": 0, "running": False, "sig_alg": signers.RSA_PSS_SHA256}
+issued = client.post("/ovt/issue", json={"voter_id": seed_voters(server, 1)[0], "election_id": ELECTION_ID}).get_json()
+print("inline OVT verifies:", verify_signature(issued["ovt"], issued["server_sig"], rsa_pub_b64, issued["sig_alg"]))  # Should be True
+assert verify_signature(issued["ovt"], issued["server_sig"], rsa_pub_b64, issued["sig_alg"])
+
+print("signing pool tests passed")
@@ -0,0 +1,53 @@
+import sqlite3
+from phe import paillier
+from server_backend.crypto import tally_engine, paillier_fast
+from server_backend.db import tally_accumulator
+
+pub, priv = paillier.generate_paillier_keypair(n_length=512)
+key = paillier_fast.RawPaillier(pub.n, priv.p, priv.q)
+
+# --- Step 1: Store 60 ballots (plus a mock one) in a scratch encrypted_votes table ---
+conn = sqlite3.connect(":memory:")
+conn.execute("CREATE TABLE encrypted_votes (vote_id TEXT, election_id TEXT, candidate_id TEXT, ciphertext TEXT)")
+tally_accumulator.init_tally_table(conn.cursor())
+choices = ["C1"] * 31 + ["C2"] * 22 + ["C3"] * 7
+seeds = [str(pub.encrypt(1).ciphertext()) for _ in range(5)]
+rows = [(f"V{i}", "EL-1", cid, seeds[i % len(seeds)]) for i, cid in enumerate(choices)]
+rows.append(("V-mock", "EL-1", "C3", "mock_encrypted_vote"))
+conn.executemany("INSERT INTO encrypted_votes VALUES (?, ?, ?, ?)", rows)
+conn.commit()
+
+# --- Step 2: Streaming the cursor in small pages matches the in-memory sums ---
+groups = {}
+for _, _, cid, ciphertext in rows:
+    groups.setdefault(cid, []).append(ciphertext)
+expected = tally_engine.homomorphic_sums(groups, pub.nsquare, workers=1)
+
+cursor = conn.execute("SELECT candidate_id, ciphertext FROM encrypted_votes")
+serial = tally_engine.stream_sums(tally_engine.iter_cursor(cursor, page_size=4), pub.nsquare, workers=1)
+print("serial stream == in-memory:", {k: s for k, (s, _) in serial.items()} == expected)  # Should be True
+assert {k: s for k, (s, _) in serial.items()} == expected
+print("rows per candidate:", {k: n for k, (_, n) in serial.items()})  # Should be {'C1': 31, 'C2': 22, 'C3': 8}
+assert {k: n for k, (_, n) in serial.items()} == {"C1": 31, "C2": 22, "C3": 8}
+
+# --- Step 3: The parallel path with a bounded window gives the same sums ---
+cursor = conn.execute("SELECT candidate_id, ciphertext FROM encrypted_votes")
+parallel = tally_engine.stream_sums(tally_engine.iter_cursor(cursor, page_size=4), pub.nsquare, workers=2,
+                                    total=len(rows), chunk_size=3, max_in_flight=2, parallel_threshold=0)
+print("parallel stream == serial stream:", parallel == serial)  # Should be True
+assert parallel == serial
+
+# --- Step 4: recount streams from the DB and reports progress; replace stores it ---
+reports = []
+c = conn.cursor()
+sums, ballots = tally_accumulator.recount(c, "EL-1", pub.nsquare, page_size=8,
+                                          progress=lambda done, total: reports.append((done, total)), progress_every=20)
+assert tally_accumulator.replace(c, "EL-1", sums, ballots)
+conn.commit()
+counts = {cid: key.decrypt(s) for cid, (s, _) in tally_accumulator.load(c, "EL-1").items()}
+print("decrypted counts:", counts)  # Should be {'C1': 31, 'C2': 22, 'C3': 7}
+assert counts == {"C1": 31, "C2": 22, "C3": 7}
+print("progress reports:", reports)  # Should be [(20, 61), (40, 61), (60, 61), (61, 61)]
+assert reports == [(20, 61), (40, 61), (60, 61), (61, 61)]
+assert tally_accumulator.is_consistent(c, "EL-1")
+conn.close()
@@ -0,0 +1,95 @@
+import contextlib
+import io
+
+from phe import paillier
+from server_fixture import load_server, seed_voters, issue_ovt, vote_payload, ELECTION_ID
+from server_backend.db import tally_accumulator
+
+server = load_server()
+client = server.app.test_client()
+public_key = paillier.PaillierPublicKey(server.PAILLIER_N)
+
+# --- Step 1: Cast real Paillier ballots (3 for C1, 2 for C2) ---
+choices = ["C1", "C1", "C2", "C1", "C2"]
+voters = seed_voters(server, len(choices))
+with contextlib.redirect_stdout(io.StringIO()):
+    for voter_id, cid in zip(voters, choices):
+        ciphertext = public_key.encrypt(1).ciphertext()
+        resp = client.post("/votes", json=vote_payload(issue_ovt(client, voter_id), ciphertext=ciphertext, candidate_id=cid))
+        assert resp.status_code == 200, resp.get_json()
+
+# --- Step 2: The running sums were folded in at ingest time ---
+conn = server.get_db()
+sums = tally_accumulator.load(conn.cursor(), ELECTION_ID)
+conn.close()
+print("ballots per candidate:", {cid: n for cid, (_, n) in sums.items()})  # Should be {'C1': 3, 'C2': 2}
+assert {cid: n for cid, (_, n) in sums.items()} == {"C1": 3, "C2": 2}
+
+def tally():
+    with contextlib.redirect_stdout(io.StringIO()):
+        data = client.get(f"/elections/{ELECTION_ID}/results").get_json()
+    return {r["candidate_id"]: r["votes"] for r in data["results"]}
+
+print("results:", tally())  # Should include C1: 3, C2: 2
+assert tally()["C1"] == 3 and tally()["C2"] == 2
+
+# --- Step 3: A missing accumulator is rebuilt from encrypted_votes ---
+conn = server.get_db()
+conn.execute("DELETE FROM tally_accumulators WHERE election_id=?", (ELECTION_ID,))
+conn.commit()
+conn.close()
+print("results after rebuild:", tally())
+assert tally()["C1"] == 3 and tally()["C2"] == 2
+
+# --- Step 4: reset clears the sums ---
+client.post(f"/elections/{ELECTION_ID}/reset")
+conn = server.get_db()
+print("sums after reset:", tally_accumulator.load(conn.cursor(), ELECTION_ID))  # Should be {}
+assert tally_accumulator.load(conn.cursor(), ELECTION_ID) == {}
+conn.close()
+
+# --- Step 5: A ballot committed between the two counts does not look like drift ---
+class CommitBetweenCounts:
+    """Cursor proxy that commits one more ballot right after the first count."""
+    def __init__(self, cursor):
+        self.cursor, self.connection, self.selects = cursor, cursor.connection, 0
+    def execute(self, sql, params=()):
+        result = self.cursor.execute(sql, params)
+        if sql.startswith("SELECT"):
+            self.selects += 1
+            if self.selects == 1:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    resp = client.post("/votes", json=vote_payload(issue_ovt(client, seed_voters(server, 1)[0])))
+                assert resp.status_code == 200
+        return result
+    def fetchone(self):
+        return self.cursor.fetchone()
+
+conn = server.get_db()
+consistent = tally_accumulator.is_consistent(CommitBetweenCounts(conn.cursor()), ELECTION_ID)
+print("consistent across a concurrent vote:", consistent, conn.in_transaction)  # Should be True False
+assert consistent and not conn.in_transaction
+assert tally_accumulator.is_consistent(conn.cursor(), ELECTION_ID)
+conn.close()
+
+# --- Step 6: A recount reads a snapshot while /votes keeps committing, then swaps in only if nothing changed ---
+conn = server.get_db()
+c = conn.cursor()
+c.execute("BEGIN")
+sums, counted = server.snapshot_tally(c, ELECTION_ID, recount=True)
+with contextlib.redirect_stdout(io.StringIO()):
+    resp = client.post("/votes", json=vote_payload(issue_ovt(client, seed_voters(server, 1)[0])))
+print("vote during recount:", resp.status_code)  # Should be 200
+assert resp.status_code == 200
+conn.commit()
+conn.close()
+print("stale recount swapped in:", server.save_recount(ELECTION_ID, sums, counted))  # Should be False
+assert not server.save_recount(ELECTION_ID, sums, counted)
+conn = server.get_db()
+assert tally_accumulator.is_consistent(conn.cursor(), ELECTION_ID)
+c = conn.cursor()
+c.execute("BEGIN")
+sums, counted = server.snapshot_tally(c, ELECTION_ID, recount=True)
+conn.commit()
+conn.close()
+assert server.save_recount(ELECTION_ID, sums, counted)
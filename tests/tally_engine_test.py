@@ -0,0 +1,44 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from phe import paillier
+from server_backend.crypto import tally_engine, paillier_server
+
+pub, priv = paillier.generate_paillier_keypair(n_length=512)
+
+# --- Step 1: Encrypt a small election (with one mock ballot mixed in) ---
+votes = {"C1": [1] * 23, "C2": [1] * 17, "C3": []}
+groups = {cid: [str(pub.encrypt(v).ciphertext()) for v in ballots] for cid, ballots in votes.items()}
+groups["C2"].append("mock_encrypted_vote")
+
+# --- Step 2: Parallel tree reduction matches the serial fold ---
+serial = tally_engine.homomorphic_sums(groups, pub.nsquare, workers=1)
+parallel = tally_engine.homomorphic_sums(groups, pub.nsquare, workers=2, chunk_size=5, parallel_threshold=0)
+print("parallel == serial:", parallel == serial)  # Should be True
+assert parallel == serial
+
+counts = {cid: priv.decrypt(paillier.EncryptedNumber(pub, s)) if s is not None else 0 for cid, s in parallel.items()}
+print("decrypted counts:", counts)  # Should be {'C1': 23, 'C2': 17, 'C3': 0}
+assert counts == {"C1": 23, "C2": 17, "C3": 0}
+
+# --- Step 3: Odd numbers of partials are carried up the tree ---
+values = [pub.encrypt(1).ciphertext() for _ in range(7)]
+print("tree of 7:", priv.decrypt(paillier.EncryptedNumber(pub, tally_engine.tree_reduce(values, pub.nsquare))))  # Should be 7
+assert priv.decrypt(paillier.EncryptedNumber(pub, tally_engine.tree_reduce(values, pub.nsquare))) == 7
+
+# --- Step 4: paillier_tally gives the same answer as phe's own addition ---
+enc = [pub.encrypt(1) for _ in range(9)]
+print("paillier_tally:", paillier_server.paillier_tally(priv, enc))  # Should be 9
+assert paillier_server.paillier_tally(priv, enc) == 9
+mixed = enc + [pub.encrypt(0.5)]
+assert paillier_server.paillier_tally(priv, mixed) == 9.5
+
+# --- Step 5: A caller's pool is shared across calls and left running ---
+with ProcessPoolExecutor(max_workers=2) as pool:
+    shared = tally_engine.homomorphic_sums(groups, pub.nsquare, workers=2, chunk_size=5, parallel_threshold=0, pool=pool)
+    rows = [(cid, v) for cid, ballots in groups.items() for v in ballots]
+    streamed = tally_engine.stream_sums(rows, pub.nsquare, workers=2, total=len(rows), chunk_size=5,
+                                        parallel_threshold=0, pool=pool)
+    print("shared pool == serial:", shared == serial, {k: s for k, (s, _) in streamed.items() if s} == {k: s for k, s in serial.items() if s})  # Should be True True
+    assert shared == serial and {k: s for k, (s, _) in streamed.items() if s} == {k: s for k, s in serial.items() if s}
+    print("pool still usable:", pool.submit(sum, [1, 2]).result())  # Should be 3
+    assert pool.submit(sum, [1, 2]).result() == 3
@@ -0,0 +1,56 @@
+import contextlib
+import io
+
+from server_fixture import load_server, seed_voters, issue_ovt, vote_payload, ELECTION_ID
+from server_backend.blockchain import verify_checkpoint
+
+server = load_server()
+client = server.app.test_client()
+
+def cast(count):
+    with contextlib.redirect_stdout(io.StringIO()):
+        for voter_id in seed_voters(server, count):
+            assert client.post("/votes", json=vote_payload(issue_ovt(client, voter_id))).status_code == 200
+
+def progress(query=""):
+    return client.get(f"/elections/{ELECTION_ID}/progress{query}").get_json()["verification"]
+
+# --- Step 1: The first poll verifies the whole chain, later polls only new blocks ---
+cast(5)
+first = progress()
+print("first poll:", first["newly_verified"], first["total_blocks_verified"])  # Should be 5 5
+assert first["blockchain_intact"] and first["newly_verified"] == 5
+assert progress()["newly_verified"] == 0
+cast(2)
+after = progress()
+print("after 2 more votes:", after["newly_verified"], after["total_blocks_verified"])  # Should be 2 7
+assert after["newly_verified"] == 2 and after["total_blocks_verified"] == 7
+
+# --- Step 2: Tampering with a verified block resets the checkpoint (trigger) ---
+client.post(f"/admin/simulate-tampering/{ELECTION_ID}", json={"action": "tamper"})
+tampered = progress()
+print("after tampering:", tampered["blockchain_intact"], tampered["invalid_block"])  # Should be False and a block index
+assert not tampered["blockchain_intact"] and tampered["invalid_block"] is not None
+
+client.post(f"/admin/simulate-tampering/{ELECTION_ID}", json={"action": "untamper"})
+restored = progress()
+print("after untamper:", restored["blockchain_intact"], restored["total_blocks_verified"])  # Should be True 7
+assert restored["blockchain_intact"] and restored["total_blocks_verified"] == 7
+
+# --- Step 3: full=true re-verifies from GENESIS and yields the same prefix digest ---
+full = progress("?full=true")
+print("full re-verify:", full["mode"], full["newly_verified"])  # Should be full 7
+assert full["mode"] == "full" and full["newly_verified"] == 7
+assert full["prefix_digest"] == restored["prefix_digest"]
+
+# --- Step 4: A checkpoint computed before an invalidation is not stored ---
+conn = server.get_db()
+c = conn.cursor()
+index, block_hash, digest, epoch = verify_checkpoint.load(c, ELECTION_ID)
+c.execute("UPDATE ledger_blocks SET ts = ts WHERE election_id=? AND ledger_index=0", (ELECTION_ID,))
+conn.commit()
+print("stale store accepted:", verify_checkpoint.store(c, ELECTION_ID, index, block_hash, digest, epoch, 0.0))  # Should be False
+assert verify_checkpoint.load(c, ELECTION_ID)[0] == -1
+conn.commit()
+conn.close()
+assert progress()["newly_verified"] == 7
@@ -0,0 +1,81 @@
+import time
+
+from server_fixture import load_server, ELECTION_ID
+from server_backend.blockchain import verify_engine
+from server_backend.blockchain.blockchain import Block
+
+server = load_server()
+client = server.app.test_client()
+
+def reference_invalid(rows):
+    """The serial walk verify_blockchain used to do, kept here as the oracle."""
+    invalid, prev_hash = [], "GENESIS"
+    for ledger_index, ts, vote_hash, block_prev, block_hash in rows:
+        if block_prev != prev_hash or block_hash != Block(ledger_index, ts, vote_hash, block_prev).hash:
+            invalid.append(ledger_index)
+        prev_hash = block_hash
+    return invalid
+
+def chain(count):
+    rows, prev_hash, start = [], "GENESIS", time.time()
+    for i in range(count):
+        block = Block(i, start + i, f"{i:064x}", prev_hash)
+        rows.append((i, block.timestamp, block.vote_hash, prev_hash, block.hash))
+        prev_hash = block.hash
+    return rows
+
+def engine_invalid(rows, **kw):
+    return verify_engine.verify_rows(rows, workers=2, segment_size=7, parallel_threshold=0, **kw)["invalid_indices"]
+
+# --- Step 1: A valid chain has no invalid blocks, serially or split into segments ---
+rows = chain(60)
+print("valid chain:", engine_invalid(rows), verify_engine.verify_rows(rows)["status"])  # Should be [] valid
+assert engine_invalid(rows) == [] and reference_invalid(rows) == []
+
+# --- Step 2: Tampering on and around segment boundaries matches the serial walk ---
+tampered = list(rows)
+tampered[0] = (0, rows[0][1], "TAMPERED", "GENESIS", rows[0][4])              # content change at the start
+tampered[7] = (7, rows[7][1], rows[7][2], "X" * 64, rows[7][4])                  # broken link on a boundary
+tampered[13] = (13, rows[13][1], rows[13][2], rows[13][3], "f" * 64)            # rewritten hash at a segment end
+reblock = Block(30, rows[30][1], "REPLACED", rows[30][3])
+tampered[30] = (30, reblock.timestamp, reblock.vote_hash, reblock.previous_hash, reblock.hash)  # consistent rewrite
+del tampered[45]                                                                  # deleted block
+expected = reference_invalid(tampered)
+got = engine_invalid(tampered)
+print("tampered indices:", got)  # Should be [0, 7, 13, 14, 31, 46]
+assert got == expected == [0, 7, 13, 14, 31, 46]
+assert verify_engine.verify_rows(tampered)["invalid_indices"] == expected
+
+# --- Step 3: verify_ledger reads segments from the database and agrees with the oracle ---
+conn = server.get_db()
+conn.executemany("INSERT INTO ledger_blocks (election_id, ledger_index, ts, vote_hash, prev_hash, hash) VALUES (?, ?, ?, ?, ?, ?)",
+                 [(ELECTION_ID,) + r for r in tampered])
+conn.commit()
+conn.close()
+result = verify_engine.verify_ledger(server.DB_PATH, ELECTION_ID, workers=2, segment_size=7, parallel_threshold=0)
+print("ledger:", result["status"], result["invalid_block"], result["segments"])  # Should be tampered 46 9
+assert result["invalid_indices"] == expected and result["total_blocks"] == 59
+
+# --- Step 4: The admin verify endpoint marks the same blocks invalid ---
+body = client.get(f"/blockchain/verify/{ELECTION_ID}").get_json()
+flagged = [b["index"] for b in body["blocks"] if not b["is_valid"]]
+print("endpoint:", body["status"], flagged)  # Should be tampered [0, 7, 13, 14, 31, 46]
+assert body["status"] == "tampered" and flagged == expected
+
+# --- Step 5: A shared pool is reused across calls instead of starting one per verification ---
+from concurrent.futures import ProcessPoolExecutor
+shared = ProcessPoolExecutor(max_workers=2)
+started = []
+real_executor = verify_engine.ProcessPoolExecutor
+verify_engine.ProcessPoolExecutor = lambda *a, **kw: started.append(a) or real_executor(*a, **kw)
+for _ in range(3):
+    reused = verify_engine.verify_ledger(server.DB_PATH, ELECTION_ID, workers=2, segment_size=7, parallel_threshold=0, pool=shared)
+    assert reused["invalid_indices"] == expected
+assert engine_invalid(tampered, pool=shared) == expected
+print("pools started with a shared one:", len(started))  # Should be 0
+assert not started
+verify_engine.ProcessPoolExecutor = real_executor
+shared.shutdown()
+assert server.start_verify_pool() is server.start_verify_pool() is server.VERIFY_POOL
+
+print("verify engine tests passed")
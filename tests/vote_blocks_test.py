@@ -0,0 +1,81 @@
+import base64
+import contextlib
+import io
+import threading
+
+from server_fixture import load_server, seed_voters, issue_ovt, vote_payload, ELECTION_ID
+from client_app.crypto.signing import verify_rsa_signature
+from client_app.crypto.vote_crypto import verify_block_receipt, verify_inclusion_proof
+
+server = load_server()
+server.CHECKPOINT_INTERVAL = 2
+client = server.app.test_client()
+writer = server.start_vote_writer(max_batch=64, max_wait_ms=50, votes_per_block=8)
+pubkey_b64 = base64.b64encode(server.RSA_PUB_PEM.encode()).decode()
+
+# --- Step 1: 20 concurrent ballots (plus a replay) are packed into multi-vote blocks ---
+payloads = [vote_payload(issue_ovt(client, v)) for v in seed_voters(server, 20)]
+results = {}
+lock = threading.Lock()
+
+def submit(key, payload):
+    resp = server.app.test_client().post("/votes", json=payload)
+    with lock:
+        results[key] = (resp.status_code, resp.get_json())
+
+threads = [threading.Thread(target=submit, args=(i, p)) for i, p in enumerate(payloads + [payloads[0]])]
+with contextlib.redirect_stdout(io.StringIO()):
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+server.stop_vote_writer()
+assert all(code == 200 for code, _ in results.values()), results
+
+conn = server.get_db()
+blocks = conn.execute("SELECT COUNT(*) FROM ledger_blocks WHERE election_id=?", (ELECTION_ID,)).fetchone()[0]
+sizes = [r[0] for r in conn.execute("SELECT COUNT(*) FROM ledger_block_votes WHERE election_id=? GROUP BY ledger_index", (ELECTION_ID,))]
+conn.close()
+print("ballots / blocks:", sum(sizes), blocks)  # Should be 20 and at most a third as many blocks
+assert sum(sizes) == 20 and blocks == len(sizes) and blocks <= 20 // 3 + 1 and max(sizes) <= 8
+
+# --- Step 2: Every receipt is signed and its leaf/path leads to the signed block_hash ---
+receipts = {payloads[i]["vote_id"]: results[i][1]["receipt"] for i in range(20)}
+signed_fields = ("vote_id", "election_id", "ledger_index", "block_hash")
+ok = all(verify_rsa_signature({k: r[k] for k in signed_fields}, r["sig"], pubkey_b64) and verify_block_receipt(r)
+         for r in receipts.values())
+print("all receipts verify:", ok)  # Should be True
+assert ok
+replay = results[20][1]["receipt"]
+first = receipts[payloads[0]["vote_id"]]
+assert (replay["ledger_index"], replay["block_position"], replay["merkle_path"]) == \
+       (first["ledger_index"], first["block_position"], first["merkle_path"])
+forged = dict(first, vote_hash="0" * 64)
+assert not verify_block_receipt(forged)
+
+# --- Step 3: The chain verifies and counts every ballot in its block ---
+body = client.get(f"/blockchain/verify/{ELECTION_ID}").get_json()
+print("chain:", body["status"], sum(b["votes_in_block"] for b in body["blocks"]))  # Should be valid 20
+assert body["status"] == "valid" and body["total_blocks"] == blocks
+
+# --- Step 4: Rewriting one ballot's leaf is caught even though the headers still chain ---
+conn = server.get_db()
+conn.execute("UPDATE ledger_block_votes SET vote_hash='TAMPERED' WHERE election_id=? AND ledger_index=0 AND position=1", (ELECTION_ID,))
+conn.commit()
+body = client.get(f"/blockchain/verify/{ELECTION_ID}").get_json()
+print("after leaf rewrite:", body["status"], [b["index"] for b in body["blocks"] if not b["is_valid"]])  # Should be tampered [0]
+assert body["status"] == "tampered" and [b["index"] for b in body["blocks"] if not b["is_valid"]] == [0]
+conn.execute("UPDATE ledger_block_votes SET vote_hash=? WHERE election_id=? AND ledger_index=0 AND position=1",
+             (next(r["vote_hash"] for r in receipts.values() if r["ledger_index"] == 0 and r["block_position"] == 1), ELECTION_ID))
+conn.commit()
+conn.close()
+
+# --- Step 5: The inclusion proof chains ballot -> block root -> signed checkpoint ---
+vote_id = next(v for v, r in receipts.items() if r["ledger_index"] == 1)
+proof = client.get(f"/elections/{ELECTION_ID}/inclusion-proof?vote_id={vote_id}").get_json()
+print("inclusion proof verifies:", verify_inclusion_proof(receipts[vote_id], proof, pubkey_b64))  # Should be True
+assert proof["ballot"]["position"] == receipts[vote_id]["block_position"]
+assert verify_inclusion_proof(receipts[vote_id], proof, pubkey_b64)
+assert not verify_inclusion_proof(receipts[vote_id], dict(proof, ballot=dict(proof["ballot"], vote_hash="0" * 64)), pubkey_b64)
+
+print("multi-vote block tests passed")
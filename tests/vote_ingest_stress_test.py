@@ -0,0 +1,80 @@
+import contextlib
+import io
+import threading
+import time
+
+from server_fixture import load_server, seed_voters, issue_ovt, vote_payload, ELECTION_ID
+
+server = load_server()
+client = server.app.test_client()
+
+BOOTHS = 16
+VOTES_PER_BOOTH = 15
+
+# --- Step 1: One OVT per voter, then every booth submits concurrently ---
+voter_ids = seed_voters(server, BOOTHS * VOTES_PER_BOOTH)
+payloads = [vote_payload(issue_ovt(client, v)) for v in voter_ids]
+results = []
+lock = threading.Lock()
+
+def booth(chunk):
+    booth_client = server.app.test_client()
+    for payload in chunk:
+        resp = booth_client.post("/votes", json=payload)
+        with lock:
+            results.append((payload, resp.status_code, resp.get_json()))
+
+threads = [threading.Thread(target=booth, args=(payloads[i::BOOTHS],)) for i in range(BOOTHS)]
+with contextlib.redirect_stdout(io.StringIO()):
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+failed = [r for r in results if r[1] != 200]
+# Throughput counts accepted votes only: the pre-transaction ingest path lost
+# 25-38% of submissions to index collisions at this load.
+accepted = len(results) - len(failed)
+print(f"{len(results)} votes from {BOOTHS} booths in {elapsed:.2f}s ({accepted / elapsed:.1f} accepted votes/s)")
+print("failed submissions:", len(failed))  # Should be 0
+assert not failed, failed[:3]
+
+# --- Step 2: Ledger indices are unique and contiguous ---
+conn = server.get_db()
+indices = [r[0] for r in conn.execute("SELECT ledger_index FROM ledger_blocks WHERE election_id=? ORDER BY ledger_index", (ELECTION_ID,))]
+conn.close()
+print("duplicate ledger indices:", len(indices) - len(set(indices)))  # Should be 0
+assert indices == list(range(len(payloads)))
+
+# --- Step 3: The chain built under contention verifies ---
+verify = client.get(f"/blockchain/verify/{ELECTION_ID}").get_json()
+print("chain status:", verify["status"])  # Should be valid
+assert verify["status"] == "valid"
+
+# --- Step 4: Exactly-once: replaying a vote_id returns the original ack ---
+payload, _, first = results[0]
+with contextlib.redirect_stdout(io.StringIO()):
+    replay = client.post("/votes", json=payload)
+print("replay ledger_index matches:", replay.get_json()["ledger_index"] == first["ledger_index"])  # Should be True
+assert replay.status_code == 200 and replay.get_json()["ledger_index"] == first["ledger_index"]
+
+# --- Step 5: A spent OVT cannot be reused with a fresh vote_id ---
+reuse = dict(payload, vote_id="reused-ovt-vote")
+resp = client.post("/votes", json=reuse)
+print("reused OVT:", resp.status_code, resp.get_json()["error"]["code"])  # Should be 409 OVT_SPENT
+assert resp.status_code == 409
+
+# --- Step 6: Replaying a vote_id needs the election and OVT it was cast with ---
+other_ovt = next(p for p, _, _ in results if p is not payload)["ovt"]
+fresh_ovt = issue_ovt(client, seed_voters(server, 1)[0])
+for label, attempt in [("other election", dict(payload, election_id="OTHER-ELECTION")),
+                       ("another voter's OVT", dict(payload, ovt=other_ovt)),
+                       ("an unspent OVT", dict(payload, ovt=fresh_ovt)),
+                       ("an unknown OVT", dict(payload, ovt={"ovt_uuid": "missing"}))]:
+    resp = client.post("/votes", json=attempt)
+    print(f"replay with {label}:", resp.status_code, resp.get_json()["error"]["code"])  # Should be 409 VOTE_ID_CONFLICT
+    assert resp.status_code == 409 and resp.get_json()["error"]["code"] == "VOTE_ID_CONFLICT"
+print("receipt election:", replay.get_json()["receipt"]["election_id"])  # Should be the ballot's election
+assert replay.get_json()["receipt"]["election_id"] == ELECTION_ID